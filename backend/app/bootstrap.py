@@ -0,0 +1,120 @@
+"""
+Database bootstrap: one-shot migrate/seed command
+app.migrations의 리비전(테이블 생성, 스키마 변경, 기본 데이터)을 프로세스 간 잠금 안에서 적용합니다.
+모두 적용되어 있으면 MAX(version) 조회 한 번으로 끝납니다.
+
+배포 시 서버 시작 전에 한 번 실행:
+    python -m app.bootstrap
+적용 상태 확인:
+    python -m app.bootstrap --status
+
+서버(main.py)는 시작 시 버전만 확인합니다. 개발 환경(ENVIRONMENT != production)에서는
+필요하면 자동으로 실행하고(AUTO_MIGRATE), 운영 환경에서는 스키마가 최신이 아니면 시작하지 않습니다.
+"""
+
+import os
+import sys
+import logging
+import tempfile
+from contextlib import contextmanager
+from typing import List, Optional
+from app.database import DATABASE_URL, engine, is_sqlite_memory_url
+from app.migrations import LATEST_VERSION, current_version, status, upgrade
+
+try:
+    import fcntl
+except ImportError:  # Windows: 단일 프로세스 개발 서버만 지원
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# 스키마가 최신이 아닐 때 서버 시작 시 자동으로 적용할지 (운영 환경 기본값: false)
+AUTO_MIGRATE = os.getenv(
+    "AUTO_MIGRATE", "false" if os.getenv("ENVIRONMENT") == "production" else "true"
+).lower() in ("1", "true", "yes")
+
+
+def _default_lock_path() -> str:
+    # SQLite 파일 DB는 DB 파일 옆에, 그 외에는 임시 디렉토리에 잠금 파일 생성
+    if DATABASE_URL.startswith("sqlite:///") and not is_sqlite_memory_url(DATABASE_URL):
+        return DATABASE_URL[len("sqlite:///"):] + ".bootstrap.lock"
+    return os.path.join(tempfile.gettempdir(), "construction-api-bootstrap.lock")
+
+
+BOOTSTRAP_LOCK_PATH = os.getenv("BOOTSTRAP_LOCK_PATH") or _default_lock_path()
+
+
+@contextmanager
+def bootstrap_lock(path: str = BOOTSTRAP_LOCK_PATH):
+    """Exclusive inter-process lock held while the schema/data bootstrap runs"""
+    if fcntl is None:
+        yield
+        return
+    with open(path, "a") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def migrate() -> int:
+    """Apply pending revisions under the bootstrap lock; returns the number applied"""
+    if current_version() >= LATEST_VERSION:
+        print(f"✓ 스키마가 최신입니다 (version {LATEST_VERSION}).")
+        return 0
+
+    with bootstrap_lock():
+        # 잠금을 기다리는 동안 다른 프로세스가 적용했을 수 있으므로 upgrade가 기록을 다시 확인
+        applied_count = upgrade()
+    if applied_count:
+        # 리비전이 팀/작업자 데이터를 바꿨을 수 있으므로 실행 중인 워커의 읽기 캐시도 무효화
+        from app.read_cache import NAMESPACES, read_cache
+
+        read_cache.invalidate(*NAMESPACES)
+    print(f"✓ 스키마 준비 완료 (version {LATEST_VERSION}, 이번에 적용 {applied_count}단계).")
+    return applied_count
+
+
+def ensure_schema() -> None:
+    """
+    Server startup check: one MAX(version) query when the schema is current.
+    개발 환경(AUTO_MIGRATE)에서는 남은 단계를 적용하고, 운영 환경에서는 시작을 중단합니다.
+    """
+    if current_version() < LATEST_VERSION:
+        if not AUTO_MIGRATE:
+            raise RuntimeError(
+                "데이터베이스 스키마가 최신이 아닙니다. 서버 시작 전에 `python -m app.bootstrap`을 실행하세요."
+            )
+        try:
+            migrate()
+        except Exception as e:
+            # 운영 환경과 마찬가지로 스키마가 덜 준비된 상태로 서버를 띄우지 않음
+            logger.error("마이그레이션 실행 실패: %s", e)
+            raise
+
+    # --preload: fork 전에 풀의 연결을 닫아 워커끼리 같은 연결을 공유하지 않도록 함
+    engine.dispose()
+
+
+def print_status() -> None:
+    for version, name, applied in status():
+        mark = "✓" if applied else " "
+        print(f"[{mark}] {version} {name}")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    if "--status" in argv:
+        print_status()
+        return
+
+    try:
+        migrate()
+    except Exception as e:
+        print(f"✗ 스키마 준비 실패: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
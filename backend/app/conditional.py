@@ -0,0 +1,81 @@
+"""
+Weak ETag / conditional GET helpers for list endpoints
+공수/장비 기록 목록은 팀별 버전(team_versions, 기록을 바꾸는 트랜잭션에서 함께 증가)으로,
+팀/작업자 목록은 같은 필터의 count(id), max(updated_at)로 ETag를 만들고,
+If-None-Match가 일치하면 본문 없이 304를 반환합니다.
+
+팀 버전은 API의 쓰기 경로(DailySummaryService.refresh)에서만 올라가므로, DB를 직접 수정한 뒤에는
+TeamVersionService.bump()로 해당 팀의 버전을 올려야 클라이언트가 새 목록을 받습니다.
+"""
+
+import hashlib
+from typing import Optional
+from fastapi import Response
+from sqlalchemy import func, select
+from sqlalchemy.orm import Query
+from app.models.team_version import TeamVersion
+
+# 브라우저가 응답을 저장하되 매번 서버에 재검증하도록 (If-None-Match 자동 전송)
+CACHE_CONTROL = "private, no-cache"
+
+
+def fingerprint_statement(query, model):
+    """count(id), max(updated_at) over the same filters (ORM Query or select())"""
+    columns = (func.count(model.id), func.max(model.updated_at))
+    if isinstance(query, Query):
+        return query.with_entities(*columns).order_by(None)
+    return query.with_only_columns(*columns).order_by(None)
+
+
+def team_version_statement(team_id: Optional[str]):
+    """
+    sum(version), max(updated_at) from team_versions: one primary-key row for a team,
+    all teams (O(팀 수)) for the admin listing.
+    버전은 증가만 하므로 어느 팀이 바뀌어도 합계가 달라지고, 백업에서 복원해 버전이 되돌아가도
+    이후 변경은 updated_at이 달라 이전 ETag와 겹치지 않습니다.
+    """
+    stmt = select(func.coalesce(func.sum(TeamVersion.version), 0), func.max(TeamVersion.updated_at))
+    if team_id:
+        stmt = stmt.where(TeamVersion.team_id == team_id)
+    return stmt
+
+
+def make_etag(scope: Optional[str], *parts) -> str:
+    # scope(조회 팀)를 포함해 같은 URL을 다른 계정이 조회할 때 ETag가 겹치지 않도록 함
+    raw = "|".join([scope or "*", *(str(part) for part in parts)]).encode("utf-8")
+    return f'W/"{hashlib.sha1(raw).hexdigest()[:20]}"'
+
+
+def query_etag(query, model, scope: Optional[str]) -> str:
+    count, max_updated_at = fingerprint_statement(query, model).one()
+    return make_etag(scope, count, max_updated_at)
+
+
+def team_version_etag(db, team_id: Optional[str]) -> str:
+    """ETag for record lists scoped to team_id (None: all teams); filters only narrow the list"""
+    return make_etag(team_id, *db.execute(team_version_statement(team_id)).one())
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison as used for If-None-Match (RFC 9110)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def conditional_response(response: Response, etag: str, if_none_match: Optional[str]) -> Optional[Response]:
+    """
+    Return a 304 response when the client's copy is current.
+    Otherwise set ETag/Cache-Control on the injected response and return None.
+    """
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
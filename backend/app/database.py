@@ -1,29 +1,80 @@
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
+from app.metrics import instrument_engine, timed_pool
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./test.db")
 
+# SQLite tuning (환경 변수로 조정 가능)
+SQLITE_POOL_SIZE = int(os.getenv("SQLITE_POOL_SIZE", "5"))
+SQLITE_MAX_OVERFLOW = int(os.getenv("SQLITE_MAX_OVERFLOW", "10"))
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", "65536"))
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+
+# 비동기 DB 경로 (aiosqlite / asyncpg 필요)
+USE_ASYNC_DB = os.getenv("USE_ASYNC_DB", "false").lower() in ("1", "true", "yes")
+
+
+def is_sqlite_memory_url(url: str) -> bool:
+    return url in ("sqlite://", "sqlite:///:memory:") or "mode=memory" in url
+
+
 # Configure engine with connection pooling
 if "sqlite" in DATABASE_URL:
-    # SQLite connection pooling configuration
-    engine = create_engine(
-        DATABASE_URL,
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-        pool_pre_ping=True,
-    )
+    if is_sqlite_memory_url(DATABASE_URL):
+        # 메모리 DB는 연결마다 별도 DB가 생기므로 하나의 연결을 공유
+        engine = create_engine(
+            DATABASE_URL,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            pool_pre_ping=True,
+        )
+    else:
+        # 파일 DB: 요청 스레드마다 풀에서 연결을 빌려 쓰고, WAL 모드로 읽기/쓰기 동시 진행
+        engine = create_engine(
+            DATABASE_URL,
+            connect_args={
+                "check_same_thread": False,
+                "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000,
+            },
+            poolclass=timed_pool(QueuePool, "sync"),
+            pool_size=SQLITE_POOL_SIZE,
+            max_overflow=SQLITE_MAX_OVERFLOW,
+            pool_pre_ping=True,
+        )
+
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Apply per-connection SQLite pragmas for concurrent production use"""
+        cursor = dbapi_connection.cursor()
+        if not is_sqlite_memory_url(DATABASE_URL):
+            # WAL: 읽기가 쓰기를 막지 않음 (DB 파일에 영구 저장되는 설정)
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+        # WAL 모드에서는 NORMAL로도 커밋 내구성이 유지됨 (체크포인트 시에만 fsync)
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+        # 음수 값은 KiB 단위
+        cursor.execute(f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KB}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    event.listen(engine, "connect", set_sqlite_pragmas)
 else:
     # PostgreSQL/MySQL connection pooling
     engine = create_engine(
         DATABASE_URL,
+        poolclass=timed_pool(QueuePool, "sync"),
         pool_size=10,
         max_overflow=20,
         pool_pre_ping=True,
         pool_recycle=3600,
     )
 
+# SQL 문장별 실행 시간 / 느린 쿼리 로그 (/metrics)
+instrument_engine(engine)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -33,3 +84,77 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def to_async_url(url: str) -> str:
+    """Map a sync DATABASE_URL to its async driver (aiosqlite / asyncpg)"""
+    if url.startswith("sqlite:"):
+        return url.replace("sqlite:", "sqlite+aiosqlite:", 1)
+    if url.startswith(("postgresql:", "postgresql+psycopg2:", "postgres:")):
+        return "postgresql+asyncpg:" + url.split(":", 1)[1]
+    return url
+
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", to_async_url(DATABASE_URL))
+
+async_engine = None
+AsyncSessionLocal = None
+
+if USE_ASYNC_DB:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    if "sqlite" in ASYNC_DATABASE_URL:
+        if is_sqlite_memory_url(DATABASE_URL):
+            async_engine = create_async_engine(
+                ASYNC_DATABASE_URL,
+                connect_args={"check_same_thread": False},
+                poolclass=StaticPool,
+            )
+        else:
+            async_engine = create_async_engine(
+                ASYNC_DATABASE_URL,
+                connect_args={"timeout": SQLITE_BUSY_TIMEOUT_MS / 1000},
+                poolclass=timed_pool(AsyncAdaptedQueuePool, "async"),
+                pool_size=SQLITE_POOL_SIZE,
+                max_overflow=SQLITE_MAX_OVERFLOW,
+                pool_pre_ping=True,
+            )
+        event.listen(async_engine.sync_engine, "connect", set_sqlite_pragmas)
+    else:
+        async_engine = create_async_engine(
+            ASYNC_DATABASE_URL,
+            poolclass=timed_pool(AsyncAdaptedQueuePool, "async"),
+            pool_size=10,
+            max_overflow=20,
+            pool_pre_ping=True,
+            pool_recycle=3600,
+        )
+
+    instrument_engine(async_engine.sync_engine)
+
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine, autoflush=False, expire_on_commit=False
+    )
+
+
+def _dispose_pools_after_fork() -> None:
+    # gunicorn --preload: 부모 프로세스의 풀 연결은 닫지 않고 버리고, 워커는 새 연결을 엶
+    engine.dispose(close=False)
+    if async_engine is not None:
+        async_engine.sync_engine.dispose(close=False)
+
+
+os.register_at_fork(after_in_child=_dispose_pools_after_fork)
+
+
+async def connect_async_engine() -> None:
+    """Open one async connection so dialect initialization runs before concurrent requests (startup hook)"""
+    # 첫 연결의 dialect 초기화(first_connect)는 스레드 잠금을 잡은 채 await하므로, 같은 이벤트 루프에서
+    # 동시에 첫 연결을 시도하면 루프가 그 잠금에서 멈춤. 워커마다 요청을 받기 전에 한 번 연결해 둠
+    async with async_engine.connect():
+        pass
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,112 @@
+"""
+Streaming export helpers (NDJSON / CSV)
+서버 측 커서(yield_per)로 배치 단위로 읽어 바로 전송하므로, 내보내는 기록 수와 관계없이 메모리 사용량이 일정합니다.
+"""
+
+import os
+import io
+import csv
+import json
+from datetime import date, datetime
+from typing import Iterator, Optional
+from fastapi.responses import StreamingResponse
+from sqlalchemy import false, select
+from app.database import SessionLocal
+from app.pagination import apply_date_range
+from app.security import resolve_team_scope
+from app.serialization import orjson, response_columns
+
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+EXPORT_FORMAT_PATTERN = "^(ndjson|csv)$"
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _json_default(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _iter_partitions(stmt, batch_size: int):
+    # 응답을 모두 보낼 때까지 유지해야 하므로 요청 세션(get_db)이 아닌 별도 세션 사용
+    with SessionLocal() as session:
+        result = session.execute(stmt, execution_options={"yield_per": batch_size})
+        for partition in result.partitions():
+            yield partition
+
+
+def iter_ndjson(stmt, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[bytes]:
+    for partition in _iter_partitions(stmt, batch_size):
+        if orjson is not None:
+            yield b"".join(orjson.dumps(row._asdict()) + b"\n" for row in partition)
+        else:
+            yield "".join(
+                json.dumps(row._asdict(), ensure_ascii=False, default=_json_default) + "\n"
+                for row in partition
+            ).encode("utf-8")
+
+
+def iter_csv(stmt, columns, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # BOM: 엑셀에서 한글이 깨지지 않도록
+    buffer.write("\ufeff")
+    writer.writerow([column.key for column in columns])
+    for partition in _iter_partitions(stmt, batch_size):
+        writer.writerows([_csv_value(value) for value in row] for row in partition)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate(0)
+    if buffer.tell():
+        # 기록이 없으면 헤더만 전송
+        yield buffer.getvalue().encode("utf-8")
+
+
+def export_response(stmt, columns, export_format: str, filename: str) -> StreamingResponse:
+    """Stream stmt (a column-only select) as NDJSON or CSV"""
+    if export_format == "csv":
+        body = iter_csv(stmt, columns)
+    else:
+        body = iter_ndjson(stmt)
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format}"'},
+    )
+
+
+def export_records(
+    model,
+    schema,
+    current_user: dict,
+    team_id: Optional[str],
+    date_from: Optional[date],
+    date_to: Optional[date],
+    export_format: str,
+    filename: str,
+) -> StreamingResponse:
+    """Export records visible to current_user, oldest first, as a streaming response"""
+    allowed, scoped_team_id = resolve_team_scope(current_user, team_id)
+
+    columns = response_columns(schema, model)
+    stmt = select(*columns)
+    if not allowed:
+        # 목록 조회와 같이 권한이 없으면 빈 결과
+        stmt = stmt.where(false())
+    elif scoped_team_id:
+        stmt = stmt.where(model.team_id == scoped_team_id)
+    stmt = apply_date_range(stmt, model, date_from, date_to)
+    stmt = stmt.order_by(model.work_date, model.id)
+    return export_response(stmt, columns, export_format, filename)
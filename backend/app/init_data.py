@@ -7,7 +7,8 @@ from sqlalchemy.orm import Session
 from app.models.user import User
 from app.models.team import Team
 from app.models.worker import Worker
-from app.security import get_password_hash
+from app.read_cache import read_cache
+from app.security import get_password_hash, password_pool
 
 
 def init_default_data(db: Session):
@@ -25,15 +26,20 @@ def init_default_data(db: Session):
     db.add_all([team1, team2, team3])
     db.flush()
 
+    # 기본 계정 비밀번호 해시는 병렬로 계산
+    admin_hash, team1_hash, team2_hash, team3_hash = password_pool.map(
+        get_password_hash, ["ys7502!@02", "team1", "team2", "team3"]
+    )
+
     # Create users
     admin_user = User(
-        id="1", email="ys26k", password=get_password_hash("ys7502!@02"), role="admin"
+        id="1", email="ys26k", password=admin_hash, role="admin"
     )
 
     manager1 = User(
         id="2",
         email="team1",
-        password=get_password_hash("team1"),
+        password=team1_hash,
         role="manager",
         team_id=team1.id,
         team_name="팀1",
@@ -42,7 +48,7 @@ def init_default_data(db: Session):
     manager2 = User(
         id="3",
         email="team2",
-        password=get_password_hash("team2"),
+        password=team2_hash,
         role="manager",
         team_id=team2.id,
         team_name="팀2",
@@ -51,7 +57,7 @@ def init_default_data(db: Session):
     manager3 = User(
         id="4",
         email="team3",
-        password=get_password_hash("team3"),
+        password=team3_hash,
         role="manager",
         team_id=team3.id,
         team_name="팀3",
@@ -59,3 +65,4 @@ def init_default_data(db: Session):
 
     db.add_all([admin_user, manager1, manager2, manager3])
     db.commit()
+    read_cache.invalidate("teams")
@@ -0,0 +1,92 @@
+"""
+Central logging setup
+로그 레코드는 QueueHandler로 큐에 넣고, 별도 스레드(QueueListener)에서 stdout에 기록합니다.
+요청 처리 스레드는 stdout 쓰기를 기다리지 않습니다.
+"""
+
+import os
+import sys
+import copy
+import json
+import queue
+import atexit
+import logging
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+# json: 한 줄에 JSON 객체 하나 / text: 사람이 읽기 쉬운 형식 (로컬 개발용)
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json").lower()
+
+# LogRecord 기본 속성 (나머지는 extra={...}로 전달된 필드)
+_RESERVED_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName"}
+
+_listener = None
+
+
+class JSONFormatter(logging.Formatter):
+    """Format a record as a single-line JSON object, including extra={...} fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _QueueHandler(QueueHandler):
+    """QueueHandler that keeps extra fields and defers formatting to the listener"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 메시지 인자와 예외는 호출 시점 값으로 확정 (다른 스레드에서 포맷하므로)
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def setup_logging(level: str = LOG_LEVEL, fmt: str = LOG_FORMAT) -> None:
+    """Install the queue-based root handler (idempotent)"""
+    global _listener
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    if fmt == "text":
+        stream_handler.setFormatter(
+            logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s")
+        )
+    else:
+        stream_handler.setFormatter(JSONFormatter())
+
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_QueueHandler(log_queue))
+    root.setLevel(level)
+    os.register_at_fork(after_in_child=_restart_listener_after_fork)
+
+
+def _restart_listener_after_fork() -> None:
+    # 포크된 자식 프로세스에는 리스너 스레드가 없으므로 다시 시작
+    if _listener is not None:
+        _listener._thread = None
+        _listener.start()
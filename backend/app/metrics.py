@@ -0,0 +1,310 @@
+"""
+In-process metrics in Prometheus text format (/metrics)
+요청 지연 시간/진행 중 요청 수(ASGI 미들웨어), SQL 문장별 실행 시간과 느린 쿼리 로그(엔진 이벤트),
+연결 풀 대기 시간(풀 클래스)을 프로세스 메모리에 집계합니다. 외부 수집기 없이 curl로 확인할 수 있습니다.
+워커가 여러 개면 값은 요청을 받은 워커 프로세스 기준입니다.
+"""
+
+import os
+import time
+import logging
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+# 이 시간(ms) 이상 걸린 SQL은 문장과 파라미터를 WARNING으로 기록 (0이면 끔)
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+SLOW_QUERY_LOG_PARAMETERS = os.getenv("SLOW_QUERY_LOG_PARAMETERS", "true").lower() in ("1", "true", "yes")
+SLOW_QUERY_MAX_CHARS = 2000
+
+# Response가 charset=utf-8을 덧붙임
+CONTENT_TYPE = "text/plain; version=0.0.4"
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+STATEMENT_KINDS = ("SELECT", "INSERT", "UPDATE", "DELETE", "CREATE", "PRAGMA")
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+        self._values: Dict[LabelValues, object] = {}
+
+    def reset(self) -> None:
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in items
+        ]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket histogram; per label set stores [bucket counts..., sum, count]"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (), buckets=REQUEST_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, seconds: float, *labels: str) -> None:
+        with self._lock:
+            state = self._values.get(labels)
+            if state is None:
+                state = self._values[labels] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    state[i] += 1
+                    break
+            state[-2] += seconds
+            state[-1] += 1
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((labels, list(state)) for labels, state in self._values.items())
+        lines = self.header()
+        names = self.labelnames + ("le",)
+        for labels, state in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, state):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels(names, labels + (_format_value(bound),))} {cumulative}")
+            lines.append(f"{self.name}_bucket{_format_labels(names, labels + ('+Inf',))} {state[-1]}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(state[-2])}")
+            lines.append(f"{self.name}_count{label_text} {state[-1]}")
+        return lines
+
+
+class MetricsRegistry:
+    """Metrics plus collectors that read other components' stats at scrape time"""
+
+    def __init__(self):
+        self.metrics: List[_Metric] = []
+        self.collectors: List[Callable[[], Iterable[Tuple[str, str, str, Dict[str, str], float]]]] = []
+
+    def counter(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        return self._add(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Gauge:
+        return self._add(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (), buckets=REQUEST_BUCKETS) -> Histogram:
+        return self._add(Histogram(name, documentation, labelnames, buckets))
+
+    def _add(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector) -> None:
+        """collector() yields (name, type, help, labels, value) samples"""
+        self.collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+
+        described = set()
+        for collector in self.collectors:
+            try:
+                samples = list(collector())
+            except Exception:
+                logger.warning("metrics collector failed", exc_info=True)
+                continue
+            for name, kind, documentation, labels, value in samples:
+                if name not in described:
+                    described.add(name)
+                    lines.append(f"# HELP {name} {documentation}")
+                    lines.append(f"# TYPE {name} {kind}")
+                lines.append(f"{name}{_format_labels(labels.keys(), labels.values())} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _after_fork_in_child(self) -> None:
+        # 워커는 자기 프로세스 값만 집계 (preload된 부모의 값과 잠금 상태를 버림)
+        for metric in self.metrics:
+            metric.reset()
+
+
+registry = MetricsRegistry()
+os.register_at_fork(after_in_child=registry._after_fork_in_child)
+
+http_requests_total = registry.counter(
+    "http_requests_total", "HTTP requests by route template and status", ("method", "route", "status")
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency until the response is fully sent", ("method", "route")
+)
+http_requests_in_progress = registry.gauge(
+    "http_requests_in_progress", "HTTP requests currently being handled", ("method",)
+)
+db_statement_duration_seconds = registry.histogram(
+    "db_statement_duration_seconds", "SQL statement execution time by statement kind", ("kind",), DB_BUCKETS
+)
+db_statement_errors_total = registry.counter(
+    "db_statement_errors_total", "SQL statements that raised an error", ("kind",)
+)
+db_slow_statements_total = registry.counter(
+    "db_slow_statements_total", "SQL statements slower than SLOW_QUERY_MS", ("kind",)
+)
+db_pool_checkout_wait_seconds = registry.histogram(
+    "db_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection (including new connects)",
+    ("pool",), DB_BUCKETS,
+)
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording request count, latency and in-flight requests.
+    경로 라벨은 실제 URL이 아니라 라우트 템플릿(/work-records/{record_id})을 사용합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = {"code": 500}
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        http_requests_in_progress.inc(method)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            http_requests_in_progress.dec(method)
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            http_request_duration_seconds.observe(elapsed, method, route_path)
+            http_requests_total.inc(method, route_path, str(status["code"]))
+
+
+def statement_kind(statement: str) -> str:
+    words = statement.lstrip().split(None, 1)
+    kind = words[0].upper() if words else ""
+    return kind if kind in STATEMENT_KINDS else "OTHER"
+
+
+def _truncate(text: str) -> str:
+    return text if len(text) <= SLOW_QUERY_MAX_CHARS else text[:SLOW_QUERY_MAX_CHARS] + "...(truncated)"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("metrics_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("metrics_query_start")
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    kind = statement_kind(statement)
+    db_statement_duration_seconds.observe(elapsed, kind)
+    if SLOW_QUERY_MS > 0 and elapsed * 1000 >= SLOW_QUERY_MS:
+        db_slow_statements_total.inc(kind)
+        extra = {"duration_ms": round(elapsed * 1000, 2), "statement": _truncate(statement)}
+        if SLOW_QUERY_LOG_PARAMETERS:
+            extra["parameters"] = _truncate(repr(parameters))
+        if executemany:
+            extra["executemany"] = True
+        logger.warning("slow query", extra=extra)
+
+
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    starts = conn.info.get("metrics_query_start") if conn is not None else None
+    if starts:
+        starts.pop()
+    if exception_context.statement:
+        db_statement_errors_total.inc(statement_kind(exception_context.statement))
+
+
+def instrument_engine(sync_engine) -> None:
+    """Attach statement timing / slow query events to a (sync) Engine"""
+    if not METRICS_ENABLED:
+        return
+    from sqlalchemy import event
+
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+
+
+def timed_pool(pool_class, label: Optional[str] = None):
+    """
+    Pool subclass that records checkout wait time.
+    engine.dispose()가 같은 클래스로 풀을 다시 만들기 때문에 인스턴스가 아닌 클래스를 확장합니다.
+    """
+    if not METRICS_ENABLED:
+        return pool_class
+    pool_label = label or pool_class.__name__
+
+    class TimedPool(pool_class):
+        def _do_get(self):
+            started = time.perf_counter()
+            try:
+                return super()._do_get()
+            finally:
+                db_pool_checkout_wait_seconds.observe(time.perf_counter() - started, pool_label)
+
+    TimedPool.__name__ = f"Timed{pool_class.__name__}"
+    TimedPool.__qualname__ = TimedPool.__name__
+    # SQLAlchemy는 풀 로거 이름을 클래스의 모듈 경로로 만듦 -> sqlalchemy.pool.* 아래에 두어야
+    # 기본 WARN 레벨이 적용되어 dispose()/포크마다 "Pool recreating" INFO 로그가 남지 않음
+    TimedPool.__module__ = pool_class.__module__
+    return TimedPool
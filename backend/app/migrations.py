@@ -1,11 +1,195 @@
 """
-데이터베이스 마이그레이션 스크립트
-기존 테이블에 notes 컬럼을 추가하고, equipment_records 테이블에서 site_name 컬럼을 제거합니다.
+데이터베이스 마이그레이션 (버전 관리)
+번호가 붙은 리비전을 순서대로 적용하고, 적용한 리비전은 schema_version 테이블에 기록합니다.
+컬럼/테이블 확인은 SQLAlchemy inspector를 사용하므로 SQLite와 PostgreSQL 모두에서 동작합니다.
+
+- 1: 테이블 생성
+- 2: work_records.notes 컬럼 추가
+- 3: equipment_records.site_name 컬럼 제거
+  PostgreSQL은 DROP COLUMN(메타데이터만 변경), SQLite는 배치 복사로 테이블을 다시 만듭니다.
+  배치 복사 중에는 트리거가 기존 테이블의 변경을 새 테이블에 반영하므로, 배치마다 짧게 커밋하며
+  테이블 전체를 잠그는 시간은 마지막 교체(이름 변경) 순간뿐입니다.
+- 4: work_records.site_name 컬럼 확인
+- 5: 조회 패턴에 맞는 복합 인덱스 (PostgreSQL은 CREATE INDEX CONCURRENTLY)
+- 6: 팀/작업일별 집계 테이블(daily_team_summary) 채우기
+- 7: 기본 사용자/팀 생성
+- 8: 팀별 기록 변경 카운터(team_versions) 생성 (목록 ETag)
+
+새 리비전은 REVISIONS 끝에 다음 번호로 추가합니다. 적용된 리비전의 번호와 내용은 바꾸지 않습니다.
+
+남은 리비전 적용 / 적용 상태 확인:
+    python -m app.migrations
+    python -m app.migrations --status
+일별 집계 전체 재계산:
+    python -m app.migrations --rebuild-daily-summary
 """
 
 import os
-from sqlalchemy import text
+import sys
+from collections import namedtuple
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import func, inspect, insert, select, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.schema import CreateTable
 from app.database import engine, SessionLocal
+from app.models.user import Base as UserBase
+from app.models.team import Base as TeamBase
+from app.models.worker import Base as WorkerBase
+from app.models.work_record import Base as WorkRecordBase
+from app.models.equipment_record import Base as EquipmentRecordBase, EquipmentRecord
+from app.models.daily_team_summary import Base as DailyTeamSummaryBase
+from app.models.team_version import Base as TeamVersionBase
+from app.models.schema_version import Base as SchemaVersionBase, SchemaVersion
+
+# 테이블 재작성 시 한 번에 복사하는 행 수 (배치마다 커밋)
+MIGRATION_BATCH_SIZE = int(os.getenv("MIGRATION_BATCH_SIZE", "5000"))
+
+BASES = (
+    UserBase,
+    TeamBase,
+    WorkerBase,
+    WorkRecordBase,
+    EquipmentRecordBase,
+    DailyTeamSummaryBase,
+    TeamVersionBase,
+)
+
+Revision = namedtuple("Revision", ["version", "name", "upgrade"])
+
+
+# ---------------------------------------------------------------------------
+# 공통 도구
+# ---------------------------------------------------------------------------
+
+def _columns(conn, table_name: str) -> List[str]:
+    """Column names of table_name, or [] if the table does not exist"""
+    inspector = inspect(conn)
+    if not inspector.has_table(table_name):
+        return []
+    return [column["name"] for column in inspector.get_columns(table_name)]
+
+
+def add_column_if_missing(table_name: str, column_name: str, ddl_type: str) -> None:
+    """ALTER TABLE ADD COLUMN (SQLite/PostgreSQL 모두 기존 행을 다시 쓰지 않음)"""
+    with engine.begin() as conn:
+        columns = _columns(conn, table_name)
+        if not columns:
+            print(f"✓ {table_name} 테이블이 존재하지 않습니다. 마이그레이션 불필요.")
+            return
+        if column_name in columns:
+            print(f"✓ {table_name} 테이블에 {column_name} 컬럼이 이미 존재합니다.")
+            return
+        print(f"{table_name} 테이블에 {column_name} 컬럼을 추가합니다...")
+        conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {ddl_type}"))
+    print(f"✓ {column_name} 컬럼이 성공적으로 추가되었습니다.")
+
+
+def rebuild_sqlite_table(table, batch_size: int = MIGRATION_BATCH_SIZE) -> int:
+    """
+    Rebuild table (SQLite) to match its model definition with batched copies.
+    1) {table}_new 생성  2) 기존 테이블 변경을 새 테이블로 반영하는 트리거 생성
+    3) id 순서로 batch_size씩 복사하며 배치마다 커밋  4) 한 트랜잭션에서 트리거 제거, 테이블 교체, 인덱스 생성
+    복사된 행 수를 반환합니다.
+    """
+    name = table.name
+    new_name = f"{name}_new"
+    new_table = table.to_metadata(type(table.metadata)(), name=new_name)
+
+    with engine.begin() as conn:
+        # pysqlite는 DDL 앞에 BEGIN을 자동으로 보내지 않으므로 직접 시작 (트리거 생성까지 원자적으로)
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+        old_columns = set(_columns(conn, name))
+        copy_columns = [column.name for column in table.columns if column.name in old_columns]
+        column_list = ", ".join(copy_columns)
+        new_values = ", ".join(f"NEW.{column}" for column in copy_columns)
+
+        # 이전 실행이 중단되었으면 처음부터 다시
+        conn.execute(text(f"DROP TABLE IF EXISTS {new_name}"))
+        conn.execute(CreateTable(new_table))
+        conn.execute(text(
+            f"CREATE TRIGGER {name}_copy_insert AFTER INSERT ON {name} BEGIN "
+            f"INSERT OR REPLACE INTO {new_name} ({column_list}) VALUES ({new_values}); END"
+        ))
+        conn.execute(text(
+            f"CREATE TRIGGER {name}_copy_update AFTER UPDATE ON {name} BEGIN "
+            f"DELETE FROM {new_name} WHERE id = OLD.id; "
+            f"INSERT OR REPLACE INTO {new_name} ({column_list}) VALUES ({new_values}); END"
+        ))
+        conn.execute(text(
+            f"CREATE TRIGGER {name}_copy_delete AFTER DELETE ON {name} BEGIN "
+            f"DELETE FROM {new_name} WHERE id = OLD.id; END"
+        ))
+        total = conn.execute(text(f"SELECT COUNT(*) FROM {name}")).scalar()
+
+    # 트리거가 이미 옮긴 행(복사 도중 추가/수정된 행)은 더 최신이므로 INSERT OR IGNORE
+    copied = 0
+    last_id = ""
+    report_every = max(total // 10, batch_size)
+    next_report = report_every
+    while True:
+        with engine.begin() as conn:
+            batch_last_id = conn.execute(
+                text(f"SELECT MAX(id) FROM (SELECT id FROM {name} WHERE id > :last_id ORDER BY id LIMIT :limit)"),
+                {"last_id": last_id, "limit": batch_size},
+            ).scalar()
+            if batch_last_id is None:
+                break
+            result = conn.execute(
+                text(
+                    f"INSERT OR IGNORE INTO {new_name} ({column_list}) "
+                    f"SELECT {column_list} FROM {name} WHERE id > :last_id AND id <= :batch_last_id"
+                ),
+                {"last_id": last_id, "batch_last_id": batch_last_id},
+            )
+        copied += max(result.rowcount, 0)
+        last_id = batch_last_id
+        if copied >= next_report:
+            print(f"  {name}: {copied:,} / {total:,}행 복사")
+            next_report += report_every
+
+    # 교체는 한 트랜잭션: 다른 연결은 기존 테이블을 보거나(읽기) 교체가 끝날 때까지 대기(쓰기)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+        for suffix in ("insert", "update", "delete"):
+            conn.execute(text(f"DROP TRIGGER IF EXISTS {name}_copy_{suffix}"))
+        conn.execute(text(f"DROP TABLE {name}"))
+        conn.execute(text(f"ALTER TABLE {new_name} RENAME TO {name}"))
+        # UNIQUE 인덱스는 중복 병합이 필요하므로 해당 리비전(5)에서 생성
+        for index in table.indexes:
+            if not index.unique:
+                index.create(conn, checkfirst=True)
+    return copied
+
+
+def create_index(name: str, table_name: str, columns: str, unique: bool = False) -> None:
+    """CREATE INDEX IF NOT EXISTS; PostgreSQL에서는 CONCURRENTLY로 쓰기를 막지 않음"""
+    unique_sql = "UNIQUE " if unique else ""
+    if engine.dialect.name == "postgresql":
+        # CONCURRENTLY는 트랜잭션 밖에서만 실행 가능
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            try:
+                conn.execute(text(
+                    f"CREATE {unique_sql}INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table_name} ({columns})"
+                ))
+            except DBAPIError:
+                # 실패한 CONCURRENTLY 인덱스는 INVALID 상태로 남으므로 제거 후 다시 시도할 수 있게 함
+                conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+                raise
+        return
+    with engine.begin() as conn:
+        conn.execute(text(f"CREATE {unique_sql}INDEX IF NOT EXISTS {name} ON {table_name} ({columns})"))
+
+
+# ---------------------------------------------------------------------------
+# 리비전
+# ---------------------------------------------------------------------------
+
+def create_tables():
+    """모델 정의로 없는 테이블을 생성합니다."""
+    for base in BASES:
+        base.metadata.create_all(bind=engine)
+    print("✓ 테이블이 준비되었습니다.")
 
 
 def migrate_add_notes_column():
@@ -13,21 +197,90 @@ def migrate_add_notes_column():
     work_records 테이블에 notes 컬럼을 추가합니다.
     이미 컬럼이 존재하면 아무 작업도 하지 않습니다.
     """
+    add_column_if_missing("work_records", "notes", "VARCHAR(1000)")
+
+
+def migrate_remove_site_name_from_equipment():
+    """
+    equipment_records 테이블에서 site_name 컬럼을 제거합니다.
+    PostgreSQL 등은 DROP COLUMN을 사용하고(테이블을 다시 쓰지 않음),
+    SQLite는 배치 복사로 새 테이블을 만든 뒤 교체합니다.
+    """
+    with engine.connect() as conn:
+        columns = _columns(conn, "equipment_records")
+    if not columns:
+        print("✓ equipment_records 테이블이 존재하지 않습니다. 마이그레이션 불필요.")
+        return
+    if "site_name" not in columns:
+        print("✓ equipment_records 테이블에 site_name 컬럼이 없습니다. 마이그레이션 불필요.")
+        return
+
+    print("equipment_records 테이블에서 site_name 컬럼을 제거합니다...")
+    if engine.dialect.name == "sqlite":
+        copied = rebuild_sqlite_table(EquipmentRecord.__table__)
+        print(f"✓ site_name 컬럼이 성공적으로 제거되었습니다 ({copied:,}행 복사).")
+        return
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE equipment_records DROP COLUMN site_name"))
+    print("✓ site_name 컬럼이 성공적으로 제거되었습니다.")
+
+
+def migrate_ensure_site_name_in_work_records():
+    """
+    work_records 테이블에 site_name 컬럼이 있는지 확인하고, 없으면 추가합니다.
+    작업자 기록의 현장명은 필요하므로 유지해야 합니다.
+    """
+    add_column_if_missing("work_records", "site_name", "VARCHAR(255) DEFAULT ''")
+
+
+def migrate_add_composite_indexes():
+    """
+    실제 조회 패턴(team_id로 필터 후 work_date로 필터/정렬)에 맞는 복합 인덱스를 추가합니다.
+    - work_records: (team_id, work_date)
+    - equipment_records: UNIQUE (team_id, work_date, equipment_type)
+      선행 컬럼 (team_id, work_date)이 팀별 날짜 조회에도 사용되므로 별도 인덱스는 만들지 않습니다.
+    UNIQUE 인덱스 생성 전에 중복된 장비 기록은 수량을 합산하여 하나로 병합합니다.
+    """
+    create_index("ix_work_records_team_id_work_date", "work_records", "team_id, work_date")
+
     db = SessionLocal()
     try:
-        # SQLite에서 컬럼 존재 여부 확인
-        result = db.execute(text("PRAGMA table_info(work_records)"))
-        columns = [row[1] for row in result.fetchall()]
-        
-        if 'notes' not in columns:
-            print("work_records 테이블에 notes 컬럼을 추가합니다...")
-            # SQLite는 ALTER TABLE ADD COLUMN만 지원
-            db.execute(text("ALTER TABLE work_records ADD COLUMN notes VARCHAR(1000)"))
-            db.commit()
-            print("✓ notes 컬럼이 성공적으로 추가되었습니다.")
-        else:
-            print("✓ notes 컬럼이 이미 존재합니다.")
-            
+        # 중복 장비 기록 병합: 그룹별 가장 작은 id에 수량 합계를 기록하고 나머지는 삭제
+        duplicate_groups = db.execute(text("""
+            SELECT COUNT(*) FROM (
+                SELECT team_id FROM equipment_records
+                WHERE team_id IS NOT NULL AND work_date IS NOT NULL AND equipment_type IS NOT NULL
+                GROUP BY team_id, work_date, equipment_type
+                HAVING COUNT(*) > 1
+            ) duplicates
+        """)).scalar()
+        if duplicate_groups:
+            print(f"중복된 장비 기록 {duplicate_groups}건을 병합합니다...")
+            db.execute(text("""
+                UPDATE equipment_records
+                SET quantity = (
+                    SELECT SUM(e2.quantity) FROM equipment_records e2
+                    WHERE e2.team_id = equipment_records.team_id
+                      AND e2.work_date = equipment_records.work_date
+                      AND e2.equipment_type = equipment_records.equipment_type
+                )
+                WHERE id IN (
+                    SELECT MIN(id) FROM equipment_records
+                    WHERE team_id IS NOT NULL AND work_date IS NOT NULL AND equipment_type IS NOT NULL
+                    GROUP BY team_id, work_date, equipment_type
+                    HAVING COUNT(*) > 1
+                )
+            """))
+            db.execute(text("""
+                DELETE FROM equipment_records
+                WHERE team_id IS NOT NULL AND work_date IS NOT NULL AND equipment_type IS NOT NULL
+                  AND id NOT IN (
+                    SELECT MIN(id) FROM equipment_records
+                    WHERE team_id IS NOT NULL AND work_date IS NOT NULL AND equipment_type IS NOT NULL
+                    GROUP BY team_id, work_date, equipment_type
+                )
+            """))
+        db.commit()
     except Exception as e:
         db.rollback()
         print(f"✗ 마이그레이션 중 오류 발생: {e}")
@@ -35,66 +288,29 @@ def migrate_add_notes_column():
     finally:
         db.close()
 
+    create_index(
+        "uq_equipment_records_team_id_work_date_equipment_type",
+        "equipment_records",
+        "team_id, work_date, equipment_type",
+        unique=True,
+    )
+    print("✓ 복합 인덱스가 준비되었습니다.")
 
-def migrate_remove_site_name_from_equipment():
+
+def rebuild_daily_summary():
     """
-    equipment_records 테이블에서 site_name 컬럼을 제거합니다.
-    SQLite는 ALTER TABLE DROP COLUMN을 직접 지원하지 않으므로,
-    새 테이블을 생성하고 데이터를 복사한 후 기존 테이블을 교체합니다.
+    daily_team_summary 테이블을 원본 기록에서 전체 재계산합니다.
+    집계가 원본과 어긋났을 때나 기존 데이터베이스를 채울 때 사용합니다.
     """
+    from app.services import DailySummaryService
+
+    DailyTeamSummaryBase.metadata.create_all(bind=engine)
     db = SessionLocal()
     try:
-        # 테이블 존재 여부 확인
-        result = db.execute(text("SELECT name FROM sqlite_master WHERE type='table' AND name='equipment_records'"))
-        if not result.fetchone():
-            print("✓ equipment_records 테이블이 존재하지 않습니다. 마이그레이션 불필요.")
-            return
-        
-        # 컬럼 존재 여부 확인
-        result = db.execute(text("PRAGMA table_info(equipment_records)"))
-        columns = [row[1] for row in result.fetchall()]
-        
-        if 'site_name' not in columns:
-            print("✓ equipment_records 테이블에 site_name 컬럼이 없습니다. 마이그레이션 불필요.")
-            return
-        
-        print("equipment_records 테이블에서 site_name 컬럼을 제거합니다...")
-        
-        # 새 테이블 생성 (site_name 없이)
-        db.execute(text("""
-            CREATE TABLE equipment_records_new (
-                id VARCHAR(36) PRIMARY KEY,
-                work_date DATE,
-                equipment_type VARCHAR(50),
-                quantity INTEGER,
-                team_id VARCHAR(36),
-                created_by VARCHAR(255),
-                created_at DATETIME,
-                updated_at DATETIME
-            )
-        """))
-        
-        # 데이터 복사 (site_name 제외)
-        db.execute(text("""
-            INSERT INTO equipment_records_new 
-            (id, work_date, equipment_type, quantity, team_id, created_by, created_at, updated_at)
-            SELECT id, work_date, equipment_type, quantity, team_id, created_by, created_at, updated_at
-            FROM equipment_records
-        """))
-        
-        # 기존 테이블 삭제
-        db.execute(text("DROP TABLE equipment_records"))
-        
-        # 새 테이블 이름 변경
-        db.execute(text("ALTER TABLE equipment_records_new RENAME TO equipment_records"))
-        
-        # 인덱스 재생성
-        db.execute(text("CREATE INDEX IF NOT EXISTS ix_equipment_records_work_date ON equipment_records(work_date)"))
-        db.execute(text("CREATE INDEX IF NOT EXISTS ix_equipment_records_team_id ON equipment_records(team_id)"))
-        
+        print("daily_team_summary 재계산 중...")
+        count = DailySummaryService.rebuild(db)
         db.commit()
-        print("✓ site_name 컬럼이 성공적으로 제거되었습니다.")
-            
+        print(f"✓ daily_team_summary {count}건을 재계산했습니다.")
     except Exception as e:
         db.rollback()
         print(f"✗ 마이그레이션 중 오류 발생: {e}")
@@ -103,43 +319,113 @@ def migrate_remove_site_name_from_equipment():
         db.close()
 
 
-def migrate_ensure_site_name_in_work_records():
+def migrate_backfill_daily_summary():
     """
-    work_records 테이블에 site_name 컬럼이 있는지 확인하고, 없으면 추가합니다.
-    작업자 기록의 현장명은 필요하므로 유지해야 합니다.
+    daily_team_summary 테이블을 만들고, 비어 있는데 기록이 있으면 전체를 채웁니다.
+    이미 채워져 있으면 아무 작업도 하지 않습니다 (이후에는 기록 변경 시 함께 갱신됨).
     """
+    DailyTeamSummaryBase.metadata.create_all(bind=engine)
     db = SessionLocal()
     try:
-        # 테이블 존재 여부 확인
-        result = db.execute(text("SELECT name FROM sqlite_master WHERE type='table' AND name='work_records'"))
-        if not result.fetchone():
-            print("✓ work_records 테이블이 존재하지 않습니다. 마이그레이션 불필요.")
-            return
-        
-        # 컬럼 존재 여부 확인
-        result = db.execute(text("PRAGMA table_info(work_records)"))
-        columns = [row[1] for row in result.fetchall()]
-        
-        if 'site_name' not in columns:
-            print("work_records 테이블에 site_name 컬럼을 추가합니다...")
-            # SQLite는 ALTER TABLE ADD COLUMN만 지원
-            db.execute(text("ALTER TABLE work_records ADD COLUMN site_name VARCHAR(255) DEFAULT ''"))
-            db.commit()
-            print("✓ site_name 컬럼이 성공적으로 추가되었습니다.")
-        else:
-            print("✓ work_records 테이블에 site_name 컬럼이 이미 존재합니다.")
-            
-    except Exception as e:
-        db.rollback()
-        print(f"✗ 마이그레이션 중 오류 발생: {e}")
-        raise
+        has_summary = db.execute(text("SELECT 1 FROM daily_team_summary LIMIT 1")).first()
+        has_records = db.execute(text(
+            "SELECT 1 FROM work_records UNION ALL SELECT 1 FROM equipment_records LIMIT 1"
+        )).first()
     finally:
         db.close()
 
+    if has_summary or not has_records:
+        print("✓ daily_team_summary가 준비되어 있습니다.")
+        return
+    rebuild_daily_summary()
+
+
+def seed_default_data():
+    """기본 사용자/팀을 생성합니다 (사용자가 한 명이라도 있으면 건너뜀)."""
+    from app.init_data import init_default_data
+
+    db = SessionLocal()
+    try:
+        init_default_data(db)
+    finally:
+        db.close()
+    print("✓ 기본 데이터가 준비되었습니다.")
+
+
+def create_team_versions():
+    """
+    team_versions 테이블을 만듭니다. 행이 없는 팀은 버전 0으로 보고,
+    이후 기록을 바꾸는 트랜잭션이 행을 만들거나 버전을 올립니다.
+    """
+    TeamVersionBase.metadata.create_all(bind=engine)
+    print("✓ team_versions 테이블이 준비되었습니다.")
+
+
+REVISIONS = (
+    Revision(1, "create_tables", create_tables),
+    Revision(2, "add_notes_column", migrate_add_notes_column),
+    Revision(3, "remove_site_name_from_equipment", migrate_remove_site_name_from_equipment),
+    Revision(4, "ensure_site_name_in_work_records", migrate_ensure_site_name_in_work_records),
+    Revision(5, "add_composite_indexes", migrate_add_composite_indexes),
+    Revision(6, "backfill_daily_summary", migrate_backfill_daily_summary),
+    Revision(7, "seed_default_data", seed_default_data),
+    Revision(8, "create_team_versions", create_team_versions),
+)
+LATEST_VERSION = REVISIONS[-1].version
+
+
+# ---------------------------------------------------------------------------
+# 실행기
+# ---------------------------------------------------------------------------
+
+def current_version() -> int:
+    """MAX(version) from schema_version (0 if the table does not exist yet)"""
+    try:
+        with engine.connect() as conn:
+            return conn.execute(select(func.max(SchemaVersion.version))).scalar() or 0
+    except DBAPIError:
+        return 0
+
+
+def applied_versions() -> set:
+    with engine.connect() as conn:
+        if not inspect(conn).has_table(SchemaVersion.__tablename__):
+            return set()
+        return set(conn.execute(select(SchemaVersion.version)).scalars())
+
+
+def upgrade(target: Optional[int] = None) -> int:
+    """
+    Apply pending revisions (up to target) in order and record each one.
+    적용한 리비전 수를 반환합니다. 동시 실행 방지는 호출하는 쪽(app.bootstrap)의 잠금으로 합니다.
+    """
+    SchemaVersionBase.metadata.create_all(bind=engine)
+    applied = applied_versions()
+    count = 0
+    for revision in REVISIONS:
+        if revision.version in applied or (target is not None and revision.version > target):
+            continue
+        print(f"[{revision.version}] {revision.name} 실행 중...")
+        revision.upgrade()
+        with engine.begin() as conn:
+            conn.execute(insert(SchemaVersion).values(
+                version=revision.version, name=revision.name, applied_at=datetime.utcnow()
+            ))
+        count += 1
+    return count
+
+
+def status() -> List[Tuple[int, str, bool]]:
+    applied = applied_versions()
+    return [(revision.version, revision.name, revision.version in applied) for revision in REVISIONS]
+
 
 if __name__ == "__main__":
-    print("데이터베이스 마이그레이션 시작...")
-    migrate_add_notes_column()
-    migrate_remove_site_name_from_equipment()
-    migrate_ensure_site_name_in_work_records()  # work_records에는 site_name이 필요
-    print("마이그레이션 완료!")
+    if "--rebuild-daily-summary" in sys.argv[1:]:
+        rebuild_daily_summary()
+        sys.exit(0)
+
+    # 잠금/상태 출력은 app.bootstrap 명령과 동일
+    from app.bootstrap import main
+
+    main(sys.argv[1:])
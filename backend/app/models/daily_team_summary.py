@@ -0,0 +1,20 @@
+from sqlalchemy import Column, String, Integer, Float, DateTime, Date, JSON
+from sqlalchemy.ext.declarative import declarative_base
+from datetime import datetime
+
+Base = declarative_base()
+
+
+class DailyTeamSummary(Base):
+    """팀/작업일별 집계 (공수/장비 기록 변경 시 같은 트랜잭션에서 갱신)"""
+
+    __tablename__ = "daily_team_summary"
+
+    team_id = Column(String(36), primary_key=True)
+    work_date = Column(Date, primary_key=True)
+    worker_count = Column(Integer, nullable=False, default=0)
+    work_record_count = Column(Integer, nullable=False, default=0)
+    total_hours = Column(Float, nullable=False, default=0.0)
+    # {"덤프": 3, "6w": 1} 형태의 장비 타입별 수량
+    equipment_quantities = Column(JSON, nullable=False, default=dict)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, DateTime, Date
+from sqlalchemy import Column, String, Integer, DateTime, Date, Index
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
 
@@ -7,6 +7,17 @@ Base = declarative_base()
 
 class EquipmentRecord(Base):
     __tablename__ = "equipment_records"
+    __table_args__ = (
+        # 팀/날짜/장비 타입별 1건만 허용 (수량 누적 대상 조회)
+        # 선행 컬럼 (team_id, work_date)으로 팀별 날짜 조회에도 사용됨
+        Index(
+            "uq_equipment_records_team_id_work_date_equipment_type",
+            "team_id",
+            "work_date",
+            "equipment_type",
+            unique=True,
+        ),
+    )
 
     id = Column(String(36), primary_key=True, index=True)
     work_date = Column(Date, index=True)
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, String, Integer, DateTime
+from sqlalchemy.ext.declarative import declarative_base
+from datetime import datetime
+
+Base = declarative_base()
+
+
+class TeamVersion(Base):
+    """팀별 기록 변경 카운터 (공수/장비 기록을 바꾸는 트랜잭션에서 함께 증가, 목록 ETag에 사용)"""
+
+    __tablename__ = "team_versions"
+
+    team_id = Column(String(36), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
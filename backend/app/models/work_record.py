@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Float, DateTime, Date
+from sqlalchemy import Column, String, Float, DateTime, Date, Index
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
 
@@ -7,6 +7,10 @@ Base = declarative_base()
 
 class WorkRecord(Base):
     __tablename__ = "work_records"
+    __table_args__ = (
+        # 팀별 조회 후 날짜 필터/정렬 (목록, 최근 작업일, 월별 집계)
+        Index("ix_work_records_team_id_work_date", "team_id", "work_date"),
+    )
 
     id = Column(String(36), primary_key=True, index=True)
     worker_id = Column(String(36))
@@ -0,0 +1,94 @@
+"""
+Keyset(cursor) pagination helpers for record list endpoints
+(work_date DESC, id DESC) 순서로 정렬하고, 마지막 행의 (work_date, id)를 커서로 사용합니다.
+"""
+
+import os
+import base64
+from datetime import date
+from typing import Optional, Tuple
+from fastapi import HTTPException, Response
+from sqlalchemy import and_, or_
+
+DEFAULT_PAGE_SIZE = int(os.getenv("DEFAULT_PAGE_SIZE", "100"))
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", "500"))
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(work_date: date, record_id: str) -> str:
+    raw = f"{work_date.isoformat()}|{record_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[date, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        work_date_str, record_id = raw.split("|", 1)
+        return date.fromisoformat(work_date_str), record_id
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def apply_date_range(query, model, date_from: Optional[date], date_to: Optional[date]):
+    """Filter query by an inclusive [date_from, date_to] work_date range"""
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(status_code=400, detail="date_from must be before date_to")
+    if date_from:
+        query = query.filter(model.work_date >= date_from)
+    if date_to:
+        query = query.filter(model.work_date <= date_to)
+    return query
+
+
+def build_page(
+    query,
+    model,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+):
+    """
+    Apply (work_date DESC, id DESC) ordering and the keyset condition.
+    Works for both ORM Query and select() statements.
+    Returns (query, page_size); page_size is None when paging is not requested.
+    """
+    query = query.order_by(model.work_date.desc(), model.id.desc())
+    if cursor is None and limit is None:
+        return query, None
+
+    if cursor:
+        cursor_date, cursor_id = decode_cursor(cursor)
+        query = query.filter(
+            or_(
+                model.work_date < cursor_date,
+                and_(model.work_date == cursor_date, model.id < cursor_id),
+            )
+        )
+
+    page_size = min(limit or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+    return query.limit(page_size + 1), page_size
+
+
+def finish_page(results, page_size: Optional[int], response: Response):
+    """Trim the extra look-ahead row and set the X-Next-Cursor header"""
+    if page_size is not None and len(results) > page_size:
+        results = results[:page_size]
+        last = results[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.work_date, last.id)
+    return results
+
+
+def paginate(
+    query,
+    model,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+):
+    """
+    (work_date, id) 기준 keyset 페이지네이션을 적용합니다.
+    cursor/limit가 모두 없으면 기존과 같이 전체 결과를 반환합니다 (하위 호환).
+    다음 페이지가 있으면 X-Next-Cursor 응답 헤더에 커서를 설정합니다.
+    """
+    query, page_size = build_page(query, model, cursor, limit)
+    return finish_page(query.all(), page_size, response)
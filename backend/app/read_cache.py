@@ -0,0 +1,221 @@
+"""
+Versioned read cache for rarely changing lists (teams, workers)
+네임스페이스별 버전 번호와 함께 조회 결과를 저장하고, 쓰기 핸들러가 커밋 후 버전을 올리면
+다음 조회에서 다시 읽습니다. 버전 저장소는 기본적으로 SQLite 파일이라 같은 서버의 모든 프로세스
+(gunicorn/uvicorn --workers 워커, python -m app.bootstrap, benchmarks.datagen)가 공유합니다.
+프로세스 메모리 저장소는 단일 프로세스 서버에서만 사용합니다 (메모리 DB를 쓰는 테스트의 기본값).
+
+버전은 API 쓰기 핸들러, 마이그레이션(app.bootstrap.migrate), datagen만 올립니다.
+teams/workers 테이블을 그 밖에서 바꿨다면 (직접 SQL, 백업 복원 등) 같은 READ_CACHE_PATH로
+read_cache.invalidate(*NAMESPACES)를 호출하거나 서버를 재시작해야 다른 워커가 새 목록을 읽습니다.
+"""
+
+import os
+import logging
+import sqlite3
+import threading
+from collections import Counter, OrderedDict
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+from app.database import DATABASE_URL, is_sqlite_memory_url
+
+logger = logging.getLogger(__name__)
+
+# sqlite | memory | off (memory는 단일 프로세스 전용: 워커 수를 알 수 없는 uvicorn --workers 등에서는
+# 다른 워커의 쓰기를 보지 못함. 메모리 DB는 한 프로세스에서만 보이므로 기본값 memory)
+READ_CACHE_BACKEND = os.getenv(
+    "READ_CACHE_BACKEND",
+    "memory" if is_sqlite_memory_url(DATABASE_URL) else "sqlite",
+).lower()
+READ_CACHE_PATH = os.getenv("READ_CACHE_PATH", "./read_cache_versions.db")
+READ_CACHE_SIZE = int(os.getenv("READ_CACHE_SIZE", "256"))
+
+# 캐시하는 목록 (쓰기 경로를 모두 알 수 없을 때 전체 무효화에 사용)
+NAMESPACES = ("teams", "workers")
+
+
+class MemoryVersionStore:
+    """Per-process version counters (single-process servers only)"""
+
+    name = "memory"
+
+    def __init__(self):
+        self._versions = Counter()
+        self._lock = threading.Lock()
+
+    def version(self, namespace: str) -> int:
+        with self._lock:
+            return self._versions[namespace]
+
+    def bump(self, namespace: str) -> None:
+        with self._lock:
+            self._versions[namespace] += 1
+
+
+class SQLiteVersionStore:
+    """
+    Version counters in a small SQLite file shared by all workers on one host.
+    스레드마다 연결을 하나씩 열고, fork된 자식 프로세스에서는 부모의 연결을 쓰지 않습니다.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str, timeout: float = 1.0):
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_versions "
+                "(namespace TEXT PRIMARY KEY, version INTEGER NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+
+    def version(self, namespace: str) -> int:
+        row = self._connection().execute(
+            "SELECT version FROM cache_versions WHERE namespace = ?", (namespace,)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def bump(self, namespace: str) -> None:
+        self._connection().execute(
+            "INSERT INTO cache_versions (namespace, version) VALUES (?, 1) "
+            "ON CONFLICT(namespace) DO UPDATE SET version = version + 1",
+            (namespace,),
+        )
+
+    def _after_fork_in_child(self) -> None:
+        self._local = threading.local()
+
+
+class ReadCache:
+    """
+    Bounded LRU of (namespace, key) -> value, valid while the namespace version is unchanged.
+    버전은 조회 전에 읽으므로, 조회 도중 커밋된 변경은 다음 요청에서 다시 읽힙니다.
+    """
+
+    def __init__(self, store, maxsize: int, enabled: bool = True):
+        self.store = store
+        self.maxsize = maxsize
+        self.enabled = enabled and maxsize > 0
+        self.hits = Counter()
+        self.misses = Counter()
+        self.invalidations = Counter()
+        self.errors = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _lookup(self, namespace: str, key: str) -> Tuple[Optional[int], bool, Any]:
+        """Return (version, hit, value); version is None when it could not be read"""
+        if not self.enabled:
+            return None, False, None
+        try:
+            version = self.store.version(namespace)
+        except sqlite3.Error:
+            # 버전을 확인할 수 없으면 캐시를 쓰지 않고 DB에서 직접 조회
+            logger.warning("read cache version lookup failed", extra={"namespace": namespace}, exc_info=True)
+            with self._lock:
+                self.errors += 1
+                self.misses[namespace] += 1
+            return None, False, None
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end((namespace, key))
+                self.hits[namespace] += 1
+                return version, True, entry[1]
+            self.misses[namespace] += 1
+        return version, False, None
+
+    def _store(self, namespace: str, key: str, version: Optional[int], value: Any) -> None:
+        if version is None:
+            return
+        with self._lock:
+            self._entries[(namespace, key)] = (version, value)
+            self._entries.move_to_end((namespace, key))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, namespace: str, key: str, loader: Callable[[], Any]) -> Any:
+        version, hit, value = self._lookup(namespace, key)
+        if hit:
+            return value
+        value = loader()
+        self._store(namespace, key, version, value)
+        return value
+
+    async def aget_or_load(self, namespace: str, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """get_or_load for async routers (loader is a coroutine function)"""
+        version, hit, value = self._lookup(namespace, key)
+        if hit:
+            return value
+        value = await loader()
+        self._store(namespace, key, version, value)
+        return value
+
+    def invalidate(self, *namespaces: str) -> None:
+        """Call after the write is committed"""
+        for namespace in namespaces:
+            with self._lock:
+                for entry_key in [k for k in self._entries if k[0] == namespace]:
+                    del self._entries[entry_key]
+                self.invalidations[namespace] += 1
+            try:
+                self.store.bump(namespace)
+            except sqlite3.Error:
+                # 쓰기는 이미 커밋되었으므로 요청은 실패시키지 않음 (다른 워커는 갱신이 늦어질 수 있음)
+                logger.error("read cache invalidation failed", extra={"namespace": namespace}, exc_info=True)
+                with self._lock:
+                    self.errors += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits.clear()
+            self.misses.clear()
+            self.invalidations.clear()
+            self.errors = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits = sum(self.hits.values())
+            lookups = hits + sum(self.misses.values())
+            namespaces = sorted(set(self.hits) | set(self.misses) | set(self.invalidations))
+            return {
+                "backend": self.store.name if self.enabled else "off",
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": hits,
+                "misses": lookups - hits,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "errors": self.errors,
+                "namespaces": {
+                    namespace: {
+                        "hits": self.hits[namespace],
+                        "misses": self.misses[namespace],
+                        "invalidations": self.invalidations[namespace],
+                    }
+                    for namespace in namespaces
+                },
+            }
+
+
+def _create_store():
+    if READ_CACHE_BACKEND == "sqlite":
+        store = SQLiteVersionStore(READ_CACHE_PATH)
+        os.register_at_fork(after_in_child=store._after_fork_in_child)
+        return store
+    return MemoryVersionStore()
+
+
+read_cache = ReadCache(_create_store(), READ_CACHE_SIZE, enabled=READ_CACHE_BACKEND != "off")
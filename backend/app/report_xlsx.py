@@ -0,0 +1,147 @@
+"""
+Monthly payroll workbook (XLSX)
+팀별로 시트를 하나씩 만들어 작업자/현장별 공수와 장비별 수량을 기록합니다.
+XlsxWriter constant_memory 모드로 행을 순서대로 기록하고, 집계 행은 yield_per로 읽으므로
+팀/작업자 수와 관계없이 메모리 사용량이 일정합니다.
+"""
+
+import re
+import tempfile
+from typing import Dict, Iterator, List
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+import xlsxwriter
+from app.export import EXPORT_BATCH_SIZE
+from app.models.team import Team
+from app.services import ReportService
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+XLSX_CHUNK_SIZE = 64 * 1024
+
+# 엑셀 시트 이름 제한: 31자, []:*?/\ 사용 불가
+_INVALID_SHEET_CHARS = re.compile(r"[\[\]:*?/\\]")
+
+
+def _sheet_name(name: str, used: set) -> str:
+    base = _INVALID_SHEET_CHARS.sub("_", name).strip("'") or "팀"
+    base = base[:31]
+    candidate = base
+    suffix = 2
+    while candidate.lower() in used:
+        tail = f" ({suffix})"
+        candidate = base[: 31 - len(tail)] + tail
+        suffix += 1
+    used.add(candidate.lower())
+    return candidate
+
+
+def _write_worker_total(sheet, row, worker_name, site_count, work_days, total_hours, bold, bold_hours) -> int:
+    """현장이 여러 곳인 작업자는 합계 행을 추가하고 다음 행 번호를 반환"""
+    if worker_name is None or site_count < 2:
+        return row
+    sheet.write(row, 0, f"{worker_name} 합계", bold)
+    sheet.write(row, 2, work_days, bold)
+    sheet.write(row, 3, total_hours, bold_hours)
+    return row + 1
+
+
+def write_monthly_workbook(db: Session, month: str, team_ids: List[str], output) -> None:
+    """Write one sheet per team into output (a path or binary file object)"""
+    start, end = ReportService.month_range(month)
+    team_names: Dict[str, str] = dict(
+        db.query(Team.id, Team.name).filter(Team.id.in_(team_ids)).all()
+    ) if team_ids else {}
+    team_ids = sorted(team_ids, key=lambda team_id: team_names.get(team_id) or team_id)
+
+    workbook = xlsxwriter.Workbook(output, {"constant_memory": True})
+    bold = workbook.add_format({"bold": True})
+    title = workbook.add_format({"bold": True, "font_size": 14})
+    hours = workbook.add_format({"num_format": "0.0"})
+    bold_hours = workbook.add_format({"bold": True, "num_format": "0.0"})
+
+    used_names = set()
+    if not team_ids:
+        # 기록이 없는 달도 빈 시트 하나는 있어야 엑셀에서 열림
+        sheet = workbook.add_worksheet(_sheet_name(month, used_names))
+        sheet.write(0, 0, f"{month} 월별 현황", title)
+        sheet.write(2, 0, "해당 월의 기록이 없습니다")
+
+    for team_id in team_ids:
+        team_name = team_names.get(team_id) or team_id
+        sheet = workbook.add_worksheet(_sheet_name(team_name, used_names))
+        sheet.set_column(0, 1, 18)
+        sheet.set_column(2, 3, 12)
+        sheet.write(0, 0, f"{month} {team_name} 월별 현황", title)
+
+        # 작업자/현장별 공수
+        row = 2
+        sheet.write_row(row, 0, ["작업자", "현장", "작업일수", "총 공수"], bold)
+        row += 1
+        current_worker = None
+        worker_site_count = 0
+        worker_days = 0
+        worker_hours = 0.0
+
+        work_rows = ReportService.work_summary_query(db, start, end, team_id).yield_per(
+            EXPORT_BATCH_SIZE
+        )
+        for _, worker_name, site_name, work_days, total_hours in work_rows:
+            if worker_name != current_worker:
+                row = _write_worker_total(
+                    sheet, row, current_worker, worker_site_count, worker_days, worker_hours, bold, bold_hours
+                )
+                current_worker = worker_name
+                worker_site_count = 0
+                worker_days = 0
+                worker_hours = 0.0
+            sheet.write(row, 0, worker_name)
+            sheet.write(row, 1, site_name or "")
+            sheet.write(row, 2, work_days)
+            sheet.write(row, 3, float(total_hours), hours)
+            worker_site_count += 1
+            worker_days += work_days
+            worker_hours += float(total_hours)
+            row += 1
+        row = _write_worker_total(
+            sheet, row, current_worker, worker_site_count, worker_days, worker_hours, bold, bold_hours
+        )
+
+        # 장비별 수량
+        row += 1
+        sheet.write_row(row, 0, ["장비", "총 수량"], bold)
+        row += 1
+        for equipment_type, total_quantity in ReportService.equipment_summary_query(
+            db, start, end, team_id
+        ):
+            sheet.write(row, 0, equipment_type)
+            sheet.write(row, 1, int(total_quantity))
+            row += 1
+
+    workbook.close()
+
+
+def _iter_file(handle) -> Iterator[bytes]:
+    try:
+        while True:
+            chunk = handle.read(XLSX_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        handle.close()
+
+
+def monthly_workbook_response(db: Session, month: str, team_ids: List[str]) -> StreamingResponse:
+    """Build the workbook in a temporary file and stream it in chunks"""
+    handle = tempfile.TemporaryFile()
+    try:
+        write_monthly_workbook(db, month, team_ids, handle)
+        handle.seek(0)
+    except Exception:
+        handle.close()
+        raise
+    return StreamingResponse(
+        _iter_file(handle),
+        media_type=XLSX_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="monthly-report-{month}.xlsx"'},
+    )
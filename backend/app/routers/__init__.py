@@ -1,3 +1,3 @@
-from . import auth, users, teams, workers, work_records, equipment_records
+from . import auth, users, teams, workers, work_records, equipment_records, reports
 
-__all__ = ["auth", "users", "teams", "workers", "work_records", "equipment_records"]
+__all__ = ["auth", "users", "teams", "workers", "work_records", "equipment_records", "reports"]
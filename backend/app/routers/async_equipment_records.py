@@ -0,0 +1,264 @@
+"""
+Async version of the equipment record router (USE_ASYNC_DB=true)
+동기 라우터와 같은 경로/권한 규칙을 사용하며, 요청이 스레드풀 워커를 점유하지 않습니다.
+"""
+
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, Response
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import date
+from app.conditional import conditional_response, make_etag, team_version_statement
+from app.database import get_async_db
+from app.pagination import MAX_PAGE_SIZE, apply_date_range, build_page, finish_page
+from app.export import EXPORT_FORMAT_PATTERN, export_records
+from app.models.equipment_record import EquipmentRecord
+from app.schemas.equipment_record import EquipmentRecordCreate, EquipmentRecordUpdate, EquipmentRecordResponse
+from app.security import get_current_user, resolve_team_scope, resolve_write_team_id
+from app.serialization import FAST_LIST_RESPONSES, response_columns, rows_response
+from app.services import DailySummaryService, EquipmentRecordService
+
+router = APIRouter(prefix="/equipment-records", tags=["equipment-records"])
+
+MAX_BULK_RECORDS = 500
+
+
+async def get_record_or_404(db: AsyncSession, record_id: str, current_user: dict) -> EquipmentRecord:
+    record = await db.get(EquipmentRecord, record_id)
+    if not record:
+        raise HTTPException(status_code=404, detail="Equipment record not found")
+
+    # Role-based access control
+    if current_user.get("role") == "manager":
+        user_team_id = current_user.get("team_id")
+        if user_team_id and record.team_id != user_team_id:
+            raise HTTPException(
+                status_code=403,
+                detail="Access denied"
+            )
+    return record
+
+
+async def accumulate_quantities(db: AsyncSession, rows: List[dict]) -> List[EquipmentRecordResponse]:
+    """Run the equipment UPSERT on the async session and commit"""
+    if not rows:
+        return []
+    stmt, values = EquipmentRecordService.build_accumulate_statement(
+        db.get_bind().dialect.name, rows
+    )
+    records = (
+        await db.scalars(stmt, values, execution_options={"populate_existing": True})
+    ).all()
+    await db.run_sync(
+        DailySummaryService.refresh, [(record.team_id, record.work_date) for record in records]
+    )
+    results = [EquipmentRecordResponse.model_validate(record) for record in records]
+    await db.commit()
+    return results
+
+
+@router.get("", response_model=List[EquipmentRecordResponse])
+async def get_equipment_records(
+    response: Response,
+    team_id: Optional[str] = Query(None),
+    work_date: Optional[date] = Query(None),
+    date_from: Optional[date] = Query(None),
+    date_to: Optional[date] = Query(None),
+    cursor: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Get equipment records by team ID, optional date/date range, with keyset pagination"""
+    allowed, scoped_team_id = resolve_team_scope(current_user, team_id)
+    if not allowed:
+        return []
+
+    if FAST_LIST_RESPONSES:
+        stmt = select(*response_columns(EquipmentRecordResponse, EquipmentRecord))
+    else:
+        stmt = select(EquipmentRecord)
+    if scoped_team_id:
+        stmt = stmt.filter(EquipmentRecord.team_id == scoped_team_id)
+    if work_date:
+        stmt = stmt.filter(EquipmentRecord.work_date == work_date)
+    stmt = apply_date_range(stmt, EquipmentRecord, date_from, date_to)
+
+    # 변경이 없으면 본문 없이 304 (팀 버전 행만 조회)
+    version, updated_at = (await db.execute(team_version_statement(scoped_team_id))).one()
+    not_modified = conditional_response(
+        response, make_etag(scoped_team_id, version, updated_at), if_none_match
+    )
+    if not_modified:
+        return not_modified
+
+    stmt, page_size = build_page(stmt, EquipmentRecord, cursor, limit)
+    if FAST_LIST_RESPONSES:
+        results = (await db.execute(stmt)).all()
+        return rows_response(finish_page(results, page_size, response), response)
+    results = (await db.scalars(stmt)).all()
+    return finish_page(results, page_size, response)
+
+
+@router.post("", response_model=EquipmentRecordResponse)
+async def create_equipment_record(
+    equipment_record: EquipmentRecordCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Create a new equipment record or update existing one (accumulate quantity)"""
+    # Role-based access control
+    final_team_id = resolve_write_team_id(current_user, equipment_record.team_id)
+
+    (result,) = await accumulate_quantities(
+        db,
+        [
+            {
+                "work_date": equipment_record.work_date,
+                "equipment_type": equipment_record.equipment_type,
+                "quantity": equipment_record.quantity,
+                "team_id": final_team_id,
+                "created_by": equipment_record.created_by,
+            }
+        ],
+    )
+    return result
+
+
+@router.post("/bulk", response_model=List[EquipmentRecordResponse])
+async def create_equipment_records_bulk(
+    equipment_records: List[EquipmentRecordCreate] = Body(..., max_length=MAX_BULK_RECORDS),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Create or accumulate a day's equipment records in a single transaction"""
+    # 팀 권한은 요청에 포함된 팀별로 한 번만 검증
+    final_team_ids = {
+        team_id: resolve_write_team_id(current_user, team_id)
+        for team_id in {record.team_id for record in equipment_records}
+    }
+
+    # 같은 팀/날짜/장비 타입은 요청 안에서 먼저 합산
+    totals = {}
+    for record in equipment_records:
+        key = (final_team_ids[record.team_id], record.work_date, record.equipment_type)
+        if key in totals:
+            totals[key]["quantity"] += record.quantity
+        else:
+            totals[key] = {"quantity": record.quantity, "created_by": record.created_by}
+
+    return await accumulate_quantities(
+        db,
+        [
+            {
+                "work_date": work_date,
+                "equipment_type": equipment_type,
+                "quantity": entry["quantity"],
+                "team_id": team_id,
+                "created_by": entry["created_by"],
+            }
+            for (team_id, work_date, equipment_type), entry in totals.items()
+        ],
+    )
+
+
+@router.get("/export")
+async def export_equipment_records(
+    export_format: str = Query("ndjson", alias="format", pattern=EXPORT_FORMAT_PATTERN),
+    team_id: Optional[str] = Query(None),
+    date_from: Optional[date] = Query(None),
+    date_to: Optional[date] = Query(None),
+    current_user: dict = Depends(get_current_user),
+):
+    """Stream equipment records as NDJSON or CSV (server-side cursor, constant memory)"""
+    return export_records(
+        EquipmentRecord, EquipmentRecordResponse, current_user, team_id, date_from, date_to, export_format, "equipment-records"
+    )
+
+
+@router.get("/latest", response_model=List[EquipmentRecordResponse])
+async def get_latest_equipment_records(
+    team_id: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Get equipment records of the team's most recent work date"""
+    allowed, scoped_team_id = resolve_team_scope(current_user, team_id)
+    if not allowed:
+        return []
+
+    latest_stmt = select(func.max(EquipmentRecord.work_date))
+    if scoped_team_id:
+        latest_stmt = latest_stmt.filter(EquipmentRecord.team_id == scoped_team_id)
+    latest_date = await db.scalar(latest_stmt)
+    if latest_date is None:
+        return []
+
+    stmt = select(EquipmentRecord).filter(EquipmentRecord.work_date == latest_date)
+    if scoped_team_id:
+        stmt = stmt.filter(EquipmentRecord.team_id == scoped_team_id)
+    stmt = stmt.order_by(EquipmentRecord.created_at, EquipmentRecord.id)
+    return (await db.scalars(stmt)).all()
+
+
+@router.get("/{record_id}", response_model=EquipmentRecordResponse)
+async def get_equipment_record(
+    record_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Get equipment record by ID"""
+    return await get_record_or_404(db, record_id, current_user)
+
+
+@router.put("/{record_id}", response_model=EquipmentRecordResponse)
+async def update_equipment_record(
+    record_id: str,
+    equipment_record: EquipmentRecordUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Update equipment record by ID"""
+    db_record = await get_record_or_404(db, record_id, current_user)
+
+    # 날짜가 바뀌면 이전 날짜의 집계도 갱신
+    summary_keys = [(db_record.team_id, db_record.work_date)]
+
+    # Update fields
+    if equipment_record.work_date is not None:
+        db_record.work_date = equipment_record.work_date
+    if equipment_record.equipment_type is not None:
+        db_record.equipment_type = equipment_record.equipment_type
+    if equipment_record.quantity is not None:
+        db_record.quantity = equipment_record.quantity
+
+    summary_keys.append((db_record.team_id, db_record.work_date))
+
+    try:
+        await db.run_sync(DailySummaryService.refresh, summary_keys)
+        await db.commit()
+    except IntegrityError:
+        # 같은 팀/날짜/장비 타입의 기록이 이미 존재 (UNIQUE 인덱스)
+        await db.rollback()
+        raise HTTPException(
+            status_code=409,
+            detail="An equipment record for this date and type already exists"
+        )
+    return db_record
+
+
+@router.delete("/{record_id}")
+async def delete_equipment_record(
+    record_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Delete equipment record by ID"""
+    record = await get_record_or_404(db, record_id, current_user)
+
+    await db.delete(record)
+    await db.run_sync(DailySummaryService.refresh, [(record.team_id, record.work_date)])
+    await db.commit()
+    return {"message": "Equipment record deleted successfully"}
@@ -0,0 +1,69 @@
+"""
+Async version of the team router (USE_ASYNC_DB=true)
+"""
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+import uuid
+from app.conditional import conditional_response, fingerprint_statement, make_etag
+from app.database import get_async_db
+from app.models.team import Team
+from app.read_cache import read_cache
+from app.schemas.team import TeamCreate, TeamResponse
+from app.security import get_current_user
+
+router = APIRouter(prefix="/teams", tags=["teams"])
+
+
+@router.get("", response_model=List[TeamResponse])
+async def get_teams(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Get all teams"""
+
+    async def load():
+        stmt = select(Team)
+        count, max_updated_at = (await db.execute(fingerprint_statement(stmt, Team))).one()
+        teams = (await db.scalars(stmt)).all()
+        return make_etag(None, count, max_updated_at), [TeamResponse.model_validate(t) for t in teams]
+
+    etag, teams = await read_cache.aget_or_load("teams", "*", load)
+    not_modified = conditional_response(response, etag, if_none_match)
+    if not_modified:
+        return not_modified
+    return teams
+
+
+@router.post("", response_model=TeamResponse)
+async def create_team(
+    team: TeamCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Create a new team (admin only)"""
+    if current_user.get("role") != "admin":
+        raise HTTPException(status_code=403, detail="Only admins can create teams")
+
+    db_team = Team(id=str(uuid.uuid4()), name=team.name, manager_id=team.manager_id)
+    db.add(db_team)
+    await db.commit()
+    read_cache.invalidate("teams")
+    return db_team
+
+
+@router.get("/{team_id}", response_model=TeamResponse)
+async def get_team(
+    team_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Get team by ID"""
+    team = await db.get(Team, team_id)
+    if not team:
+        raise HTTPException(status_code=404, detail="Team not found")
+    return team
@@ -0,0 +1,242 @@
+"""
+Async version of the work record router (USE_ASYNC_DB=true)
+동기 라우터와 같은 경로/권한 규칙을 사용하며, 요청이 스레드풀 워커를 점유하지 않습니다.
+"""
+
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, Response
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import date, datetime
+import uuid
+from app.conditional import conditional_response, make_etag, team_version_statement
+from app.database import get_async_db
+from app.pagination import MAX_PAGE_SIZE, apply_date_range, build_page, finish_page
+from app.export import EXPORT_FORMAT_PATTERN, export_records
+from app.models.work_record import WorkRecord
+from app.schemas.work_record import WorkRecordCreate, WorkRecordUpdate, WorkRecordResponse
+from app.security import get_current_user, resolve_team_scope, resolve_write_team_id
+from app.serialization import FAST_LIST_RESPONSES, response_columns, rows_response
+from app.services import DailySummaryService
+
+router = APIRouter(prefix="/work-records", tags=["work-records"])
+
+MAX_BULK_RECORDS = 500
+
+
+async def get_record_or_404(db: AsyncSession, record_id: str, current_user: dict) -> WorkRecord:
+    record = await db.get(WorkRecord, record_id)
+    if not record:
+        raise HTTPException(status_code=404, detail="Work record not found")
+
+    # Role-based access control
+    if current_user.get("role") == "manager":
+        user_team_id = current_user.get("team_id")
+        if user_team_id and record.team_id != user_team_id:
+            raise HTTPException(
+                status_code=403,
+                detail="Access denied"
+            )
+    return record
+
+
+@router.get("", response_model=List[WorkRecordResponse])
+async def get_work_records(
+    response: Response,
+    team_id: Optional[str] = Query(None),
+    work_date: Optional[date] = Query(None),
+    date_from: Optional[date] = Query(None),
+    date_to: Optional[date] = Query(None),
+    cursor: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Get work records by team ID, optional date/date range, with keyset pagination"""
+    allowed, scoped_team_id = resolve_team_scope(current_user, team_id)
+    if not allowed:
+        return []
+
+    if FAST_LIST_RESPONSES:
+        stmt = select(*response_columns(WorkRecordResponse, WorkRecord))
+    else:
+        stmt = select(WorkRecord)
+    if scoped_team_id:
+        stmt = stmt.filter(WorkRecord.team_id == scoped_team_id)
+    if work_date:
+        stmt = stmt.filter(WorkRecord.work_date == work_date)
+    stmt = apply_date_range(stmt, WorkRecord, date_from, date_to)
+
+    # 변경이 없으면 본문 없이 304 (팀 버전 행만 조회)
+    version, updated_at = (await db.execute(team_version_statement(scoped_team_id))).one()
+    not_modified = conditional_response(
+        response, make_etag(scoped_team_id, version, updated_at), if_none_match
+    )
+    if not_modified:
+        return not_modified
+
+    stmt, page_size = build_page(stmt, WorkRecord, cursor, limit)
+    if FAST_LIST_RESPONSES:
+        results = (await db.execute(stmt)).all()
+        return rows_response(finish_page(results, page_size, response), response)
+    results = (await db.scalars(stmt)).all()
+    return finish_page(results, page_size, response)
+
+
+@router.post("", response_model=WorkRecordResponse)
+async def create_work_record(
+    work_record: WorkRecordCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Create a new work record"""
+    # Role-based access control
+    final_team_id = resolve_write_team_id(current_user, work_record.team_id)
+
+    db_work_record = WorkRecord(
+        id=str(uuid.uuid4()),
+        worker_id=work_record.worker_id,
+        worker_name=work_record.worker_name,
+        site_name=work_record.site_name,
+        work_date=work_record.work_date,
+        work_hours=work_record.work_hours,
+        notes=work_record.notes,
+        team_id=final_team_id,
+        created_by=work_record.created_by,
+    )
+    db.add(db_work_record)
+    await db.run_sync(DailySummaryService.refresh, [(final_team_id, db_work_record.work_date)])
+    await db.commit()
+    return db_work_record
+
+
+@router.post("/bulk", response_model=List[WorkRecordResponse])
+async def create_work_records_bulk(
+    work_records: List[WorkRecordCreate] = Body(..., max_length=MAX_BULK_RECORDS),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Create a day's work records in a single transaction"""
+    # 팀 권한은 요청에 포함된 팀별로 한 번만 검증
+    final_team_ids = {
+        team_id: resolve_write_team_id(current_user, team_id)
+        for team_id in {record.team_id for record in work_records}
+    }
+
+    now = datetime.utcnow()
+    rows = [
+        {
+            "id": str(uuid.uuid4()),
+            "worker_id": record.worker_id,
+            "worker_name": record.worker_name,
+            "site_name": record.site_name,
+            "work_date": record.work_date,
+            "work_hours": record.work_hours,
+            "notes": record.notes,
+            "team_id": final_team_ids[record.team_id],
+            "created_by": record.created_by,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for record in work_records
+    ]
+    if rows:
+        await db.execute(insert(WorkRecord), rows)
+        await db.run_sync(
+            DailySummaryService.refresh, {(row["team_id"], row["work_date"]) for row in rows}
+        )
+        await db.commit()
+    return rows
+
+
+@router.get("/export")
+async def export_work_records(
+    export_format: str = Query("ndjson", alias="format", pattern=EXPORT_FORMAT_PATTERN),
+    team_id: Optional[str] = Query(None),
+    date_from: Optional[date] = Query(None),
+    date_to: Optional[date] = Query(None),
+    current_user: dict = Depends(get_current_user),
+):
+    """Stream work records as NDJSON or CSV (server-side cursor, constant memory)"""
+    return export_records(
+        WorkRecord, WorkRecordResponse, current_user, team_id, date_from, date_to, export_format, "work-records"
+    )
+
+
+@router.get("/latest", response_model=List[WorkRecordResponse])
+async def get_latest_work_records(
+    team_id: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Get work records of the team's most recent work date"""
+    allowed, scoped_team_id = resolve_team_scope(current_user, team_id)
+    if not allowed:
+        return []
+
+    latest_stmt = select(func.max(WorkRecord.work_date))
+    if scoped_team_id:
+        latest_stmt = latest_stmt.filter(WorkRecord.team_id == scoped_team_id)
+    latest_date = await db.scalar(latest_stmt)
+    if latest_date is None:
+        return []
+
+    stmt = select(WorkRecord).filter(WorkRecord.work_date == latest_date)
+    if scoped_team_id:
+        stmt = stmt.filter(WorkRecord.team_id == scoped_team_id)
+    stmt = stmt.order_by(WorkRecord.created_at, WorkRecord.id)
+    return (await db.scalars(stmt)).all()
+
+
+@router.get("/{record_id}", response_model=WorkRecordResponse)
+async def get_work_record(
+    record_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Get work record by ID"""
+    return await get_record_or_404(db, record_id, current_user)
+
+
+@router.put("/{record_id}", response_model=WorkRecordResponse)
+async def update_work_record(
+    record_id: str,
+    work_record: WorkRecordUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Update work record by ID"""
+    db_record = await get_record_or_404(db, record_id, current_user)
+
+    # Update fields (only if provided)
+    if work_record.worker_id is not None:
+        db_record.worker_id = work_record.worker_id
+    if work_record.worker_name is not None:
+        db_record.worker_name = work_record.worker_name
+    if work_record.site_name is not None:
+        db_record.site_name = work_record.site_name
+    if work_record.work_hours is not None:
+        db_record.work_hours = work_record.work_hours
+    if work_record.notes is not None:
+        db_record.notes = work_record.notes
+    db_record.updated_at = datetime.utcnow()
+    await db.run_sync(DailySummaryService.refresh, [(db_record.team_id, db_record.work_date)])
+
+    await db.commit()
+    return db_record
+
+
+@router.delete("/{record_id}")
+async def delete_work_record(
+    record_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Delete work record by ID"""
+    record = await get_record_or_404(db, record_id, current_user)
+
+    await db.delete(record)
+    await db.run_sync(DailySummaryService.refresh, [(record.team_id, record.work_date)])
+    await db.commit()
+    return {"message": "Work record deleted successfully"}
@@ -0,0 +1,97 @@
+"""
+Async version of the worker router (USE_ASYNC_DB=true)
+"""
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+import uuid
+from app.conditional import conditional_response, fingerprint_statement, make_etag
+from app.database import get_async_db
+from app.models.worker import Worker
+from app.read_cache import read_cache
+from app.schemas.worker import WorkerCreate, WorkerResponse
+from app.security import get_current_user
+
+router = APIRouter(prefix="/workers", tags=["workers"])
+
+
+@router.get("", response_model=List[WorkerResponse])
+async def get_workers(
+    response: Response,
+    team_id: Optional[str] = Query(None),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Get workers by team ID (optional)"""
+    stmt = select(Worker)
+    scope = None
+
+    # Role-based filtering
+    if current_user.get("role") == "manager":
+        # Managers can only see their team's workers
+        user_team_id = current_user.get("team_id")
+        if user_team_id:
+            stmt = stmt.filter(Worker.team_id == user_team_id)
+            scope = user_team_id
+    elif team_id:
+        # Admins can filter by team_id
+        stmt = stmt.filter(Worker.team_id == team_id)
+        scope = team_id
+
+    async def load():
+        count, max_updated_at = (await db.execute(fingerprint_statement(stmt, Worker))).one()
+        workers = (await db.scalars(stmt)).all()
+        return make_etag(scope, count, max_updated_at), [WorkerResponse.model_validate(w) for w in workers]
+
+    etag, workers = await read_cache.aget_or_load("workers", scope or "*", load)
+    not_modified = conditional_response(response, etag, if_none_match)
+    if not_modified:
+        return not_modified
+    return workers
+
+
+@router.post("", response_model=WorkerResponse)
+async def create_worker(
+    worker: WorkerCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Create a new worker"""
+    db_worker = Worker(id=str(uuid.uuid4()), name=worker.name, team_id=worker.team_id)
+    db.add(db_worker)
+    await db.commit()
+    read_cache.invalidate("workers")
+    return db_worker
+
+
+@router.get("/{worker_id}", response_model=WorkerResponse)
+async def get_worker(
+    worker_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Get worker by ID"""
+    worker = await db.get(Worker, worker_id)
+    if not worker:
+        raise HTTPException(status_code=404, detail="Worker not found")
+    return worker
+
+
+@router.delete("/{worker_id}")
+async def delete_worker(
+    worker_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Delete worker by ID"""
+    worker = await db.get(Worker, worker_id)
+    if not worker:
+        raise HTTPException(status_code=404, detail="Worker not found")
+
+    await db.delete(worker)
+    await db.commit()
+    read_cache.invalidate("workers")
+    return {"message": "Worker deleted successfully"}
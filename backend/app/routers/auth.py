@@ -1,33 +1,36 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from app.database import get_db
-from app.models.user import User
 from app.schemas.user import UserCreate, UserLogin, UserResponse
 from app.services import AuthService
-from app.security import get_current_user
+from app.security import get_current_user, get_password_hash_async, verify_password_async
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
+# 비밀번호 해시는 전용 프로세스 풀에서, DB 작업은 스레드풀에서 실행
+# (로그인이 몰려도 다른 API 요청의 스레드풀 워커를 점유하지 않음)
 @router.post("/register", response_model=UserResponse)
-def register(user: UserCreate, db: Session = Depends(get_db)):
+async def register(user: UserCreate, db: Session = Depends(get_db)):
     """Register a new user"""
-    db_user = db.query(User).filter(User.email == user.email).first()
+    db_user = await run_in_threadpool(AuthService.get_user_by_email, db, user.email)
     if db_user:
         raise HTTPException(status_code=400, detail="Email already registered")
 
-    return AuthService.create_user(db, user)
+    password_hash = await get_password_hash_async(user.password)
+    return await run_in_threadpool(AuthService.create_user, db, user, password_hash)
 
 
 @router.post("/login")
-def login(user: UserLogin, db: Session = Depends(get_db)):
+async def login(user: UserLogin, db: Session = Depends(get_db)):
     """Login user and return access token"""
-    result = AuthService.authenticate_user(db, user)
-    if not result:
+    db_user = await run_in_threadpool(AuthService.get_user_by_email, db, user.email)
+    if not db_user or not await verify_password_async(user.password, db_user.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email or password"
         )
-    return result
+    return AuthService.build_login_response(db_user)
 
 
 @router.get("/me", response_model=UserResponse)
@@ -1,79 +1,73 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, Response
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import date
-import uuid
+import logging
+from app.conditional import conditional_response, team_version_etag
 from app.database import get_db
+from app.pagination import MAX_PAGE_SIZE, apply_date_range, paginate
+from app.export import EXPORT_FORMAT_PATTERN, export_records
 from app.models.equipment_record import EquipmentRecord
 from app.schemas.equipment_record import EquipmentRecordCreate, EquipmentRecordUpdate, EquipmentRecordResponse
-from app.security import get_current_user
+from app.security import get_current_user, resolve_team_scope, resolve_write_team_id
+from app.serialization import FAST_LIST_RESPONSES, response_columns, rows_response
+from app.services import DailySummaryService, EquipmentRecordService
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/equipment-records", tags=["equipment-records"])
 
+MAX_BULK_RECORDS = 500
+
 
 @router.get("", response_model=List[EquipmentRecordResponse])
 def get_equipment_records(
+    response: Response,
     team_id: Optional[str] = Query(None),
     work_date: Optional[date] = Query(None),
+    date_from: Optional[date] = Query(None),
+    date_to: Optional[date] = Query(None),
+    cursor: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
-    """Get equipment records by team ID and optional date"""
-    query = db.query(EquipmentRecord)
-    
-    # 디버깅: current_user 전체 내용 확인
-    print(f"get_equipment_records - DEBUG: current_user: {current_user}")
-    print(f"get_equipment_records - DEBUG: current_user.get('role'): {current_user.get('role')}")
-    print(f"get_equipment_records - DEBUG: current_user.get('role') == 'manager': {current_user.get('role') == 'manager'}")
-    
-    # Role-based filtering
-    if current_user.get("role") == "manager":
-        # Managers can only see their team's records
-        user_team_id = current_user.get("team_id")
-        print(f"get_equipment_records - manager role, user_team_id from token: {user_team_id} (type: {type(user_team_id)}), team_id param: {team_id} (type: {type(team_id) if team_id else None}), current_user keys: {list(current_user.keys())}")
-        
-        # team_id가 None이거나 빈 문자열이면 빈 결과 반환
-        if not user_team_id or (isinstance(user_team_id, str) and not user_team_id.strip()):
-            print(f"get_equipment_records - WARNING: manager role but no team_id in token! user_team_id: {user_team_id}")
-            return []
-        
-        # 문자열로 변환하여 비교 (타입 불일치 방지)
-        user_team_id_str = str(user_team_id).strip()
-        
-        # 전달된 team_id 파라미터가 있으면 JWT의 team_id와 비교하여 검증
-        if team_id:
-            team_id_str = str(team_id).strip()
-            if team_id_str != user_team_id_str:
-                print(f"get_equipment_records - WARNING: manager tried to access different team! user_team_id: {user_team_id_str}, requested team_id: {team_id_str}")
-                raise HTTPException(
-                    status_code=403,
-                    detail="You can only access your own team's records"
-                )
-            # 검증 통과: 전달된 team_id 사용
-            print(f"get_equipment_records - Filtering by team_id: {team_id_str}")
-            query = query.filter(EquipmentRecord.team_id == team_id_str)
-        else:
-            # team_id 파라미터가 없으면 JWT의 team_id 사용
-            print(f"get_equipment_records - Filtering by user_team_id from token: {user_team_id_str}")
-            query = query.filter(EquipmentRecord.team_id == user_team_id_str)
-    elif current_user.get("role") == "admin":
-        # Admins can filter by team_id parameter
-        if team_id:
-            query = query.filter(EquipmentRecord.team_id == team_id)
-        # team_id가 없으면 모든 기록 반환 (관리자 권한)
-    else:
-        # 다른 역할은 빈 결과 반환
+    """Get equipment records by team ID, optional date/date range, with keyset pagination"""
+    allowed, scoped_team_id = resolve_team_scope(current_user, team_id)
+    if not allowed:
         return []
 
+    if FAST_LIST_RESPONSES:
+        # 응답에 필요한 컬럼만 행 튜플로 조회 (ORM 객체/Pydantic 변환 생략)
+        query = db.query(*response_columns(EquipmentRecordResponse, EquipmentRecord))
+    else:
+        query = db.query(EquipmentRecord)
+    if scoped_team_id:
+        query = query.filter(EquipmentRecord.team_id == scoped_team_id)
     if work_date:
         query = query.filter(EquipmentRecord.work_date == work_date)
+    query = apply_date_range(query, EquipmentRecord, date_from, date_to)
+
+    # 변경이 없으면 본문 없이 304 (팀 버전 행만 조회)
+    not_modified = conditional_response(
+        response, team_version_etag(db, scoped_team_id), if_none_match
+    )
+    if not_modified:
+        return not_modified
 
-    results = query.order_by(EquipmentRecord.work_date.desc()).all()
-    print(f"get_equipment_records - found {len(results)} records")
-    if results:
-        # 모든 결과의 team_id 확인
-        team_ids_in_results = [r.team_id for r in results]
-        print(f"get_equipment_records - All team_ids in results: {set(team_ids_in_results)}")
+    results = paginate(query, EquipmentRecord, response, cursor=cursor, limit=limit)
+    logger.debug(
+        "get_equipment_records - role=%s team_id=%s work_date=%s found=%d",
+        current_user.get("role"), scoped_team_id, work_date, len(results),
+    )
+    if results and logger.isEnabledFor(logging.DEBUG):
+        # 결과 전체를 순회하므로 DEBUG 레벨에서만 실행
+        logger.debug("get_equipment_records - team_ids in results: %s", {r.team_id for r in results})
+    if FAST_LIST_RESPONSES:
+        return rows_response(results, response)
     return results
 
 
@@ -85,64 +79,110 @@ def create_equipment_record(
 ):
     """Create a new equipment record or update existing one (accumulate quantity)"""
     # Role-based access control
-    if current_user.get("role") == "manager":
-        user_team_id = current_user.get("team_id")
-        # 팀 계정의 경우 user_team_id를 사용 (equipment_record.team_id가 없거나 다를 경우)
-        if user_team_id:
-            if equipment_record.team_id and equipment_record.team_id != user_team_id:
-                raise HTTPException(
-                    status_code=403,
-                    detail="Managers can only create records for their own team"
-                )
-            # equipment_record.team_id가 없거나 빈 문자열이면 user_team_id 사용
-            final_team_id = equipment_record.team_id if (equipment_record.team_id and equipment_record.team_id.strip()) else user_team_id
-        else:
-            # user_team_id가 없으면 에러 (팀 계정은 반드시 team_id가 있어야 함)
-            raise HTTPException(
-                status_code=400,
-                detail="Team ID is required for manager accounts"
-            )
-    else:
-        # 관리자 계정의 경우 equipment_record.team_id 사용 (필수)
-        if not equipment_record.team_id or not equipment_record.team_id.strip():
-            raise HTTPException(
-                status_code=400,
-                detail="Team ID is required"
-            )
-        final_team_id = equipment_record.team_id
-    
-    # Log for debugging
-    print(f"Creating equipment record - team_id: {final_team_id}, equipment_type: {equipment_record.equipment_type}, current_user role: {current_user.get('role')}, current_user team_id: {current_user.get('team_id')}, equipment_record.team_id: {equipment_record.team_id}")
+    final_team_id = resolve_write_team_id(current_user, equipment_record.team_id)
     
-    # 같은 날짜, 같은 장비 타입, 같은 팀의 기존 레코드 찾기
-    existing_record = db.query(EquipmentRecord).filter(
-        EquipmentRecord.work_date == equipment_record.work_date,
-        EquipmentRecord.equipment_type == equipment_record.equipment_type,
-        EquipmentRecord.team_id == final_team_id
-    ).first()
-    
-    if existing_record:
-        # 기존 레코드가 있으면 수량 누적
-        existing_record.quantity += equipment_record.quantity
-        db.commit()
-        db.refresh(existing_record)
-        print(f"Updated existing equipment record - id: {existing_record.id}, team_id: {existing_record.team_id}, quantity: {existing_record.quantity}")
-        return existing_record
-    else:
-        # 없으면 새로 생성
-        db_equipment_record = EquipmentRecord(
-            id=str(uuid.uuid4()),
-            work_date=equipment_record.work_date,
-            equipment_type=equipment_record.equipment_type,
-            quantity=equipment_record.quantity,
-            team_id=final_team_id,
-            created_by=equipment_record.created_by,
-        )
-        db.add(db_equipment_record)
-        db.commit()
-        db.refresh(db_equipment_record)
-        print(f"Created new equipment record - id: {db_equipment_record.id}, team_id: {db_equipment_record.team_id}")
-        return db_equipment_record
+    logger.debug(
+        "Creating equipment record - team_id=%s equipment_type=%s role=%s",
+        final_team_id, equipment_record.equipment_type, current_user.get("role"),
+    )
+
+    # 같은 날짜, 같은 장비 타입, 같은 팀의 기록이 있으면 수량 누적 (단일 UPSERT)
+    (record,) = EquipmentRecordService.accumulate_quantities(
+        db,
+        [
+            {
+                "work_date": equipment_record.work_date,
+                "equipment_type": equipment_record.equipment_type,
+                "quantity": equipment_record.quantity,
+                "team_id": final_team_id,
+                "created_by": equipment_record.created_by,
+            }
+        ],
+    )
+    DailySummaryService.refresh(db, [(record.team_id, record.work_date)])
+    response = EquipmentRecordResponse.model_validate(record)
+    db.commit()
+    return response
+
+
+@router.post("/bulk", response_model=List[EquipmentRecordResponse])
+def create_equipment_records_bulk(
+    equipment_records: List[EquipmentRecordCreate] = Body(..., max_length=MAX_BULK_RECORDS),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Create or accumulate a day's equipment records in a single transaction"""
+    # 팀 권한은 요청에 포함된 팀별로 한 번만 검증
+    final_team_ids = {
+        team_id: resolve_write_team_id(current_user, team_id)
+        for team_id in {record.team_id for record in equipment_records}
+    }
+
+    # 같은 팀/날짜/장비 타입은 요청 안에서 먼저 합산
+    totals = {}
+    for record in equipment_records:
+        key = (final_team_ids[record.team_id], record.work_date, record.equipment_type)
+        if key in totals:
+            totals[key]["quantity"] += record.quantity
+        else:
+            totals[key] = {"quantity": record.quantity, "created_by": record.created_by}
+
+    records = EquipmentRecordService.accumulate_quantities(
+        db,
+        [
+            {
+                "work_date": work_date,
+                "equipment_type": equipment_type,
+                "quantity": entry["quantity"],
+                "team_id": team_id,
+                "created_by": entry["created_by"],
+            }
+            for (team_id, work_date, equipment_type), entry in totals.items()
+        ],
+    )
+    DailySummaryService.refresh(db, [(record.team_id, record.work_date) for record in records])
+    results = [EquipmentRecordResponse.model_validate(record) for record in records]
+    db.commit()
+    return results
+
+
+@router.get("/export")
+def export_equipment_records(
+    export_format: str = Query("ndjson", alias="format", pattern=EXPORT_FORMAT_PATTERN),
+    team_id: Optional[str] = Query(None),
+    date_from: Optional[date] = Query(None),
+    date_to: Optional[date] = Query(None),
+    current_user: dict = Depends(get_current_user),
+):
+    """Stream equipment records as NDJSON or CSV (server-side cursor, constant memory)"""
+    return export_records(
+        EquipmentRecord, EquipmentRecordResponse, current_user, team_id, date_from, date_to, export_format, "equipment-records"
+    )
+
+
+@router.get("/latest", response_model=List[EquipmentRecordResponse])
+def get_latest_equipment_records(
+    team_id: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Get equipment records of the team's most recent work date"""
+    allowed, scoped_team_id = resolve_team_scope(current_user, team_id)
+    if not allowed:
+        return []
+
+    # MAX(work_date)는 team_id/work_date 인덱스로 조회
+    latest_query = db.query(func.max(EquipmentRecord.work_date))
+    if scoped_team_id:
+        latest_query = latest_query.filter(EquipmentRecord.team_id == scoped_team_id)
+    latest_date = latest_query.scalar()
+    if latest_date is None:
+        return []
+
+    query = db.query(EquipmentRecord).filter(EquipmentRecord.work_date == latest_date)
+    if scoped_team_id:
+        query = query.filter(EquipmentRecord.team_id == scoped_team_id)
+    return query.order_by(EquipmentRecord.created_at, EquipmentRecord.id).all()
 
 
 @router.get("/{record_id}", response_model=EquipmentRecordResponse)
@@ -189,6 +229,9 @@ def update_equipment_record(
                 detail="Access denied"
             )
     
+    # 날짜가 바뀌면 이전 날짜의 집계도 갱신
+    summary_keys = [(db_record.team_id, db_record.work_date)]
+
     # Update fields
     if equipment_record.work_date is not None:
         db_record.work_date = equipment_record.work_date
@@ -196,8 +239,18 @@ def update_equipment_record(
         db_record.equipment_type = equipment_record.equipment_type
     if equipment_record.quantity is not None:
         db_record.quantity = equipment_record.quantity
-    
-    db.commit()
+    summary_keys.append((db_record.team_id, db_record.work_date))
+
+    try:
+        DailySummaryService.refresh(db, summary_keys)
+        db.commit()
+    except IntegrityError:
+        # 같은 팀/날짜/장비 타입의 기록이 이미 존재 (UNIQUE 인덱스)
+        db.rollback()
+        raise HTTPException(
+            status_code=409,
+            detail="An equipment record for this date and type already exists"
+        )
     db.refresh(db_record)
     return db_record
 
@@ -223,5 +276,6 @@ def delete_equipment_record(
             )
 
     db.delete(record)
+    DailySummaryService.refresh(db, [(record.team_id, record.work_date)])
     db.commit()
     return {"message": "Equipment record deleted successfully"}
@@ -0,0 +1,64 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import date
+from app.database import get_db
+from app.models.daily_team_summary import DailyTeamSummary
+from app.pagination import apply_date_range
+from app.schemas.report import DailyTeamSummaryResponse, MonthlyReportResponse
+from app.services import ReportService
+from app.report_xlsx import monthly_workbook_response
+from app.security import get_current_user, resolve_team_scope
+
+router = APIRouter(prefix="/reports", tags=["reports"])
+
+MONTH_PATTERN = r"^\d{4}-(0[1-9]|1[0-2])$"
+
+
+@router.get("/monthly", response_model=MonthlyReportResponse)
+def get_monthly_report(
+    month: str = Query(..., pattern=MONTH_PATTERN),
+    team_id: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Get monthly worker/site and equipment totals aggregated in the database"""
+    empty_report = {"month": month, "team_id": team_id, "workers": [], "equipment": []}
+
+    allowed, scoped_team_id = resolve_team_scope(current_user, team_id)
+    if not allowed:
+        return empty_report
+    return ReportService.monthly_report(db, month, scoped_team_id)
+
+
+@router.get("/monthly/xlsx")
+def get_monthly_report_xlsx(
+    month: str = Query(..., pattern=MONTH_PATTERN),
+    team_id: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Download the monthly payroll workbook (one sheet per team; all teams for admins without team_id)"""
+    allowed, scoped_team_id = resolve_team_scope(current_user, team_id)
+    team_ids = ReportService.active_team_ids(db, month, scoped_team_id) if allowed else []
+    return monthly_workbook_response(db, month, team_ids)
+
+
+@router.get("/daily-summary", response_model=List[DailyTeamSummaryResponse])
+def get_daily_summary(
+    date_from: Optional[date] = Query(None),
+    date_to: Optional[date] = Query(None),
+    team_id: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Get precomputed per-team daily totals (workers, hours, equipment) from daily_team_summary"""
+    allowed, scoped_team_id = resolve_team_scope(current_user, team_id)
+    if not allowed:
+        return []
+
+    query = db.query(DailyTeamSummary)
+    if scoped_team_id:
+        query = query.filter(DailyTeamSummary.team_id == scoped_team_id)
+    query = apply_date_range(query, DailyTeamSummary, date_from, date_to)
+    return query.order_by(DailyTeamSummary.work_date, DailyTeamSummary.team_id).all()
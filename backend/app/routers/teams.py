@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 import uuid
+from app.conditional import conditional_response, query_etag
 from app.database import get_db
 from app.models.team import Team
+from app.read_cache import read_cache
 from app.schemas.team import TeamCreate, TeamResponse
 from app.security import get_current_user
 
@@ -12,10 +14,21 @@ router = APIRouter(prefix="/teams", tags=["teams"])
 
 @router.get("", response_model=List[TeamResponse])
 def get_teams(
-    db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
 ):
     """Get all teams"""
-    teams = db.query(Team).all()
+
+    def load():
+        query = db.query(Team)
+        return query_etag(query, Team, None), [TeamResponse.model_validate(t) for t in query.all()]
+
+    etag, teams = read_cache.get_or_load("teams", "*", load)
+    not_modified = conditional_response(response, etag, if_none_match)
+    if not_modified:
+        return not_modified
     return teams
 
 
@@ -32,6 +45,7 @@ def create_team(
     db_team = Team(id=str(uuid.uuid4()), name=team.name, manager_id=team.manager_id)
     db.add(db_team)
     db.commit()
+    read_cache.invalidate("teams")
     db.refresh(db_team)
     return db_team
 
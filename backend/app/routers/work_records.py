@@ -1,85 +1,73 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, Response
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import date, datetime
 import uuid
 import logging
+from app.conditional import conditional_response, team_version_etag
 from app.database import get_db
+from app.pagination import MAX_PAGE_SIZE, apply_date_range, paginate
+from app.export import EXPORT_FORMAT_PATTERN, export_records
 from app.models.work_record import WorkRecord
 from app.schemas.work_record import WorkRecordCreate, WorkRecordUpdate, WorkRecordResponse
-from app.security import get_current_user
+from app.security import get_current_user, resolve_team_scope, resolve_write_team_id
+from app.serialization import FAST_LIST_RESPONSES, response_columns, rows_response
+from app.services import DailySummaryService
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/work-records", tags=["work-records"])
 
+MAX_BULK_RECORDS = 500
+
 
 @router.get("", response_model=List[WorkRecordResponse])
 def get_work_records(
+    response: Response,
     team_id: Optional[str] = Query(None),
     work_date: Optional[date] = Query(None),
+    date_from: Optional[date] = Query(None),
+    date_to: Optional[date] = Query(None),
+    cursor: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
-    """Get work records by team ID and optional date"""
-    query = db.query(WorkRecord)
-    
-    # 디버깅: current_user 전체 내용 확인
-    logger.info(f"get_work_records - DEBUG: current_user: {current_user}")
-    logger.info(f"get_work_records - DEBUG: current_user.get('role'): {current_user.get('role')}")
-    logger.info(f"get_work_records - DEBUG: current_user.get('role') == 'manager': {current_user.get('role') == 'manager'}")
-    
-    # Role-based filtering
-    if current_user.get("role") == "manager":
-        # Managers can only see their team's records
-        user_team_id = current_user.get("team_id")
-        logger.info(f"get_work_records - manager role, user_team_id from token: {user_team_id} (type: {type(user_team_id)}), team_id param: {team_id} (type: {type(team_id) if team_id else None}), current_user keys: {list(current_user.keys())}")
-        
-        # team_id가 None이거나 빈 문자열이면 빈 결과 반환
-        if not user_team_id or (isinstance(user_team_id, str) and not user_team_id.strip()):
-            logger.warning(f"get_work_records - WARNING: manager role but no team_id in token! user_team_id: {user_team_id}")
-            return []
-        
-        # 문자열로 변환하여 비교 (타입 불일치 방지)
-        user_team_id_str = str(user_team_id).strip()
-        
-        # 전달된 team_id 파라미터가 있으면 JWT의 team_id와 비교하여 검증
-        if team_id:
-            team_id_str = str(team_id).strip()
-            if team_id_str != user_team_id_str:
-                logger.warning(f"get_work_records - WARNING: manager tried to access different team! user_team_id: {user_team_id_str}, requested team_id: {team_id_str}")
-                raise HTTPException(
-                    status_code=403,
-                    detail="You can only access your own team's records"
-                )
-            # 검증 통과: 전달된 team_id 사용
-            logger.info(f"get_work_records - Filtering by team_id: {team_id_str}")
-            query = query.filter(WorkRecord.team_id == team_id_str)
-        else:
-            # team_id 파라미터가 없으면 JWT의 team_id 사용
-            logger.info(f"get_work_records - Filtering by user_team_id from token: {user_team_id_str}")
-            query = query.filter(WorkRecord.team_id == user_team_id_str)
-    elif current_user.get("role") == "admin":
-        # Admins can filter by team_id parameter
-        if team_id:
-            query = query.filter(WorkRecord.team_id == team_id)
-        # team_id가 없으면 모든 기록 반환 (관리자 권한)
-    else:
-        # 다른 역할은 빈 결과 반환
+    """Get work records by team ID, optional date/date range, with keyset pagination"""
+    allowed, scoped_team_id = resolve_team_scope(current_user, team_id)
+    if not allowed:
         return []
-    
+
+    if FAST_LIST_RESPONSES:
+        # 응답에 필요한 컬럼만 행 튜플로 조회 (ORM 객체/Pydantic 변환 생략)
+        query = db.query(*response_columns(WorkRecordResponse, WorkRecord))
+    else:
+        query = db.query(WorkRecord)
+    if scoped_team_id:
+        query = query.filter(WorkRecord.team_id == scoped_team_id)
     if work_date:
         query = query.filter(WorkRecord.work_date == work_date)
-    
-    # Log for debugging
-    logger.info(f"get_work_records - current_user role: {current_user.get('role')}, team_id param: {team_id}, work_date: {work_date}")
-    results = query.order_by(WorkRecord.work_date.desc()).all()
-    logger.info(f"get_work_records - found {len(results)} records")
-    if results:
-        logger.info(f"Sample record - id: {results[0].id}, team_id: {results[0].team_id}, worker_name: {results[0].worker_name}")
-        # 모든 결과의 team_id 확인
-        team_ids_in_results = [r.team_id for r in results]
-        logger.info(f"get_work_records - All team_ids in results: {set(team_ids_in_results)}")
+    query = apply_date_range(query, WorkRecord, date_from, date_to)
+
+    # 변경이 없으면 본문 없이 304 (팀 버전 행만 조회)
+    not_modified = conditional_response(
+        response, team_version_etag(db, scoped_team_id), if_none_match
+    )
+    if not_modified:
+        return not_modified
+
+    results = paginate(query, WorkRecord, response, cursor=cursor, limit=limit)
+    logger.debug(
+        "get_work_records - role=%s team_id=%s work_date=%s found=%d",
+        current_user.get("role"), scoped_team_id, work_date, len(results),
+    )
+    if results and logger.isEnabledFor(logging.DEBUG):
+        # 결과 전체를 순회하므로 DEBUG 레벨에서만 실행
+        logger.debug("get_work_records - team_ids in results: %s", {r.team_id for r in results})
+    if FAST_LIST_RESPONSES:
+        return rows_response(results, response)
     return results
 
 
@@ -91,35 +79,13 @@ def create_work_record(
 ):
     """Create a new work record"""
     # Role-based access control
-    if current_user.get("role") == "manager":
-        user_team_id = current_user.get("team_id")
-        # 팀 계정의 경우 user_team_id를 사용 (work_record.team_id가 없거나 다를 경우)
-        if user_team_id:
-            if work_record.team_id and work_record.team_id != user_team_id:
-                raise HTTPException(
-                    status_code=403,
-                    detail="Managers can only create records for their own team"
-                )
-            # work_record.team_id가 없거나 빈 문자열이면 user_team_id 사용
-            final_team_id = work_record.team_id if (work_record.team_id and work_record.team_id.strip()) else user_team_id
-        else:
-            # user_team_id가 없으면 에러 (팀 계정은 반드시 team_id가 있어야 함)
-            raise HTTPException(
-                status_code=400,
-                detail="Team ID is required for manager accounts"
-            )
-    else:
-        # 관리자 계정의 경우 work_record.team_id 사용 (필수)
-        if not work_record.team_id or not work_record.team_id.strip():
-            raise HTTPException(
-                status_code=400,
-                detail="Team ID is required"
-            )
-        final_team_id = work_record.team_id
-    
-    # Log for debugging
-    print(f"Creating work record - team_id: {final_team_id}, worker_name: {work_record.worker_name}, current_user role: {current_user.get('role')}, current_user team_id: {current_user.get('team_id')}, work_record.team_id: {work_record.team_id}")
+    final_team_id = resolve_write_team_id(current_user, work_record.team_id)
     
+    logger.debug(
+        "Creating work record - team_id=%s worker_name=%s role=%s",
+        final_team_id, work_record.worker_name, current_user.get("role"),
+    )
+
     db_work_record = WorkRecord(
         id=str(uuid.uuid4()),
         worker_id=work_record.worker_id,
@@ -132,12 +98,90 @@ def create_work_record(
         created_by=work_record.created_by,
     )
     db.add(db_work_record)
+    DailySummaryService.refresh(db, [(final_team_id, db_work_record.work_date)])
     db.commit()
     db.refresh(db_work_record)
-    print(f"Created work record - id: {db_work_record.id}, team_id: {db_work_record.team_id}")
+    logger.debug("Created work record - id=%s team_id=%s", db_work_record.id, db_work_record.team_id)
     return db_work_record
 
 
+@router.post("/bulk", response_model=List[WorkRecordResponse])
+def create_work_records_bulk(
+    work_records: List[WorkRecordCreate] = Body(..., max_length=MAX_BULK_RECORDS),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Create a day's work records in a single transaction"""
+    # 팀 권한은 요청에 포함된 팀별로 한 번만 검증
+    final_team_ids = {
+        team_id: resolve_write_team_id(current_user, team_id)
+        for team_id in {record.team_id for record in work_records}
+    }
+
+    now = datetime.utcnow()
+    rows = [
+        {
+            "id": str(uuid.uuid4()),
+            "worker_id": record.worker_id,
+            "worker_name": record.worker_name,
+            "site_name": record.site_name,
+            "work_date": record.work_date,
+            "work_hours": record.work_hours,
+            "notes": record.notes,
+            "team_id": final_team_ids[record.team_id],
+            "created_by": record.created_by,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for record in work_records
+    ]
+    if rows:
+        # executemany로 한 번에 INSERT 후 한 번만 커밋
+        db.execute(insert(WorkRecord), rows)
+        DailySummaryService.refresh(db, {(row["team_id"], row["work_date"]) for row in rows})
+        db.commit()
+    return rows
+
+
+@router.get("/export")
+def export_work_records(
+    export_format: str = Query("ndjson", alias="format", pattern=EXPORT_FORMAT_PATTERN),
+    team_id: Optional[str] = Query(None),
+    date_from: Optional[date] = Query(None),
+    date_to: Optional[date] = Query(None),
+    current_user: dict = Depends(get_current_user),
+):
+    """Stream work records as NDJSON or CSV (server-side cursor, constant memory)"""
+    return export_records(
+        WorkRecord, WorkRecordResponse, current_user, team_id, date_from, date_to, export_format, "work-records"
+    )
+
+
+@router.get("/latest", response_model=List[WorkRecordResponse])
+def get_latest_work_records(
+    team_id: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Get work records of the team's most recent work date"""
+    allowed, scoped_team_id = resolve_team_scope(current_user, team_id)
+    if not allowed:
+        return []
+
+    # MAX(work_date)는 team_id/work_date 인덱스로 조회
+    latest_query = db.query(func.max(WorkRecord.work_date))
+    if scoped_team_id:
+        latest_query = latest_query.filter(WorkRecord.team_id == scoped_team_id)
+    latest_date = latest_query.scalar()
+    if latest_date is None:
+        return []
+
+    query = db.query(WorkRecord).filter(WorkRecord.work_date == latest_date)
+    if scoped_team_id:
+        query = query.filter(WorkRecord.team_id == scoped_team_id)
+    return query.order_by(WorkRecord.created_at, WorkRecord.id).all()
+
+
 @router.get("/{record_id}", response_model=WorkRecordResponse)
 def get_work_record(
     record_id: str,
@@ -194,7 +238,8 @@ def update_work_record(
     if work_record.notes is not None:
         db_record.notes = work_record.notes
     db_record.updated_at = datetime.utcnow()
-    
+    DailySummaryService.refresh(db, [(db_record.team_id, db_record.work_date)])
+
     db.commit()
     db.refresh(db_record)
     return db_record
@@ -221,5 +266,6 @@ def delete_work_record(
             )
     
     db.delete(record)
+    DailySummaryService.refresh(db, [(record.team_id, record.work_date)])
     db.commit()
     return {"message": "Work record deleted successfully"}
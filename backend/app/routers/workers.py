@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 import uuid
+from app.conditional import conditional_response, query_etag
 from app.database import get_db
 from app.models.worker import Worker
+from app.read_cache import read_cache
 from app.schemas.worker import WorkerCreate, WorkerResponse
 from app.security import get_current_user
 
@@ -12,12 +14,15 @@ router = APIRouter(prefix="/workers", tags=["workers"])
 
 @router.get("", response_model=List[WorkerResponse])
 def get_workers(
+    response: Response,
     team_id: Optional[str] = Query(None),
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
     """Get workers by team ID (optional)"""
     query = db.query(Worker)
+    scope = None
     
     # Role-based filtering
     if current_user.get("role") == "manager":
@@ -25,11 +30,20 @@ def get_workers(
         user_team_id = current_user.get("team_id")
         if user_team_id:
             query = query.filter(Worker.team_id == user_team_id)
+            scope = user_team_id
     elif team_id:
         # Admins can filter by team_id
         query = query.filter(Worker.team_id == team_id)
-    
-    return query.all()
+        scope = team_id
+
+    def load():
+        return query_etag(query, Worker, scope), [WorkerResponse.model_validate(w) for w in query.all()]
+
+    etag, workers = read_cache.get_or_load("workers", scope or "*", load)
+    not_modified = conditional_response(response, etag, if_none_match)
+    if not_modified:
+        return not_modified
+    return workers
 
 
 @router.post("", response_model=WorkerResponse)
@@ -42,6 +56,7 @@ def create_worker(
     db_worker = Worker(id=str(uuid.uuid4()), name=worker.name, team_id=worker.team_id)
     db.add(db_worker)
     db.commit()
+    read_cache.invalidate("workers")
     db.refresh(db_worker)
     return db_worker
 
@@ -72,4 +87,5 @@ def delete_worker(
 
     db.delete(worker)
     db.commit()
+    read_cache.invalidate("workers")
     return {"message": "Worker deleted successfully"}
@@ -3,6 +3,13 @@ from .team import TeamCreate, TeamResponse
 from .worker import WorkerCreate, WorkerResponse
 from .work_record import WorkRecordCreate, WorkRecordUpdate, WorkRecordResponse
 from .equipment_record import EquipmentRecordCreate, EquipmentRecordResponse
+from .report import (
+    WorkerSiteSummary,
+    WorkerMonthlySummary,
+    EquipmentMonthlySummary,
+    MonthlyReportResponse,
+    DailyTeamSummaryResponse,
+)
 
 __all__ = [
     "UserCreate",
@@ -17,4 +24,9 @@ __all__ = [
     "WorkRecordResponse",
     "EquipmentRecordCreate",
     "EquipmentRecordResponse",
+    "WorkerSiteSummary",
+    "WorkerMonthlySummary",
+    "EquipmentMonthlySummary",
+    "MonthlyReportResponse",
+    "DailyTeamSummaryResponse",
 ]
@@ -0,0 +1,39 @@
+from pydantic import BaseModel
+from datetime import date
+from typing import Dict, List, Optional
+
+
+class WorkerSiteSummary(BaseModel):
+    site_name: str
+    work_days: int
+    total_hours: float
+
+
+class WorkerMonthlySummary(BaseModel):
+    team_id: str
+    worker_name: str
+    sites: List[WorkerSiteSummary]
+
+
+class EquipmentMonthlySummary(BaseModel):
+    equipment_type: str
+    total_quantity: int
+
+
+class MonthlyReportResponse(BaseModel):
+    month: str  # YYYY-MM
+    team_id: Optional[str]
+    workers: List[WorkerMonthlySummary]
+    equipment: List[EquipmentMonthlySummary]
+
+
+class DailyTeamSummaryResponse(BaseModel):
+    team_id: str
+    work_date: date
+    worker_count: int
+    work_record_count: int
+    total_hours: float
+    equipment_quantities: Dict[str, int]
+
+    class Config:
+        from_attributes = True
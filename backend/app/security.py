@@ -1,17 +1,42 @@
 import os
+import time
+import asyncio
 import hashlib
+import logging
 import secrets
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 from jose import JWTError, jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
+logger = logging.getLogger(__name__)
+
 # JWT configuration
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-this-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 
+# 검증된 토큰 캐시 (0이면 비활성화)
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "1024"))
+
+# 웹 서버 워커 프로세스 수 (gunicorn / uvicorn --workers)
+WEB_CONCURRENCY = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+
+# PBKDF2 해시 전용 프로세스 풀 (동시 해시 수 / 대기 가능한 최대 요청 수)
+# 기본값은 웹 워커끼리 CPU를 나눠 쓰도록 워커 수로 나눔
+PASSWORD_HASH_WORKERS = int(
+    os.getenv(
+        "PASSWORD_HASH_WORKERS",
+        str(min(4, max(1, (os.cpu_count() or 1) // WEB_CONCURRENCY))),
+    )
+)
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))
+
 # Security
 security = HTTPBearer()
 
@@ -46,6 +71,126 @@ def get_password_hash(password: str) -> str:
     return f"pbkdf2${salt}${password_hash}"
 
 
+class PasswordHashPool:
+    """
+    Bounded process pool for PBKDF2 hashing.
+    로그인/회원가입의 해시 계산이 요청 스레드풀과 이벤트 루프를 점유하지 않도록 별도 프로세스에서 실행합니다.
+    대기 중인 요청이 max_pending을 넘으면 503으로 즉시 거절합니다.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = max(1, workers)
+        self.max_pending = max_pending
+        self._executor = None
+        self._lock = threading.Lock()
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self.pending = 0
+        self.peak_pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+    def _after_fork_in_child(self):
+        # 포크된 워커 프로세스는 부모의 풀을 사용할 수 없으므로 새로 생성
+        self._executor = None
+        self._lock = threading.Lock()
+        self._reset_stats()
+
+    async def run(self, func, *args):
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Too many concurrent login requests, please retry",
+                    headers={"Retry-After": "1"},
+                )
+            self.pending += 1
+            self.peak_pending = max(self.peak_pending, self.pending)
+
+        started = time.perf_counter()
+        succeeded = False
+        executor = None
+        try:
+            executor = self._get_executor()
+            result = await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+            succeeded = True
+            return result
+        except BrokenProcessPool:
+            # 워커 프로세스가 죽은 경우 다음 요청에서 풀을 다시 생성
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            executor.shutdown(wait=False)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Password hashing is temporarily unavailable",
+                headers={"Retry-After": "1"},
+            )
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.pending -= 1
+                # 평균/최대 시간은 성공한 해시만 집계 (실패는 별도 카운터)
+                if succeeded:
+                    self.completed += 1
+                    self.total_seconds += elapsed
+                    self.max_seconds = max(self.max_seconds, elapsed)
+                else:
+                    self.failed += 1
+
+    def map(self, func, items: list) -> list:
+        """Run func over items in parallel and block (startup only, uses a short-lived pool)"""
+        if len(items) <= 1 or self.workers <= 1:
+            return [func(item) for item in items]
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(items))) as executor:
+            return list(executor.map(func, items))
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "pending": self.pending,
+                "peak_pending": self.peak_pending,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "avg_ms": round(self.total_seconds / self.completed * 1000, 2) if self.completed else 0.0,
+                "max_ms": round(self.max_seconds * 1000, 2),
+            }
+
+
+password_pool = PasswordHashPool(PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_PENDING)
+os.register_at_fork(after_in_child=password_pool._after_fork_in_child)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """get_password_hash on the password hashing pool"""
+    return await password_pool.run(get_password_hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password on the password hashing pool"""
+    return await password_pool.run(verify_password, plain_password, hashed_password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     if expires_delta:
@@ -65,14 +210,150 @@ def verify_token(token: str) -> dict:
         return None
 
 
+class TokenCache:
+    """
+    Bounded LRU cache of verified JWT payloads, valid until the token's exp.
+    키는 토큰 원문 대신 SHA-256 해시를 사용하며, 실패한 검증은 캐시하지 않습니다.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> Optional[dict]:
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, payload = entry
+                if expires_at > time.time():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return payload
+                # 만료된 토큰은 제거하고 다시 검증 (jose가 401 처리)
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, token: str, payload: dict) -> None:
+        exp = payload.get("exp")
+        if self.maxsize <= 0 or not isinstance(exp, (int, float)):
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (exp, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+token_cache = TokenCache(TOKEN_CACHE_SIZE)
+
+
+def verify_token_cached(token: str) -> Optional[dict]:
+    """verify_token with the payload cached until the token expires"""
+    payload = token_cache.get(token)
+    if payload is None:
+        payload = verify_token(token)
+        if payload is not None:
+            token_cache.put(token, payload)
+    # 호출 측에서 수정해도 캐시가 오염되지 않도록 복사본 반환
+    return dict(payload) if payload is not None else None
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ):
     token = credentials.credentials
-    payload = verify_token(token)
+    payload = verify_token_cached(token)
     if payload is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
         )
     return payload
+
+
+def resolve_team_scope(current_user: dict, team_id: Optional[str]) -> Tuple[bool, Optional[str]]:
+    """
+    조회 대상 팀을 권한에 맞게 결정합니다.
+    Returns (allowed, team_id): team_id가 None이면 모든 팀 (관리자 전용).
+    """
+    if current_user.get("role") == "manager":
+        # Managers can only see their team's records
+        user_team_id = current_user.get("team_id")
+        if not user_team_id or not str(user_team_id).strip():
+            logger.warning("Manager token without team_id - sub=%s", current_user.get("sub"))
+            return False, None
+
+        user_team_id_str = str(user_team_id).strip()
+        if team_id and str(team_id).strip() != user_team_id_str:
+            logger.warning(
+                "Manager tried to access another team - user_team_id=%s requested=%s",
+                user_team_id_str, team_id,
+            )
+            raise HTTPException(
+                status_code=403,
+                detail="You can only access your own team's records"
+            )
+        return True, user_team_id_str
+    elif current_user.get("role") == "admin":
+        # Admins can filter by team_id parameter
+        return True, team_id or None
+
+    # 다른 역할은 접근 불가
+    return False, None
+
+
+def resolve_write_team_id(current_user: dict, team_id: Optional[str]) -> str:
+    """
+    기록을 생성할 팀을 권한에 맞게 결정합니다.
+    팀 계정(manager)은 자신의 팀에만, 관리자는 요청한 팀에 기록할 수 있습니다.
+    """
+    if current_user.get("role") == "manager":
+        user_team_id = current_user.get("team_id")
+        # user_team_id가 없으면 에러 (팀 계정은 반드시 team_id가 있어야 함)
+        if not user_team_id:
+            raise HTTPException(
+                status_code=400,
+                detail="Team ID is required for manager accounts"
+            )
+        if team_id and team_id != user_team_id:
+            raise HTTPException(
+                status_code=403,
+                detail="Managers can only create records for their own team"
+            )
+        # team_id가 없거나 빈 문자열이면 user_team_id 사용
+        return team_id if (team_id and team_id.strip()) else user_team_id
+
+    # 관리자 계정의 경우 요청한 team_id 사용 (필수)
+    if not team_id or not team_id.strip():
+        raise HTTPException(
+            status_code=400,
+            detail="Team ID is required"
+        )
+    return team_id
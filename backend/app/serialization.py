@@ -0,0 +1,42 @@
+"""
+Fast path for large list responses
+ORM 객체 + Pydantic(from_attributes) 변환 대신, 응답 스키마에 필요한 컬럼만 행 튜플로 조회해
+orjson으로 바로 직렬화합니다. orjson이 없거나 FAST_LIST_RESPONSES=false이면 기존 경로를 사용합니다.
+"""
+
+import os
+from typing import List, Sequence
+from fastapi import Response
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+FAST_LIST_RESPONSES = (
+    orjson is not None
+    and os.getenv("FAST_LIST_RESPONSES", "true").lower() in ("1", "true", "yes")
+)
+
+
+class ORJSONRowsResponse(Response):
+    """JSON response for a list of SQLAlchemy rows, encoded with orjson"""
+
+    media_type = "application/json"
+
+    def render(self, content: Sequence) -> bytes:
+        return orjson.dumps([row._asdict() for row in content])
+
+
+def response_columns(schema: type[BaseModel], model) -> List:
+    """Model columns matching the response schema's fields, in schema order"""
+    return [getattr(model, name) for name in schema.model_fields]
+
+
+def rows_response(rows: Sequence, response: Response) -> ORJSONRowsResponse:
+    """Build the fast-path response, keeping headers set on the injected Response (X-Next-Cursor)"""
+    headers = {
+        key: value for key, value in response.headers.items() if key != "content-length"
+    }
+    return ORJSONRowsResponse(rows, headers=headers)
@@ -1,7 +1,13 @@
 import uuid
-from datetime import timedelta
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import delete, func, insert, update
 from sqlalchemy.orm import Session
 from app.models.user import User
+from app.models.work_record import WorkRecord
+from app.models.equipment_record import EquipmentRecord
+from app.models.daily_team_summary import DailyTeamSummary
+from app.models.team_version import TeamVersion
 from app.schemas.user import UserCreate, UserLogin
 from app.security import (
     get_password_hash,
@@ -11,13 +17,24 @@ from app.security import (
 )
 
 
+def dialect_insert(dialect: str):
+    """INSERT construct supporting ON CONFLICT DO UPDATE for the given dialect"""
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as upsert_insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as upsert_insert
+    else:
+        raise NotImplementedError(f"Upsert is not supported on {dialect}")
+    return upsert_insert
+
+
 class AuthService:
     @staticmethod
-    def create_user(db: Session, user: UserCreate) -> User:
+    def create_user(db: Session, user: UserCreate, password_hash: Optional[str] = None) -> User:
         db_user = User(
             id=str(uuid.uuid4()),
             email=user.email,
-            password=get_password_hash(user.password),
+            password=password_hash or get_password_hash(user.password),
             role=user.role,
             team_id=user.team_id,
             team_name=user.team_name,
@@ -29,10 +46,13 @@ class AuthService:
 
     @staticmethod
     def authenticate_user(db: Session, user: UserLogin) -> dict:
-        db_user = db.query(User).filter(User.email == user.email).first()
+        db_user = AuthService.get_user_by_email(db, user.email)
         if not db_user or not verify_password(user.password, db_user.password):
             return None
+        return AuthService.build_login_response(db_user)
 
+    @staticmethod
+    def build_login_response(db_user: User) -> dict:
         access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = create_access_token(
             data={
@@ -56,6 +76,294 @@ class AuthService:
             },
         }
 
+    @staticmethod
+    def get_user_by_email(db: Session, email: str) -> User:
+        return db.query(User).filter(User.email == email).first()
+
     @staticmethod
     def get_user_by_id(db: Session, user_id: str) -> User:
         return db.query(User).filter(User.id == user_id).first()
+
+
+class EquipmentRecordService:
+    @staticmethod
+    def build_accumulate_statement(dialect: str, rows: List[dict]):
+        """
+        (team_id, work_date, equipment_type)별 수량 누적용 INSERT ... ON CONFLICT DO UPDATE 문과
+        executemany 파라미터를 만듭니다. 기존 행이 있으면 quantity += excluded.quantity 입니다.
+        """
+        upsert_insert = dialect_insert(dialect)
+
+        now = datetime.utcnow()
+        values = [
+            {**row, "id": str(uuid.uuid4()), "created_at": now, "updated_at": now}
+            for row in rows
+        ]
+        stmt = upsert_insert(EquipmentRecord)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["team_id", "work_date", "equipment_type"],
+            set_={
+                "quantity": EquipmentRecord.quantity + stmt.excluded.quantity,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        ).returning(EquipmentRecord, sort_by_parameter_order=True)
+        return stmt, values
+
+    @staticmethod
+    def accumulate_quantities(db: Session, rows: List[dict]) -> List[EquipmentRecord]:
+        """
+        수량을 한 번의 UPSERT로 누적합니다.
+        rows에는 같은 키가 중복되지 않아야 하며, 커밋은 호출하는 쪽에서 합니다.
+        """
+        if not rows:
+            return []
+
+        stmt, values = EquipmentRecordService.build_accumulate_statement(
+            db.get_bind().dialect.name, rows
+        )
+        return list(
+            db.scalars(stmt, values, execution_options={"populate_existing": True})
+        )
+
+
+class TeamVersionService:
+    @staticmethod
+    def bump(db: Session, team_ids: Iterable[str]) -> None:
+        """
+        팀별 버전을 1 올립니다 (행이 없으면 1로 생성). 기록을 바꾼 트랜잭션 안에서 호출하며,
+        팀 순서를 고정해 여러 팀을 바꾸는 트랜잭션끼리 교착하지 않도록 합니다.
+        """
+        team_ids = sorted({team_id for team_id in team_ids if team_id})
+        if not team_ids:
+            return
+        now = datetime.utcnow()
+        stmt = dialect_insert(db.get_bind().dialect.name)(TeamVersion)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["team_id"],
+            set_={"version": TeamVersion.version + 1, "updated_at": stmt.excluded.updated_at},
+        )
+        db.execute(stmt, [{"team_id": team_id, "version": 1, "updated_at": now} for team_id in team_ids])
+
+
+class DailySummaryService:
+    @staticmethod
+    def compute(db: Session, team_id: str, work_dates: Optional[Iterable[date]] = None) -> Dict[date, dict]:
+        """
+        한 팀의 일별 집계를 원본 기록에서 계산합니다.
+        work_dates가 None이면 팀의 전체 기간을 계산합니다 (rebuild).
+        """
+        work_query = db.query(
+            WorkRecord.work_date,
+            func.count(func.distinct(WorkRecord.worker_id)),
+            func.count(WorkRecord.id),
+            func.coalesce(func.sum(WorkRecord.work_hours), 0),
+        ).filter(WorkRecord.team_id == team_id)
+        equipment_query = db.query(
+            EquipmentRecord.work_date,
+            EquipmentRecord.equipment_type,
+            func.coalesce(func.sum(EquipmentRecord.quantity), 0),
+        ).filter(EquipmentRecord.team_id == team_id)
+        if work_dates is not None:
+            work_dates = list(work_dates)
+            work_query = work_query.filter(WorkRecord.work_date.in_(work_dates))
+            equipment_query = equipment_query.filter(EquipmentRecord.work_date.in_(work_dates))
+
+        def empty_summary(work_date: date) -> dict:
+            return {
+                "team_id": team_id,
+                "work_date": work_date,
+                "worker_count": 0,
+                "work_record_count": 0,
+                "total_hours": 0.0,
+                "equipment_quantities": {},
+            }
+
+        summaries = {}
+        for work_date, worker_count, record_count, total_hours in work_query.group_by(
+            WorkRecord.work_date
+        ):
+            summary = summaries.setdefault(work_date, empty_summary(work_date))
+            summary["worker_count"] = worker_count
+            summary["work_record_count"] = record_count
+            summary["total_hours"] = float(total_hours)
+        for work_date, equipment_type, quantity in equipment_query.group_by(
+            EquipmentRecord.work_date, EquipmentRecord.equipment_type
+        ).order_by(EquipmentRecord.equipment_type):
+            summary = summaries.setdefault(work_date, empty_summary(work_date))
+            summary["equipment_quantities"][equipment_type] = int(quantity)
+        return summaries
+
+    @staticmethod
+    def refresh(db: Session, keys: Iterable[Tuple[str, date]]) -> None:
+        """
+        (team_id, work_date) 키의 일별 집계를 다시 계산해 daily_team_summary에 반영합니다.
+        기록을 변경한 뒤 같은 트랜잭션에서 커밋 전에 호출합니다.
+        """
+        keys = sorted({(team_id, work_date) for team_id, work_date in keys if team_id and work_date})
+        if not keys:
+            return
+        db.flush()
+
+        # 요약 행을 먼저 잠가 같은 팀/날짜를 갱신하는 트랜잭션을 직렬화 (키 순서 고정으로 교착 방지)
+        now = datetime.utcnow()
+        upsert_insert = dialect_insert(db.get_bind().dialect.name)
+        lock_stmt = upsert_insert(DailyTeamSummary)
+        lock_stmt = lock_stmt.on_conflict_do_update(
+            index_elements=["team_id", "work_date"],
+            set_={"updated_at": lock_stmt.excluded.updated_at},
+        )
+        db.execute(
+            lock_stmt,
+            [
+                {
+                    "team_id": team_id,
+                    "work_date": work_date,
+                    "worker_count": 0,
+                    "work_record_count": 0,
+                    "total_hours": 0.0,
+                    "equipment_quantities": {},
+                    "updated_at": now,
+                }
+                for team_id, work_date in keys
+            ],
+        )
+
+        dates_by_team = {}
+        for team_id, work_date in keys:
+            dates_by_team.setdefault(team_id, []).append(work_date)
+
+        updates = []
+        for team_id, work_dates in dates_by_team.items():
+            summaries = DailySummaryService.compute(db, team_id, work_dates)
+            for work_date in work_dates:
+                summary = summaries.get(work_date)
+                if summary is None:
+                    # 남은 기록이 없는 날짜는 요약 행 삭제
+                    db.execute(
+                        delete(DailyTeamSummary).where(
+                            DailyTeamSummary.team_id == team_id,
+                            DailyTeamSummary.work_date == work_date,
+                        )
+                    )
+                else:
+                    updates.append({**summary, "updated_at": now})
+        if updates:
+            db.execute(update(DailyTeamSummary), updates)
+
+        # 기록이 바뀐 팀의 목록 ETag가 같은 커밋에서 바뀌도록 버전도 함께 올림 (요약 행 다음에 잠금)
+        TeamVersionService.bump(db, dates_by_team)
+
+    @staticmethod
+    def rebuild(db: Session) -> int:
+        """Recompute the whole table from raw records (backfill). Returns the row count; caller commits"""
+        db.execute(delete(DailyTeamSummary))
+        team_ids = db.query(WorkRecord.team_id).union(db.query(EquipmentRecord.team_id)).all()
+
+        now = datetime.utcnow()
+        total = 0
+        for (team_id,) in team_ids:
+            if not team_id:
+                continue
+            rows = [
+                {**summary, "updated_at": now}
+                for summary in DailySummaryService.compute(db, team_id).values()
+            ]
+            if rows:
+                db.execute(insert(DailyTeamSummary), rows)
+                total += len(rows)
+        return total
+
+
+class ReportService:
+    @staticmethod
+    def month_range(month: str) -> tuple:
+        """Return [start, end) dates for a YYYY-MM month string"""
+        year, month_num = (int(part) for part in month.split("-"))
+        start = date(year, month_num, 1)
+        if month_num == 12:
+            end = date(year + 1, 1, 1)
+        else:
+            end = date(year, month_num + 1, 1)
+        return start, end
+
+    @staticmethod
+    def work_summary_query(db: Session, start: date, end: date, team_id: Optional[str]):
+        """(team_id, worker_name, site_name, work_days, total_hours) rows for [start, end)"""
+        work_query = db.query(
+            WorkRecord.team_id,
+            WorkRecord.worker_name,
+            WorkRecord.site_name,
+            func.count(WorkRecord.id),
+            func.coalesce(func.sum(WorkRecord.work_hours), 0),
+        ).filter(WorkRecord.work_date >= start, WorkRecord.work_date < end)
+        if team_id:
+            work_query = work_query.filter(WorkRecord.team_id == team_id)
+        return work_query.group_by(
+            WorkRecord.team_id, WorkRecord.worker_name, WorkRecord.site_name
+        ).order_by(WorkRecord.team_id, WorkRecord.worker_name, WorkRecord.site_name)
+
+    @staticmethod
+    def equipment_summary_query(db: Session, start: date, end: date, team_id: Optional[str]):
+        """(equipment_type, total_quantity) rows for [start, end)"""
+        equipment_query = db.query(
+            EquipmentRecord.equipment_type,
+            func.coalesce(func.sum(EquipmentRecord.quantity), 0),
+        ).filter(EquipmentRecord.work_date >= start, EquipmentRecord.work_date < end)
+        if team_id:
+            equipment_query = equipment_query.filter(EquipmentRecord.team_id == team_id)
+        return equipment_query.group_by(EquipmentRecord.equipment_type).order_by(
+            EquipmentRecord.equipment_type
+        )
+
+    @staticmethod
+    def active_team_ids(db: Session, month: str, team_id: Optional[str]) -> List[str]:
+        """Teams with any work or equipment record in the month, sorted"""
+        if team_id:
+            return [team_id]
+        start, end = ReportService.month_range(month)
+        work_teams = db.query(WorkRecord.team_id).filter(
+            WorkRecord.work_date >= start, WorkRecord.work_date < end
+        )
+        equipment_teams = db.query(EquipmentRecord.team_id).filter(
+            EquipmentRecord.work_date >= start, EquipmentRecord.work_date < end
+        )
+        rows = work_teams.union(equipment_teams).all()
+        return sorted(row[0] for row in rows if row[0])
+
+    @staticmethod
+    def monthly_report(db: Session, month: str, team_id: Optional[str]) -> dict:
+        """
+        월별 작업자/현장별 공수와 장비 타입별 수량을 DB에서 GROUP BY로 집계합니다.
+        team_id가 None이면 모든 팀을 집계합니다 (관리자 전용).
+        """
+        start, end = ReportService.month_range(month)
+        work_rows = ReportService.work_summary_query(db, start, end, team_id).all()
+
+        workers = {}
+        for row_team_id, worker_name, site_name, work_days, total_hours in work_rows:
+            key = (row_team_id, worker_name)
+            if key not in workers:
+                workers[key] = {
+                    "team_id": row_team_id,
+                    "worker_name": worker_name,
+                    "sites": [],
+                }
+            workers[key]["sites"].append(
+                {
+                    "site_name": site_name or "",
+                    "work_days": work_days,
+                    "total_hours": float(total_hours),
+                }
+            )
+
+        equipment_rows = ReportService.equipment_summary_query(db, start, end, team_id).all()
+
+        return {
+            "month": month,
+            "team_id": team_id,
+            "workers": list(workers.values()),
+            "equipment": [
+                {"equipment_type": equipment_type, "total_quantity": int(total_quantity)}
+                for equipment_type, total_quantity in equipment_rows
+            ],
+        }
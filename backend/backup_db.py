@@ -1,65 +1,387 @@
 #!/usr/bin/env python3
 """
 데이터베이스 백업 스크립트
-매일 실행되어 SQLite 데이터베이스를 백업하고, 최근 10개만 유지합니다.
+SQLite 온라인 백업 API로 일관된 사본을 만든 뒤, 직전 백업과 달라진 페이지만 압축해 저장합니다(차분).
+BACKUP_FULL_EVERY번마다 전체 스냅샷을 만들고, 최근 BACKUP_KEEP_FULL개 체인(전체 + 이후 차분)만 유지합니다.
+
+한계: 차분은 저장 용량과 압축 시간만 줄입니다. 바뀐 페이지를 찾기 위해 실행마다 DB 전체를 임시 사본으로
+복사하고 모든 페이지의 해시를 계산하므로, 실행 시간과 읽기/쓰기량은 변경량이 아니라 DB 크기에 비례합니다
+(WAL 세그먼트를 보관하는 방식이 아님). 그 비용이 커지면 파일 시스템/볼륨 스냅샷이나 WAL 아카이빙 도구를 사용하세요.
+
+백업 디렉토리 구성:
+    full_YYYYmmdd_HHMMSS_ffffff.db[.gz|.zst]      전체 스냅샷
+    delta_YYYYmmdd_HHMMSS_ffffff.pages[.gz|.zst]  직전 백업 이후 바뀐 페이지
+    manifest.json                                  스냅샷 목록 (시각, 체인, 페이지 수, 테이블별 행 수, sha256)
+    latest.pagehash                                마지막 백업의 페이지별 해시 (다음 차분 계산용)
+
+사용법:
+    python backup_db.py          # 차분 백업 (필요하면 전체)
+    python backup_db.py --full   # 전체 스냅샷 강제
 """
 import os
-import shutil
-import glob
-from datetime import datetime
+import sys
+import gzip
+import json
+import time
+import struct
+import sqlite3
+import hashlib
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import zstandard
+except ImportError:  # zstd 압축은 선택 사항 (pip install zstandard)
+    zstandard = None
+
 # 설정
 DB_PATH = os.getenv("DATABASE_URL", "sqlite:///./data/test.db").replace("sqlite:///", "")
 BACKUP_DIR = os.getenv("BACKUP_DIR", "/app/backups")
-MAX_BACKUPS = 10
+# gzip | zstd | none
+BACKUP_COMPRESSION = os.getenv("BACKUP_COMPRESSION", "gzip").lower()
+BACKUP_COMPRESSION_LEVEL = os.getenv("BACKUP_COMPRESSION_LEVEL")
+# 전체 스냅샷 주기 (차분 N-1번 후 전체 1번) / 유지할 체인 수
+BACKUP_FULL_EVERY = int(os.getenv("BACKUP_FULL_EVERY", "7"))
+BACKUP_KEEP_FULL = int(os.getenv("BACKUP_KEEP_FULL", "2"))
+# 온라인 백업: 한 번에 복사할 페이지 수, 단계 사이 대기(초), 원본 변경으로 다시 시작된 횟수 한도
+BACKUP_PAGES_PER_STEP = int(os.getenv("BACKUP_PAGES_PER_STEP", "1024"))
+BACKUP_STEP_SLEEP = float(os.getenv("BACKUP_STEP_SLEEP", "0.005"))
+BACKUP_MAX_RESTARTS = int(os.getenv("BACKUP_MAX_RESTARTS", "3"))
+
+MANIFEST_NAME = "manifest.json"
+PAGEHASH_NAME = "latest.pagehash"
+STAGING_NAME = ".staging.db"
+DELTA_MAGIC = b"SQLITE-PAGES\x00\x01"
+DELTA_HEADER = struct.Struct(">IIQ")  # page_size, page_count, changed_pages
+PAGE_NUMBER = struct.Struct(">I")
+DIGEST_SIZE = 8
+SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+COPY_CHUNK = 1024 * 1024
+
+
+class BackupRestarted(Exception):
+    """원본이 계속 변경되어 단계별 백업이 처음부터 다시 시작됨"""
+
 
 def ensure_backup_dir():
     """백업 디렉토리가 없으면 생성"""
     Path(BACKUP_DIR).mkdir(parents=True, exist_ok=True)
 
-def backup_database():
+
+def resolve_compression(compression: str) -> str:
+    if compression not in SUFFIXES:
+        print(f"경고: 알 수 없는 압축 방식 {compression}, gzip을 사용합니다.")
+        return "gzip"
+    if compression == "zstd" and zstandard is None:
+        print("경고: zstandard 패키지가 없어 gzip을 사용합니다.")
+        return "gzip"
+    return compression
+
+
+def compression_of(filename: str) -> str:
+    for compression, suffix in SUFFIXES.items():
+        if suffix and filename.endswith(suffix):
+            return compression
+    return "none"
+
+
+@contextmanager
+def open_compressed(path: str, mode: str, compression: str):
+    """Binary file object that (de)compresses with gzip/zstd/none"""
+    level = BACKUP_COMPRESSION_LEVEL
+    if compression == "gzip":
+        handle = gzip.open(path, mode, compresslevel=int(level or 6))
+    elif compression == "zstd":
+        raw = open(path, mode)
+        if "w" in mode:
+            handle = zstandard.ZstdCompressor(level=int(level or 3)).stream_writer(raw, closefd=True)
+        else:
+            handle = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+    else:
+        handle = open(path, mode)
+    try:
+        yield handle
+    finally:
+        handle.close()
+
+
+@contextmanager
+def backup_lock():
+    """cron 실행이 겹치지 않도록 백업 디렉토리 잠금"""
+    if fcntl is None:
+        yield
+        return
+    with open(os.path.join(BACKUP_DIR, ".lock"), "a") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def online_backup(db_path: str, target_path: str):
+    """
+    SQLite 온라인 백업 API로 일관된 사본 생성.
+    BACKUP_PAGES_PER_STEP 페이지씩 복사하고 단계 사이에 잠금을 풀어 앱의 쓰기를 막지 않습니다.
+    복사 도중 다른 연결이 쓰면 백업이 처음부터 다시 시작되므로, 한도를 넘으면 한 번에 복사합니다
+    (WAL 모드에서는 읽기 트랜잭션만 유지하므로 이때도 쓰기는 막지 않음).
+    """
+    source = sqlite3.connect(db_path)
+    target = sqlite3.connect(target_path)
+    state = {"restarts": 0, "last_remaining": None, "next_report": 0.1}
+
+    def progress(status, remaining, total):
+        if state["last_remaining"] is not None and remaining > state["last_remaining"]:
+            state["restarts"] += 1
+            if state["restarts"] > BACKUP_MAX_RESTARTS:
+                raise BackupRestarted()
+        state["last_remaining"] = remaining
+        done = (total - remaining) / total if total else 1.0
+        if done >= state["next_report"]:
+            print(f"백업 진행: {done:.0%} ({total - remaining:,}/{total:,} 페이지)")
+            state["next_report"] = int(done * 10) / 10 + 0.1
+
+    try:
+        try:
+            source.backup(target, pages=BACKUP_PAGES_PER_STEP, progress=progress, sleep=BACKUP_STEP_SLEEP)
+        except BackupRestarted:
+            print(f"원본이 계속 변경되어 단계별 복사가 {state['restarts']}번 다시 시작됨, 한 번에 복사합니다.")
+            source.backup(target)
+    finally:
+        target.close()
+        source.close()
+
+
+def read_page_size(path: str) -> int:
+    with open(path, "rb") as handle:
+        header = handle.read(100)
+    page_size = struct.unpack(">H", header[16:18])[0]
+    return 65536 if page_size == 1 else page_size
+
+
+def page_digest(page: bytes) -> bytes:
+    return hashlib.blake2b(page, digest_size=DIGEST_SIZE).digest()
+
+
+def iter_pages(path: str, page_size: int):
+    with open(path, "rb") as handle:
+        while True:
+            page = handle.read(page_size)
+            if not page:
+                break
+            yield page
+
+
+def table_row_counts(path: str) -> dict:
+    """테이블별 행 수 (복원 검증에 사용)"""
+    conn = sqlite3.connect(path)
+    try:
+        tables = [
+            row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+            )
+        ]
+        return {table: conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0] for table in tables}
+    finally:
+        conn.close()
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(COPY_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_manifest() -> dict:
+    path = os.path.join(BACKUP_DIR, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {"snapshots": []}
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def _write_atomic(path: str, data: bytes):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as handle:
+        handle.write(data)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, path)
+
+
+def save_manifest(manifest: dict):
+    data = json.dumps(manifest, ensure_ascii=False, indent=2).encode("utf-8")
+    _write_atomic(os.path.join(BACKUP_DIR, MANIFEST_NAME), data)
+
+
+def pagehash_digest(hashes: list) -> str:
+    """Digest of a page hash list, stored in the manifest to check latest.pagehash belongs to the last snapshot"""
+    return hashlib.blake2b(b"".join(hashes), digest_size=16).hexdigest()
+
+
+def load_page_hashes() -> list:
+    path = os.path.join(BACKUP_DIR, PAGEHASH_NAME)
+    if not os.path.exists(path):
+        return []
+    with open(path, "rb") as handle:
+        data = handle.read()
+    return [data[i:i + DIGEST_SIZE] for i in range(0, len(data), DIGEST_SIZE)]
+
+
+def write_full(staging_path: str, dest_path: str, compression: str, page_size: int) -> list:
+    """전체 스냅샷을 압축 저장하고 페이지별 해시 목록을 반환"""
+    hashes = []
+    with open_compressed(dest_path, "wb", compression) as out:
+        for page in iter_pages(staging_path, page_size):
+            hashes.append(page_digest(page))
+            out.write(page)
+    return hashes
+
+
+def write_delta(staging_path: str, dest_path: str, compression: str, page_size: int, previous: list):
+    """직전 백업과 해시가 다른 페이지만 저장하고 (페이지별 해시 목록, 바뀐 페이지 수)를 반환"""
+    hashes = []
+    changed = 0
+    page_count = os.path.getsize(staging_path) // page_size
+    with open_compressed(dest_path, "wb", compression) as out:
+        # 바뀐 페이지 수는 끝나야 알 수 있으므로 헤더에는 0을 쓰고, 복원 시에는 파일 끝까지 읽음
+        out.write(DELTA_MAGIC + DELTA_HEADER.pack(page_size, page_count, 0))
+        for page_number, page in enumerate(iter_pages(staging_path, page_size), start=1):
+            digest = page_digest(page)
+            hashes.append(digest)
+            if page_number > len(previous) or previous[page_number - 1] != digest:
+                out.write(PAGE_NUMBER.pack(page_number))
+                out.write(page)
+                changed += 1
+    return hashes, changed
+
+
+def prune(manifest: dict) -> list:
+    """최근 BACKUP_KEEP_FULL개 체인만 manifest에 남기고 빠진 항목을 반환 (파일 삭제는 remove_snapshots)"""
+    bases = [entry["name"] for entry in manifest["snapshots"] if entry["kind"] == "full"]
+    keep = set(bases[-BACKUP_KEEP_FULL:]) if BACKUP_KEEP_FULL > 0 else set(bases)
+    removed = [entry for entry in manifest["snapshots"] if entry["base"] not in keep]
+    manifest["snapshots"] = [entry for entry in manifest["snapshots"] if entry["base"] in keep]
+    return removed
+
+
+def remove_snapshots(entries: list):
+    for entry in entries:
+        file_path = os.path.join(BACKUP_DIR, entry["file"])
+        try:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            print(f"오래된 백업 삭제: {file_path}")
+        except Exception as e:
+            print(f"백업 파일 삭제 실패: {file_path}, 오류: {e}")
+
+
+def backup_database(force_full: bool = False):
     """데이터베이스 백업 실행"""
     try:
         # DB 파일 경로 확인
         if not os.path.exists(DB_PATH):
             print(f"경고: 데이터베이스 파일을 찾을 수 없습니다: {DB_PATH}")
             return False
-        
+
         # 백업 디렉토리 확인
         ensure_backup_dir()
-        
-        # 백업 파일명 생성 (타임스탬프 포함)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_filename = f"backup_{timestamp}.db"
-        backup_path = os.path.join(BACKUP_DIR, backup_filename)
-        
-        # 데이터베이스 파일 복사
-        shutil.copy2(DB_PATH, backup_path)
-        print(f"백업 완료: {backup_path}")
-        
-        # 최근 백업 파일 목록 가져오기 (시간순 정렬)
-        backup_files = glob.glob(os.path.join(BACKUP_DIR, "backup_*.db"))
-        backup_files.sort(key=os.path.getmtime, reverse=True)
-        
-        # 최근 10개만 유지하고 나머지 삭제
-        if len(backup_files) > MAX_BACKUPS:
-            files_to_delete = backup_files[MAX_BACKUPS:]
-            for file_path in files_to_delete:
-                try:
-                    os.remove(file_path)
-                    print(f"오래된 백업 삭제: {file_path}")
-                except Exception as e:
-                    print(f"백업 파일 삭제 실패: {file_path}, 오류: {e}")
-        
-        print(f"현재 백업 파일 수: {min(len(backup_files), MAX_BACKUPS)}/{MAX_BACKUPS}")
+        compression = resolve_compression(BACKUP_COMPRESSION)
+
+        with backup_lock():
+            started = time.perf_counter()
+            created_at = datetime.now(timezone.utc)
+            # 같은 초에 두 번 실행해도 이미 기록된 파일을 덮어쓰지 않도록 마이크로초까지 사용
+            timestamp = created_at.strftime("%Y%m%d_%H%M%S_%f")
+            staging_path = os.path.join(BACKUP_DIR, STAGING_NAME)
+            if os.path.exists(staging_path):
+                os.remove(staging_path)
+
+            try:
+                online_backup(DB_PATH, staging_path)
+                page_size = read_page_size(staging_path)
+                row_counts = table_row_counts(staging_path)
+
+                manifest = load_manifest()
+                snapshots = manifest["snapshots"]
+                previous = load_page_hashes()
+                last = snapshots[-1] if snapshots else None
+                chain_length = sum(1 for entry in snapshots if last and entry["base"] == last["base"])
+                use_full = (
+                    force_full
+                    or last is None
+                    or not previous
+                    or last.get("page_size") != page_size
+                    # 해시 파일이 마지막 manifest 항목의 것이 아니면 (기록 도중 실패 등) 차분을 만들 수 없음
+                    or last.get("pagehash") != pagehash_digest(previous)
+                    or chain_length >= BACKUP_FULL_EVERY
+                )
+
+                if use_full:
+                    name = f"full_{timestamp}"
+                    file_name = f"{name}.db{SUFFIXES[compression]}"
+                    hashes = write_full(staging_path, os.path.join(BACKUP_DIR, file_name), compression, page_size)
+                    pages_written = len(hashes)
+                    base = name
+                else:
+                    name = f"delta_{timestamp}"
+                    file_name = f"{name}.pages{SUFFIXES[compression]}"
+                    hashes, pages_written = write_delta(
+                        staging_path, os.path.join(BACKUP_DIR, file_name), compression, page_size, previous
+                    )
+                    base = last["base"]
+            finally:
+                if os.path.exists(staging_path):
+                    os.remove(staging_path)
+
+            file_path = os.path.join(BACKUP_DIR, file_name)
+            snapshots.append({
+                "name": name,
+                "kind": "full" if use_full else "delta",
+                "base": base,
+                "file": file_name,
+                "created_at": created_at.isoformat(),
+                "compression": compression,
+                "page_size": page_size,
+                "page_count": len(hashes),
+                "pages_written": pages_written,
+                "bytes": os.path.getsize(file_path),
+                "sha256": file_sha256(file_path),
+                "row_counts": row_counts,
+                "pagehash": pagehash_digest(hashes),
+            })
+            # manifest를 먼저 기록하고 해시 파일은 마지막에 교체. 그 사이에 실패하면 해시 파일의 digest가
+            # 마지막 항목의 pagehash와 달라 다음 실행이 전체 스냅샷을 만듦
+            removed = prune(manifest)
+            save_manifest(manifest)
+            _write_atomic(os.path.join(BACKUP_DIR, PAGEHASH_NAME), b"".join(hashes))
+            remove_snapshots(removed)
+
+        elapsed = time.perf_counter() - started
+        kind = "전체" if use_full else "차분"
+        # 차분도 DB 전체(len(hashes) 페이지)를 복사하고 해시를 비교한 결과임
+        print(
+            f"백업 완료 ({kind}): {file_path} - 저장 {pages_written:,}/{len(hashes):,} 페이지 "
+            f"(전체 {len(hashes) * page_size:,} bytes 복사/비교), "
+            f"{os.path.getsize(file_path):,} bytes, {elapsed:.1f}초"
+        )
+        chains = sum(1 for entry in manifest["snapshots"] if entry["kind"] == "full")
+        print(f"현재 백업: 스냅샷 {len(manifest['snapshots'])}개 (전체 스냅샷 체인 {chains}/{BACKUP_KEEP_FULL})")
         return True
-        
+
     except Exception as e:
         print(f"백업 중 오류 발생: {e}")
         return False
 
+
 if __name__ == "__main__":
-    success = backup_database()
+    success = backup_database(force_full="--full" in sys.argv[1:])
     exit(0 if success else 1)
-
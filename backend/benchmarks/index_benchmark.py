@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+복합 인덱스 벤치마크
+단일 컬럼 인덱스만 있는 상태(before)와 migrate_add_composite_indexes 적용 후(after)의
+쿼리 플랜과 지연 시간을 비교합니다. 목록 ETag는 이전 방식(기록 테이블의 count/max)과
+팀 버전(team_versions) 조회를 함께 측정합니다.
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.index_benchmark --rows 1000000
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+EQUIPMENT_TYPES = ["6w", "3w", "035", "덤프", "1t", "3.5t", "살수차", "모범수"]
+WORKERS_PER_TEAM_DAY = 8
+
+
+def build_queries(team_id: str, target_date: date):
+    month_start = target_date.replace(day=1)
+    return [
+        (
+            "team + date list (get_work_records)",
+            "SELECT * FROM work_records WHERE team_id = :team_id AND work_date = :work_date "
+            "ORDER BY work_date DESC, id DESC",
+            {"team_id": team_id, "work_date": target_date},
+        ),
+        (
+            "team + month range page (get_work_records)",
+            "SELECT * FROM work_records WHERE team_id = :team_id "
+            "AND work_date >= :date_from AND work_date <= :date_to "
+            "ORDER BY work_date DESC, id DESC LIMIT 100",
+            {"team_id": team_id, "date_from": month_start, "date_to": target_date},
+        ),
+        (
+            "latest work date (get_latest_work_records)",
+            "SELECT MAX(work_date) FROM work_records WHERE team_id = :team_id",
+            {"team_id": team_id},
+        ),
+        (
+            "team + date list (get_equipment_records)",
+            "SELECT * FROM equipment_records WHERE team_id = :team_id AND work_date = :work_date "
+            "ORDER BY work_date DESC, id DESC",
+            {"team_id": team_id, "work_date": target_date},
+        ),
+        (
+            "list ETag, old count/max(updated_at) (get_work_records)",
+            "SELECT count(id), max(updated_at) FROM work_records WHERE team_id = :team_id",
+            {"team_id": team_id},
+        ),
+        (
+            "admin listing ETag, old count/max(updated_at)",
+            "SELECT count(id), max(updated_at) FROM work_records",
+            {},
+        ),
+        (
+            "list ETag, team_versions (get_work_records)",
+            "SELECT coalesce(sum(version), 0), max(updated_at) FROM team_versions WHERE team_id = :team_id",
+            {"team_id": team_id},
+        ),
+        (
+            "admin listing ETag, team_versions",
+            "SELECT coalesce(sum(version), 0), max(updated_at) FROM team_versions",
+            {},
+        ),
+        (
+            "duplicate lookup (create_equipment_record)",
+            "SELECT * FROM equipment_records WHERE work_date = :work_date "
+            "AND equipment_type = :equipment_type AND team_id = :team_id LIMIT 1",
+            {"team_id": team_id, "work_date": target_date, "equipment_type": "덤프"},
+        ),
+    ]
+
+
+def load_rows(engine, rows: int, teams: int):
+    """rows개의 공수 기록과 같은 수의 장비 기록을 executemany로 적재합니다."""
+    days = max(1, rows // (teams * WORKERS_PER_TEAM_DAY))
+    team_ids = [str(uuid.uuid4()) for _ in range(teams)]
+    start = date.today() - timedelta(days=days)
+    now = time.strftime("%Y-%m-%d %H:%M:%S")
+
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        for day in range(days):
+            work_date = (start + timedelta(days=day)).isoformat()
+            work_batch = []
+            equipment_batch = []
+            for team_id in team_ids:
+                for worker in range(WORKERS_PER_TEAM_DAY):
+                    work_batch.append((
+                        str(uuid.uuid4()), f"w{worker}", f"작업자{worker}", f"현장{worker % 3}",
+                        work_date, 1.0, None, team_id, "bench", now, now,
+                    ))
+                    equipment_batch.append((
+                        str(uuid.uuid4()), work_date, EQUIPMENT_TYPES[worker % len(EQUIPMENT_TYPES)],
+                        1, team_id, "bench", now, now,
+                    ))
+            cursor.executemany(
+                "INSERT INTO work_records (id, worker_id, worker_name, site_name, work_date, "
+                "work_hours, notes, team_id, created_by, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                work_batch,
+            )
+            cursor.executemany(
+                "INSERT INTO equipment_records (id, work_date, equipment_type, quantity, team_id, "
+                "created_by, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                equipment_batch,
+            )
+        cursor.executemany(
+            "INSERT INTO team_versions (team_id, version, updated_at) VALUES (?, ?, ?)",
+            [(team_id, days, now) for team_id in team_ids],
+        )
+        raw.commit()
+    finally:
+        raw.close()
+    return team_ids[teams // 2], start + timedelta(days=days - 1)
+
+
+def run_phase(engine, label: str, queries, repeat: int):
+    from sqlalchemy import text
+
+    print(f"\n=== {label} ===")
+    with engine.connect() as conn:
+        for name, sql, params in queries:
+            plan = conn.execute(text("EXPLAIN QUERY PLAN " + sql), params).fetchall()
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                conn.execute(text(sql), params).fetchall()
+                timings.append((time.perf_counter() - started) * 1000)
+            print(f"- {name}: median {statistics.median(timings):.3f} ms, max {max(timings):.3f} ms")
+            for row in plan:
+                print(f"    plan: {row[-1]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Composite index before/after benchmark")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="rows per record table")
+    parser.add_argument("--teams", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="index-bench-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+
+    from sqlalchemy import text
+    from app.database import engine
+    from app.models.work_record import WorkRecord
+    from app.models.equipment_record import EquipmentRecord
+    from app.models.team_version import TeamVersion
+    from app.migrations import migrate_add_composite_indexes
+
+    # before: 단일 컬럼 인덱스만 있는 기존 스키마
+    WorkRecord.__table__.create(bind=engine)
+    EquipmentRecord.__table__.create(bind=engine)
+    TeamVersion.__table__.create(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_work_records_team_id_work_date"))
+        conn.execute(text("DROP INDEX uq_equipment_records_team_id_work_date_equipment_type"))
+
+    started = time.perf_counter()
+    team_id, target_date = load_rows(engine, args.rows, args.teams)
+    print(f"loaded {args.rows:,} rows per table in {time.perf_counter() - started:.1f}s ({workdir})")
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+
+    queries = build_queries(team_id, target_date)
+    run_phase(engine, "before (single-column indexes)", queries, args.repeat)
+
+    started = time.perf_counter()
+    migrate_add_composite_indexes()
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+    print(f"\nmigration took {time.perf_counter() - started:.1f}s")
+
+    run_phase(engine, "after (composite indexes)", queries, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
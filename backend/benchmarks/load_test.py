@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+API 부하 테스트 스위트
+benchmarks.datagen으로 임시 DB에 데이터를 만든 뒤 서버(gunicorn + uvicorn 워커)를 로컬에서 실행하고,
+시나리오별로 여러 클라이언트 프로세스가 keep-alive 연결로 요청을 보내 p50/p95/p99 지연 시간과 RPS를 측정합니다.
+네트워크 밖으로 나가는 요청이 없으므로 오프라인에서 실행할 수 있습니다.
+
+시나리오:
+    morning_bulk    팀 관리자가 하루치 공수/장비 기록을 일괄 입력 (POST /work-records/bulk, /equipment-records/bulk)
+    monthly_report  관리자가 임의 팀/월의 월별 리포트 조회 (GET /reports/monthly)
+    admin_listing   관리자가 전체 팀의 일주일치 공수 기록을 페이지 단위로 조회 (GET /work-records, X-Next-Cursor)
+    login_storm     팀 관리자 로그인 폭주 (POST /auth/login, 비밀번호 해시 풀 포화 시 503)
+
+사용법 (backend 디렉토리에서, gunicorn 필요):
+    python -m benchmarks.load_test --teams 20 --workers 15 --years 2 --clients 8 --duration 10
+    python -m benchmarks.load_test --output before.json
+    python -m benchmarks.load_test --baseline before.json   # 이전 결과 대비 p95/RPS 변화 출력
+"""
+
+import argparse
+import contextlib
+import http.client
+import io
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from multiprocessing import Pool
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from benchmarks.workers_benchmark import percentile, start_server, wait_ready  # noqa: E402
+
+ADMIN_EMAIL = "ys26k"
+ADMIN_PASSWORD = "ys7502!@02"
+
+
+class ApiClient:
+    """Keep-alive HTTP client that records per-request latency (ms) and status codes"""
+
+    def __init__(self, port: int):
+        self.port = port
+        self.conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+        self.latencies = []
+        self.statuses = {}
+
+    def request(self, method: str, path: str, body=None, token: str = None):
+        headers = {"Content-Type": "application/json"}
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        payload = json.dumps(body).encode() if body is not None else None
+        started = time.perf_counter()
+        try:
+            self.conn.request(method, path, body=payload, headers=headers)
+            response = self.conn.getresponse()
+            data = response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            self.conn.close()
+            self.conn = http.client.HTTPConnection("127.0.0.1", self.port, timeout=60)
+            response, data, status = None, b"", 0
+        self.latencies.append((time.perf_counter() - started) * 1000)
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        return response, data
+
+    def close(self):
+        self.conn.close()
+
+
+def morning_bulk(client: ApiClient, ctx: dict, rng: random.Random, i: int):
+    team = ctx["teams"][(ctx["client"] + i) % len(ctx["teams"])]
+    # 데이터 범위 이후의 날짜에 입력 (클라이언트/반복마다 다른 날짜)
+    work_date = (date.fromisoformat(ctx["end"]) + timedelta(days=1 + ctx["client"] * 10_000 + i)).isoformat()
+    records = [
+        {
+            "worker_id": worker_id, "worker_name": worker_name, "site_name": rng.choice(team["sites"]),
+            "work_date": work_date, "work_hours": 1.0, "team_id": team["id"], "created_by": team["email"],
+        }
+        for worker_id, worker_name in team["workers"]
+    ]
+    client.request("POST", "/work-records/bulk", records, team["token"])
+    equipment = [
+        {"work_date": work_date, "equipment_type": equipment_type, "quantity": rng.randint(1, 5),
+         "team_id": team["id"], "created_by": team["email"]}
+        for equipment_type in ("덤프", "6w")
+    ]
+    client.request("POST", "/equipment-records/bulk", equipment, team["token"])
+
+
+def monthly_report(client: ApiClient, ctx: dict, rng: random.Random, i: int):
+    team = rng.choice(ctx["teams"])
+    month = rng.choice(ctx["months"])
+    client.request("GET", f"/reports/monthly?month={month}&team_id={team['id']}", token=ctx["admin_token"])
+
+
+def admin_listing(client: ApiClient, ctx: dict, rng: random.Random, i: int):
+    start = date.fromisoformat(ctx["start"])
+    span = (date.fromisoformat(ctx["end"]) - start).days - 6
+    date_from = start + timedelta(days=rng.randint(0, max(span, 0)))
+    path = f"/work-records?date_from={date_from}&date_to={date_from + timedelta(days=6)}&limit=500"
+    for _ in range(ctx["pages"]):
+        response, _ = client.request("GET", path, token=ctx["admin_token"])
+        cursor = response.getheader("X-Next-Cursor") if response is not None else None
+        if not cursor:
+            break
+        path = f"/work-records?date_from={date_from}&date_to={date_from + timedelta(days=6)}&limit=500&cursor={cursor}"
+
+
+def login_storm(client: ApiClient, ctx: dict, rng: random.Random, i: int):
+    team = rng.choice(ctx["teams"])
+    client.request("POST", "/auth/login", {"email": team["email"], "password": ctx["password"]})
+
+
+SCENARIOS = {
+    "morning_bulk": morning_bulk,
+    "monthly_report": monthly_report,
+    "admin_listing": admin_listing,
+    "login_storm": login_storm,
+}
+
+
+def run_client(args):
+    """한 클라이언트 프로세스: duration초 동안 시나리오를 반복하고 (지연 시간 목록, 상태 코드별 건수)를 반환"""
+    scenario, ctx, duration = args
+    client = ApiClient(ctx["port"])
+    rng = random.Random(ctx["seed"] * 1000 + ctx["client"])
+    deadline = time.perf_counter() + duration
+    i = 0
+    while time.perf_counter() < deadline:
+        SCENARIOS[scenario](client, ctx, rng, i)
+        i += 1
+    client.close()
+    return client.latencies, client.statuses
+
+
+def login(port: int, email: str, password: str) -> str:
+    client = ApiClient(port)
+    response, data = client.request("POST", "/auth/login", {"email": email, "password": password})
+    client.close()
+    if response is None or response.status != 200:
+        raise RuntimeError(f"login failed for {email}: {data[:200]!r}")
+    return json.loads(data)["access_token"]
+
+
+def months_between(start: date, end: date) -> list:
+    months = []
+    current = date(start.year, start.month, 1)
+    while current <= end:
+        months.append(current.strftime("%Y-%m"))
+        current = date(current.year + (current.month == 12), current.month % 12 + 1, 1)
+    return months
+
+
+def summarize(latencies: list, statuses: dict, duration: float) -> dict:
+    ok = sum(count for status, count in statuses.items() if 200 <= status < 400)
+    return {
+        "requests": len(latencies),
+        "ok": ok,
+        "rejected_503": statuses.get(503, 0),
+        "errors": len(latencies) - ok - statuses.get(503, 0),
+        "rps": round(len(latencies) / duration, 1),
+        "p50_ms": round(statistics.median(latencies), 1) if latencies else None,
+        "p95_ms": round(percentile(latencies, 95), 1) if latencies else None,
+        "p99_ms": round(percentile(latencies, 99), 1) if latencies else None,
+    }
+
+
+def compare(results: dict, baseline: dict) -> None:
+    print("\n=== baseline 대비 ===")
+    for scenario, current in results["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(scenario)
+        if not before or not before.get("p95_ms") or not current.get("p95_ms"):
+            continue
+        p95 = (current["p95_ms"] - before["p95_ms"]) / before["p95_ms"] * 100
+        rps = (current["rps"] - before["rps"]) / before["rps"] * 100 if before["rps"] else 0.0
+        print(f"- {scenario}: p95 {before['p95_ms']} -> {current['p95_ms']} ms ({p95:+.1f}%), "
+              f"rps {before['rps']} -> {current['rps']} ({rps:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API load test scenarios against a locally started server")
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--teams", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=15, help="workers per team")
+    parser.add_argument("--years", type=float, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--warmup", type=float, default=1)
+    parser.add_argument("--pages", type=int, default=3, help="admin_listing pages per iteration")
+    parser.add_argument("--web-concurrency", type=int, default=1)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--output", help="write results as JSON")
+    parser.add_argument("--baseline", help="compare with a previous --output file")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="load-test-")
+    env = dict(
+        os.environ,
+        DATABASE_URL=f"sqlite:///{os.path.join(workdir, 'bench.db')}",
+        READ_CACHE_PATH=os.path.join(workdir, "read_cache_versions.db"),
+        SECRET_KEY=os.getenv("SECRET_KEY", "load-test-secret"),
+        LOG_LEVEL="WARNING",
+    )
+    os.environ.update(env)
+
+    # 스키마/기본 데이터 준비 후 벤치마크 데이터 적재 (날짜를 고정해 같은 seed면 같은 데이터)
+    from app.bootstrap import migrate
+    from app.database import engine
+    from benchmarks.datagen import generate
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        migrate()
+    end_date = date(2025, 12, 31)
+    dataset = generate(engine, args.teams, args.workers, args.years, args.seed, end_date)
+    engine.dispose()
+    print(
+        f"data: teams={args.teams} workers={args.teams * args.workers} {dataset['start']}~{dataset['end']} "
+        f"work_records={dataset['work_records']:,} equipment_records={dataset['equipment_records']:,} "
+        f"({dataset['load_seconds']}s, {workdir})"
+    )
+
+    results = {"config": {key: value for key, value in vars(args).items() if key not in ("output", "baseline")},
+               "scenarios": {}}
+    server = start_server(args.web_concurrency, args.port, env)
+    try:
+        wait_ready(args.port)
+        ctx = {
+            "port": args.port, "seed": args.seed, "start": dataset["start"], "end": dataset["end"],
+            "password": dataset["password"], "pages": args.pages,
+            "months": months_between(date.fromisoformat(dataset["start"]), end_date),
+            "admin_token": login(args.port, ADMIN_EMAIL, ADMIN_PASSWORD),
+            "teams": [dict(team, token=login(args.port, team["email"], dataset["password"]))
+                      for team in dataset["teams"]],
+        }
+        print(f"cpu={os.cpu_count()} clients={args.clients} duration={args.duration}s "
+              f"web_concurrency={args.web_concurrency} async_db={os.getenv('USE_ASYNC_DB', 'false')}")
+
+        with Pool(args.clients) as pool:
+            for scenario in args.scenarios:
+                jobs = [dict(ctx, client=client) for client in range(args.clients)]
+                if args.warmup > 0:
+                    pool.map(run_client, [(scenario, job, args.warmup) for job in jobs])
+                outcomes = pool.map(run_client, [(scenario, job, args.duration) for job in jobs])
+
+                latencies = [ms for client_latencies, _ in outcomes for ms in client_latencies]
+                statuses = {}
+                for _, client_statuses in outcomes:
+                    for status, count in client_statuses.items():
+                        statuses[status] = statuses.get(status, 0) + count
+                results["scenarios"][scenario] = summarize(latencies, statuses, args.duration)
+                print(f"- {scenario}: {json.dumps(results['scenarios'][scenario])}")
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, ensure_ascii=False, indent=2)
+        print(f"results: {args.output}")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            compare(results, json.load(handle))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+백업 복원 처리량 벤치마크
+공수 기록을 적재한 DB로 전체 스냅샷 1개와 하루치 변경(기존 행 수정 + 신규 행 추가) 차분을 --days개 만든 뒤,
+restore_db.py와 같은 경로(체인 재구성 -> integrity_check/행 수 확인 -> 원자적 교체)로 복원해
+단계별 소요 시간과 처리량(MB/s)을 출력합니다. 차분 백업도 실행마다 DB 전체를 복사/해시하므로
+차분별로 저장한 페이지와 함께 읽은 양(DB 크기)을 출력합니다.
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.restore_benchmark --rows 1000000 --days 6 --change 0.01
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+
+def apply_daily_change(engine, team_id: str, fraction: float):
+    """기존 행의 fraction만큼 공수를 수정하고, 같은 수의 새 기록을 추가"""
+    from benchmarks.serialization_benchmark import load_rows
+
+    raw = engine.raw_connection()
+    try:
+        ids = [row[0] for row in raw.cursor().execute("SELECT id FROM work_records")]
+        changed = max(1, int(len(ids) * fraction))
+        raw.cursor().executemany(
+            "UPDATE work_records SET work_hours = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+            [(random.choice((0.5, 1.0, 1.5)), row_id) for row_id in random.sample(ids, changed)],
+        )
+        raw.commit()
+    finally:
+        raw.close()
+    load_rows(engine, changed, team_id)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backup restore throughput benchmark")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--days", type=int, default=6, help="delta snapshots after the full one")
+    parser.add_argument("--change", type=float, default=0.01, help="fraction of rows changed per day")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="restore-bench-")
+    os.environ.update(
+        DATABASE_URL=f"sqlite:///{os.path.join(workdir, 'bench.db')}",
+        BACKUP_DIR=os.path.join(workdir, "backups"),
+        BACKUP_FULL_EVERY=str(args.days + 1),
+        READ_CACHE_BACKEND="off",
+        LOG_LEVEL="WARNING",
+    )
+
+    from app.bootstrap import migrate
+    from app.database import engine
+    from benchmarks.serialization_benchmark import load_rows
+    import backup_db
+    import restore_db
+
+    # 스키마/기본 데이터 준비 후 공수 기록 적재
+    with contextlib.redirect_stdout(io.StringIO()):
+        migrate()
+    team_id = str(uuid.uuid4())
+    load_rows(engine, args.rows, team_id)
+
+    backup_seconds = []
+    for day in range(args.days + 1):
+        if day:
+            apply_daily_change(engine, team_id, args.change)
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert backup_db.backup_database(), "backup failed"
+        backup_seconds.append(time.perf_counter() - started)
+    engine.dispose()
+
+    snapshots = backup_db.load_manifest()["snapshots"]
+    chain = restore_db.select_chain(snapshots)
+    db_size = os.path.getsize(backup_db.DB_PATH)
+    stored = sum(entry["bytes"] for entry in chain)
+    print(f"rows={args.rows:,} days={args.days} change={args.change:.1%} ({workdir})")
+    print(f"- database: {db_size / 1e6:.1f} MB, backups: {stored / 1e6:.1f} MB")
+    print(f"- full backup: {backup_seconds[0]:.2f}s, {chain[0]['bytes'] / 1e6:.1f} MB")
+    for entry, seconds in zip(chain[1:], backup_seconds[1:]):
+        print(
+            f"- {entry['name']}: {seconds:.2f}s, stored {entry['pages_written']:,}/{entry['page_count']:,} pages, "
+            f"{entry['bytes'] / 1e6:.1f} MB, read {entry['page_count'] * entry['page_size'] / 1e6:.1f} MB"
+        )
+    print("  (delta runs store changed pages only but copy and hash the whole database: O(database size) per run)")
+
+    # 복원: 라이브 DB와 같은 디렉토리에 재구성 후 교체
+    scratch_path = os.path.join(workdir, ".restore-bench.db")
+    started = time.perf_counter()
+    timings = restore_db.materialize(chain, scratch_path)
+    swap_started = time.perf_counter()
+    restore_db.swap_in(scratch_path, backup_db.DB_PATH)
+    timings["swap"] = time.perf_counter() - swap_started
+    total = time.perf_counter() - started
+
+    print(
+        f"- restore ({len(chain)} snapshots): rebuild {timings['rebuild']:.2f}s, "
+        f"check {timings['check']:.2f}s, swap {timings['swap']:.3f}s, total {total:.2f}s"
+    )
+    print(f"  throughput: {db_size / 1e6 / total:.1f} MB/s ({db_size / 1e6 / timings['rebuild']:.1f} MB/s rebuild only)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+목록 응답 직렬화 벤치마크
+GET /work-records 를 ORM 객체 + Pydantic 변환 경로와
+컬럼 조회 + orjson 경로(FAST_LIST_RESPONSES)로 각각 호출해 응답 시간을 비교합니다.
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.serialization_benchmark --rows 10000 100000
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def load_rows(engine, rows: int, team_id: str):
+    """한 팀에 rows개의 공수 기록을 executemany로 적재합니다."""
+    start = date.today() - timedelta(days=rows // 20 + 1)
+    now = time.strftime("%Y-%m-%d %H:%M:%S.123456")
+    batch = [
+        (
+            str(uuid.uuid4()), f"w{i % 20}", f"작업자{i % 20}", f"현장{i % 3}",
+            (start + timedelta(days=i // 20)).isoformat(), 1.0 if i % 2 else 0.5,
+            None if i % 5 else "비고", team_id, "bench", now, now,
+        )
+        for i in range(rows)
+    ]
+    raw = engine.raw_connection()
+    try:
+        raw.cursor().executemany(
+            "INSERT INTO work_records (id, worker_id, worker_name, site_name, work_date, "
+            "work_hours, notes, team_id, created_by, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            batch,
+        )
+        raw.commit()
+    finally:
+        raw.close()
+
+
+def time_requests(client, headers, team_id: str, repeat: int):
+    timings = []
+    body = b""
+    for _ in range(repeat):
+        started = time.perf_counter()
+        response = client.get("/work-records", params={"team_id": team_id}, headers=headers)
+        timings.append((time.perf_counter() - started) * 1000)
+        assert response.status_code == 200, response.text
+        body = response.content
+    return timings, body
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List response serialization benchmark")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="serialization-bench-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+    from fastapi.testclient import TestClient
+    import main as app_main
+    import app.routers.work_records as work_records_router
+    from app.database import engine
+    from app.security import create_access_token
+    from app.serialization import orjson
+
+    if orjson is None:
+        sys.exit("orjson is not installed - the fast path is unavailable")
+
+    client = TestClient(app_main.app)
+    headers = {"Authorization": "Bearer " + create_access_token({"sub": "1", "role": "admin"})}
+
+    for rows in args.rows:
+        team_id = str(uuid.uuid4())
+        load_rows(engine, rows, team_id)
+        print(f"\n=== {rows:,} rows ({workdir}) ===")
+
+        bodies = {}
+        for label, fast in (("ORM + Pydantic", False), ("columns + orjson", True)):
+            work_records_router.FAST_LIST_RESPONSES = fast
+            time_requests(client, headers, team_id, 1)  # warm-up
+            timings, bodies[fast] = time_requests(client, headers, team_id, args.repeat)
+            print(f"- {label}: median {statistics.median(timings):.1f} ms, max {max(timings):.1f} ms")
+
+        same = bodies[True] == bodies[False]
+        print(f"  identical response body: {same} ({len(bodies[True]):,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
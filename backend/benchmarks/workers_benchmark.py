@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+웹 워커 수 비교 부하 테스트
+같은 데이터베이스로 gunicorn(UvicornWorker, --preload)을 워커 수만 바꿔 실행하고,
+여러 클라이언트 프로세스가 keep-alive 연결로 목록 API를 반복 호출해 처리량과 지연 시간을 비교합니다.
+
+사용법 (backend 디렉토리에서, gunicorn 필요):
+    python -m benchmarks.workers_benchmark --workers 1 4 --clients 32 --duration 15
+"""
+
+import argparse
+import contextlib
+import http.client
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from multiprocessing import Pool
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+PATHS = ("/work-records?team_id={team_id}&limit=100", "/teams", "/workers")
+
+
+def percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run_client(args):
+    """한 클라이언트 프로세스: duration초 동안 PATHS를 순서대로 호출하고 지연 시간(ms) 목록을 반환"""
+    port, token, team_id, duration = args
+    headers = {"Authorization": f"Bearer {token}"}
+    paths = [path.format(team_id=team_id) for path in PATHS]
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    latencies = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+    i = 0
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            conn.request("GET", paths[i % len(paths)], headers=headers)
+            response = conn.getresponse()
+            response.read()
+            if response.status != 200:
+                errors += 1
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            conn.close()
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+        latencies.append((time.perf_counter() - started) * 1000)
+        i += 1
+    conn.close()
+    return latencies, errors
+
+
+def wait_ready(port: int, timeout: float = 60) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=2)
+            conn.request("GET", "/health")
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("server did not start")
+
+
+def start_server(workers: int, port: int, env: dict) -> subprocess.Popen:
+    server_env = dict(env, WEB_CONCURRENCY=str(workers), PORT=str(port))
+    return subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "main:app"],
+        cwd=BACKEND_DIR,
+        env=server_env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="1 vs N web workers load test")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=15)
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="workers-bench-")
+    env = dict(
+        os.environ,
+        DATABASE_URL=f"sqlite:///{os.path.join(workdir, 'bench.db')}",
+        READ_CACHE_PATH=os.path.join(workdir, "read_cache_versions.db"),
+        SECRET_KEY=os.getenv("SECRET_KEY", "workers-benchmark-secret"),
+        LOG_LEVEL="WARNING",
+    )
+    os.environ.update(env)
+
+    # 스키마/기본 데이터 준비 후 한 팀에 공수 기록 적재
+    from app.bootstrap import migrate
+    from app.database import engine
+    from app.security import create_access_token
+    from benchmarks.serialization_benchmark import load_rows
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        migrate()
+    team_id = str(uuid.uuid4())
+    load_rows(engine, args.rows, team_id)
+    engine.dispose()
+    token = create_access_token({"sub": "1", "role": "admin"})
+
+    print(f"cpu={os.cpu_count()} clients={args.clients} duration={args.duration}s rows={args.rows} ({workdir})")
+    results = {}
+    for workers in args.workers:
+        server = start_server(workers, args.port, env)
+        try:
+            wait_ready(args.port)
+            # 워커 전부가 준비되도록 잠시 예열
+            with Pool(args.clients) as pool:
+                pool.map(run_client, [(args.port, token, team_id, 1.0)] * args.clients)
+                outcomes = pool.map(
+                    run_client, [(args.port, token, team_id, args.duration)] * args.clients
+                )
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+
+        latencies = [ms for client_latencies, _ in outcomes for ms in client_latencies]
+        errors = sum(client_errors for _, client_errors in outcomes)
+        results[workers] = {
+            "requests": len(latencies),
+            "errors": errors,
+            "rps": round(len(latencies) / args.duration, 1),
+            "p50_ms": round(statistics.median(latencies), 1),
+            "p95_ms": round(percentile(latencies, 95), 1),
+            "p99_ms": round(percentile(latencies, 99), 1),
+        }
+        print(f"- workers={workers}: {json.dumps(results[workers])}")
+
+    baseline = results[args.workers[0]]["rps"]
+    for workers in args.workers[1:]:
+        print(f"  {workers} workers vs {args.workers[0]}: x{results[workers]['rps'] / baseline:.2f} rps")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+"""
+gunicorn configuration (start.sh uses it when WEB_CONCURRENCY > 1)
+preload_app: 마스터 프로세스가 main을 한 번 import 해 DB 준비(테이블/마이그레이션/기본 데이터)를 마친 뒤
+워커를 fork 하므로 워커끼리 시작 작업을 경쟁하지 않습니다.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = 5
+
+# 0이면 워커를 재시작하지 않음 (메모리 누수 대비가 필요하면 설정)
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "0"))
+max_requests_jitter = max_requests // 10
@@ -1,45 +1,21 @@
 import os
+from app.logging_config import setup_logging
+
+setup_logging()
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.database import engine, SessionLocal
-from app.models.user import Base as UserBase
-from app.models.team import Base as TeamBase
-from app.models.worker import Base as WorkerBase
-from app.models.work_record import Base as WorkRecordBase
-from app.models.equipment_record import Base as EquipmentRecordBase
-from app.routers import auth, users, teams, workers, work_records, equipment_records
-from app.init_data import init_default_data
-from app.migrations import migrate_add_notes_column, migrate_remove_site_name_from_equipment, migrate_ensure_site_name_in_work_records
-
-# Create tables
-UserBase.metadata.create_all(bind=engine)
-TeamBase.metadata.create_all(bind=engine)
-WorkerBase.metadata.create_all(bind=engine)
-WorkRecordBase.metadata.create_all(bind=engine)
-EquipmentRecordBase.metadata.create_all(bind=engine)
-
-# Run migrations
-try:
-    migrate_add_notes_column()
-except Exception as e:
-    print(f"마이그레이션 실행 중 오류 (무시 가능): {e}")
-
-try:
-    migrate_remove_site_name_from_equipment()
-except Exception as e:
-    print(f"마이그레이션 실행 중 오류 (무시 가능): {e}")
-
-try:
-    migrate_ensure_site_name_in_work_records()
-except Exception as e:
-    print(f"마이그레이션 실행 중 오류 (무시 가능): {e}")
-
-# Initialize default data
-db = SessionLocal()
-try:
-    init_default_data(db)
-finally:
-    db.close()
+from fastapi.responses import Response
+from app.bootstrap import ensure_schema
+from app.database import USE_ASYNC_DB, async_engine, connect_async_engine, engine
+from app.metrics import CONTENT_TYPE, METRICS_ENABLED, MetricsMiddleware, registry
+from app.routers import auth, users, teams, workers, work_records, equipment_records, reports
+from app.pagination import NEXT_CURSOR_HEADER
+from app.read_cache import read_cache
+from app.security import password_pool, token_cache
+
+# 스키마 버전만 확인 (테이블 생성/마이그레이션/기본 데이터는 python -m app.bootstrap)
+ensure_schema()
 
 app = FastAPI(
     title="Construction Site Management API",
@@ -60,15 +36,30 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
 )
+if METRICS_ENABLED:
+    # 가장 바깥 미들웨어: CORS 처리까지 포함한 지연 시간 측정
+    app.add_middleware(MetricsMiddleware)
 
 # Include routers
 app.include_router(auth.router)
 app.include_router(users.router)
-app.include_router(teams.router)
-app.include_router(workers.router)
-app.include_router(work_records.router)
-app.include_router(equipment_records.router)
+if USE_ASYNC_DB:
+    # 비동기 DB 경로: 같은 경로의 async 라우터 사용 (aiosqlite / asyncpg)
+    from app.routers import async_teams, async_workers, async_work_records, async_equipment_records
+
+    app.include_router(async_teams.router)
+    app.include_router(async_workers.router)
+    app.include_router(async_work_records.router)
+    app.include_router(async_equipment_records.router)
+    app.add_event_handler("startup", connect_async_engine)
+else:
+    app.include_router(teams.router)
+    app.include_router(workers.router)
+    app.include_router(work_records.router)
+    app.include_router(equipment_records.router)
+app.include_router(reports.router)
 
 
 @app.get("/")
@@ -83,7 +74,55 @@ def read_root():
 
 @app.get("/health")
 def health_check():
-    return {"status": "ok"}
+    return {
+        "status": "ok",
+        "token_cache": token_cache.stats(),
+        "password_hash_pool": password_pool.stats(),
+        "read_cache": read_cache.stats(),
+    }
+
+
+def collect_component_stats():
+    """/health stats and connection pool status as Prometheus samples"""
+    tokens = token_cache.stats()
+    yield "token_cache_size", "gauge", "Cached JWT payloads", {}, tokens["size"]
+    yield "token_cache_hits_total", "counter", "JWT payload cache hits", {}, tokens["hits"]
+    yield "token_cache_misses_total", "counter", "JWT payload cache misses", {}, tokens["misses"]
+    hashing = password_pool.stats()
+    yield "password_hash_pool_pending", "gauge", "Password hashes queued or running", {}, hashing["pending"]
+    yield "password_hash_pool_completed_total", "counter", "Password hashes completed", {}, hashing["completed"]
+    yield "password_hash_pool_failed_total", "counter", "Password hashes that raised", {}, hashing["failed"]
+    yield "password_hash_pool_rejected_total", "counter", "Password hashes rejected with 503", {}, hashing["rejected"]
+    yield "password_hash_pool_max_seconds", "gauge", "Slowest password hash", {}, hashing["max_ms"] / 1000
+    cache_stats = read_cache.stats()
+    for namespace, counts in cache_stats["namespaces"].items():
+        for key, value in counts.items():
+            yield f"read_cache_{key}_total", "counter", f"Read cache {key} by namespace", {"namespace": namespace}, value
+    yield "read_cache_size", "gauge", "Read cache entries", {}, cache_stats["size"]
+    yield "read_cache_errors_total", "counter", "Read cache version store errors", {}, cache_stats["errors"]
+
+    pools = [("sync", engine.pool)]
+    if async_engine is not None:
+        pools.append(("async", async_engine.sync_engine.pool))
+    for label, pool in pools:
+        if hasattr(pool, "checkedout"):
+            yield "db_pool_checked_out", "gauge", "Connections currently checked out", {"pool": label}, pool.checkedout()
+            yield "db_pool_size", "gauge", "Configured pool size", {"pool": label}, pool.size()
+            yield "db_pool_overflow", "gauge", "Connections opened beyond pool_size", {"pool": label}, max(pool.overflow(), 0)
+
+
+registry.add_collector(collect_component_stats)
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus text format metrics for this worker process"""
+    return Response(registry.render(), media_type=CONTENT_TYPE)
+
+
+@app.on_event("shutdown")
+def shutdown_password_pool():
+    password_pool.shutdown()
 
 
 if __name__ == "__main__":
@@ -1,4 +1,4 @@
 #!/bin/bash
 echo "데이터베이스 마이그레이션 실행 중..."
-python -m app.migrations
+python -m app.bootstrap
 
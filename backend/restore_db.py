@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+데이터베이스 복원/검증 스크립트
+backup_db.py가 만든 manifest.json에서 지정 시각 이전의 마지막 스냅샷과 그 체인(전체 스냅샷 + 차분)을 골라
+DB 파일 옆의 임시 파일에 재구성하고, PRAGMA integrity_check와 테이블별 행 수를 확인한 뒤 원자적으로 교체합니다.
+교체 전 기존 DB는 <DB>.before-restore-<시각>으로 남깁니다.
+
+복원 전에 서버를 중지하세요 (열려 있는 연결은 교체된 파일을 보지 못함).
+
+사용법:
+    python restore_db.py --list                          # 스냅샷 목록
+    python restore_db.py --at 2026-10-18T02:00           # 해당 시각 기준으로 복원 (시간대 생략 시 로컬 시간)
+    python restore_db.py                                 # 가장 최근 스냅샷으로 복원
+    python restore_db.py --at ... --output restored.db   # 교체하지 않고 다른 파일로 재구성
+    python restore_db.py --verify                        # 모든 스냅샷 검증만 수행 (DB는 변경하지 않음)
+"""
+import os
+import time
+import shutil
+import sqlite3
+import argparse
+import tempfile
+from datetime import datetime, timezone
+
+from backup_db import (
+    BACKUP_DIR,
+    COPY_CHUNK,
+    DB_PATH,
+    DELTA_HEADER,
+    DELTA_MAGIC,
+    PAGE_NUMBER,
+    backup_lock,
+    file_sha256,
+    load_manifest,
+    open_compressed,
+)
+
+
+class RestoreError(Exception):
+    """스냅샷 선택/재구성/검증 실패"""
+
+
+def parse_timestamp(value: str) -> datetime:
+    moment = datetime.fromisoformat(value)
+    # 시간대가 없으면 로컬 시간으로 해석
+    return moment.astimezone(timezone.utc) if moment.tzinfo is None else moment
+
+
+def select_chain(snapshots: list, target: datetime = None) -> list:
+    """target 시각 이전의 마지막 스냅샷까지의 체인 (전체 스냅샷부터 순서대로)"""
+    candidates = [
+        entry for entry in snapshots
+        if target is None or datetime.fromisoformat(entry["created_at"]) <= target
+    ]
+    if not candidates:
+        raise RestoreError(f"{target.isoformat()} 이전의 스냅샷이 없습니다.")
+    last = candidates[-1]
+    chain = [entry for entry in snapshots[:snapshots.index(last) + 1] if entry["base"] == last["base"]]
+    if chain[0]["kind"] != "full":
+        raise RestoreError(f"전체 스냅샷 {last['base']}이 manifest에 없습니다.")
+    return chain
+
+
+def verify_file(entry: dict) -> str:
+    path = os.path.join(BACKUP_DIR, entry["file"])
+    if not os.path.exists(path):
+        raise RestoreError(f"백업 파일이 없습니다: {path}")
+    if file_sha256(path) != entry["sha256"]:
+        raise RestoreError(f"백업 파일 sha256 불일치: {path}")
+    return path
+
+
+def apply_snapshot(entry: dict, dest_path: str):
+    """전체 스냅샷은 dest_path에 풀고, 차분은 바뀐 페이지를 덮어씀"""
+    path = verify_file(entry)
+    with open_compressed(path, "rb", entry["compression"]) as source:
+        if entry["kind"] == "full":
+            with open(dest_path, "wb") as dest:
+                shutil.copyfileobj(source, dest, COPY_CHUNK)
+            return
+
+        if source.read(len(DELTA_MAGIC)) != DELTA_MAGIC:
+            raise RestoreError(f"차분 파일 형식이 아닙니다: {path}")
+        page_size, page_count, _ = DELTA_HEADER.unpack(source.read(DELTA_HEADER.size))
+        record_size = PAGE_NUMBER.size + page_size
+        with open(dest_path, "r+b") as dest:
+            while True:
+                record = source.read(record_size)
+                if not record:
+                    break
+                if len(record) != record_size:
+                    raise RestoreError(f"차분 파일이 잘려 있습니다: {path}")
+                page_number = PAGE_NUMBER.unpack_from(record)[0]
+                dest.seek((page_number - 1) * page_size)
+                dest.write(record[PAGE_NUMBER.size:])
+            dest.truncate(page_count * page_size)
+
+
+def check_database(path: str, entry: dict):
+    """integrity_check와 manifest에 기록된 테이블별 행 수 확인"""
+    conn = sqlite3.connect(path)
+    try:
+        result = [row[0] for row in conn.execute("PRAGMA integrity_check")]
+        if result != ["ok"]:
+            raise RestoreError(f"integrity_check 실패: {'; '.join(result[:5])}")
+        for table, expected in entry["row_counts"].items():
+            actual = conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0]
+            if actual != expected:
+                raise RestoreError(f"{table} 행 수 불일치: {actual:,} (백업 시 {expected:,})")
+    finally:
+        conn.close()
+
+
+def materialize(chain: list, dest_path: str, check: bool = True) -> dict:
+    """체인을 dest_path에 재구성하고 (선택) 검증; 단계별 소요 시간(초)을 반환"""
+    timings = {}
+    started = time.perf_counter()
+    for entry in chain:
+        apply_snapshot(entry, dest_path)
+    timings["rebuild"] = time.perf_counter() - started
+    if check:
+        started = time.perf_counter()
+        check_database(dest_path, chain[-1])
+        timings["check"] = time.perf_counter() - started
+    return timings
+
+
+def swap_in(scratch_path: str, db_path: str) -> str:
+    """검증된 파일로 DB를 원자적으로 교체하고, 기존 DB의 보관 경로를 반환"""
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    previous_path = f"{db_path}.before-restore-{stamp}"
+    if os.path.exists(db_path):
+        # WAL 내용을 DB 파일에 반영해 두어야 보관본이 완전하고, 남은 -wal이 새 파일에 적용되지 않음
+        conn = sqlite3.connect(db_path)
+        try:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        finally:
+            conn.close()
+        try:
+            os.link(db_path, previous_path)
+        except OSError:
+            shutil.copy2(db_path, previous_path)
+    os.replace(scratch_path, db_path)
+    for suffix in ("-wal", "-shm"):
+        if os.path.exists(db_path + suffix):
+            os.remove(db_path + suffix)
+    return previous_path if os.path.exists(previous_path) else None
+
+
+def list_snapshots():
+    snapshots = load_manifest()["snapshots"]
+    if not snapshots:
+        print("백업이 없습니다.")
+    for entry in snapshots:
+        created_at = datetime.fromisoformat(entry["created_at"]).astimezone()
+        rows = sum(entry["row_counts"].values())
+        print(
+            f"{created_at:%Y-%m-%d %H:%M:%S} {entry['kind']:5} {entry['file']} "
+            f"({entry['pages_written']:,}/{entry['page_count']:,} 페이지, {entry['bytes']:,} bytes, {rows:,}행)"
+        )
+
+
+def verify_all() -> bool:
+    """체인별로 스냅샷을 차례로 적용하며 각 시점의 DB를 검증"""
+    snapshots = load_manifest()["snapshots"]
+    if not snapshots:
+        print("백업이 없습니다.")
+        return False
+    ok = True
+    scratch_dir = tempfile.mkdtemp(prefix="restore-verify-")
+    try:
+        scratch_path = os.path.join(scratch_dir, "verify.db")
+        broken_base = None
+        for entry in snapshots:
+            if entry["base"] == broken_base:
+                print(f"✗ {entry['name']}: 이전 스냅샷 오류로 건너뜀")
+                continue
+            try:
+                apply_snapshot(entry, scratch_path)
+                check_database(scratch_path, entry)
+                print(f"✓ {entry['name']}")
+            except (RestoreError, sqlite3.Error) as e:
+                print(f"✗ {entry['name']}: {e}")
+                broken_base = entry["base"]
+                ok = False
+    finally:
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+    return ok
+
+
+def restore_database(target: datetime = None, output_path: str = None) -> bool:
+    """target 시각 기준으로 복원 (output_path가 있으면 교체 없이 해당 파일로 재구성)"""
+    try:
+        chain = select_chain(load_manifest()["snapshots"], target)
+        last = chain[-1]
+        print(f"복원 대상: {last['name']} ({last['created_at']}, 전체 1개 + 차분 {len(chain) - 1}개)")
+
+        dest_path = output_path or DB_PATH
+        dest_dir = os.path.dirname(os.path.abspath(dest_path))
+        os.makedirs(dest_dir, exist_ok=True)
+        # 원자적 교체를 위해 대상과 같은 디렉토리에 임시 파일 생성
+        fd, scratch_path = tempfile.mkstemp(prefix=".restore-", suffix=".db", dir=dest_dir)
+        os.close(fd)
+        try:
+            with backup_lock():
+                timings = materialize(chain, scratch_path)
+            size = os.path.getsize(scratch_path)
+            print(
+                f"✓ 재구성 및 검증 완료: {size:,} bytes "
+                f"(재구성 {timings['rebuild']:.1f}초, 검증 {timings['check']:.1f}초)"
+            )
+            if output_path:
+                os.replace(scratch_path, output_path)
+                print(f"✓ 복원 파일 생성: {output_path}")
+            else:
+                previous_path = swap_in(scratch_path, DB_PATH)
+                print(f"✓ 복원 완료: {DB_PATH}")
+                if previous_path:
+                    print(f"기존 DB 보관: {previous_path}")
+        finally:
+            if os.path.exists(scratch_path):
+                os.remove(scratch_path)
+        return True
+
+    except (RestoreError, OSError, sqlite3.Error) as e:
+        print(f"✗ 복원 실패: {e}")
+        return False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Point-in-time restore from backup_db.py snapshots")
+    parser.add_argument("--at", type=parse_timestamp, help="restore the last snapshot taken at or before this time")
+    parser.add_argument("--output", help="rebuild into this file instead of replacing the database")
+    parser.add_argument("--list", action="store_true", help="list snapshots")
+    parser.add_argument("--verify", action="store_true", help="verify every snapshot without restoring")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        list_snapshots()
+        return True
+    if args.verify:
+        return verify_all()
+    return restore_database(args.at, args.output)
+
+
+if __name__ == "__main__":
+    exit(0 if main() else 1)
@@ -3,10 +3,16 @@
 # 환경변수 설정 (cron에서 사용할 수 있도록)
 export DATABASE_URL=${DATABASE_URL:-sqlite:///./data/test.db}
 export BACKUP_DIR=${BACKUP_DIR:-/app/backups}
+export WEB_CONCURRENCY=${WEB_CONCURRENCY:-1}
 
 # cron 데몬 시작
 cron
 
-# 애플리케이션 실행
-exec uvicorn main:app --host 0.0.0.0 --port 8000
+# 테이블/마이그레이션/기본 데이터 준비 (이미 적용되어 있으면 버전 확인만 하고 종료)
+python -m app.bootstrap || exit 1
 
+# 애플리케이션 실행 (WEB_CONCURRENCY > 1 이면 gunicorn + uvicorn 워커)
+if [ "$WEB_CONCURRENCY" -gt 1 ]; then
+    exec gunicorn -c gunicorn.conf.py main:app
+fi
+exec uvicorn main:app --host 0.0.0.0 --port 8000
@@ -0,0 +1,35 @@
+"""
+테스트 공통 설정
+app.database는 임포트 시점의 DATABASE_URL로 엔진을 만들므로, 어떤 테스트 모듈보다 먼저 메모리 SQLite를 지정합니다
+(개발용 DB 파일이나 환경 변수에 설정된 DB에 쓰지 않도록).
+"""
+
+import os
+
+import pytest
+from sqlalchemy import text
+
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+
+ADMIN = {"sub": "test-admin", "email": "admin", "role": "admin", "team_id": None, "team_name": None}
+
+
+@pytest.fixture
+def client():
+    """API client logged in as admin, on empty record/summary tables"""
+    from fastapi.testclient import TestClient
+    from main import app
+    from app.bootstrap import migrate
+    from app.database import engine
+    from app.security import get_current_user
+
+    # 메모리 DB는 main 임포트 시 ensure_schema()의 engine.dispose()로 사라지므로 여기서 스키마를 만듦
+    migrate()
+    with engine.begin() as conn:
+        for table in ("work_records", "equipment_records", "daily_team_summary", "team_versions"):
+            conn.execute(text(f"DELETE FROM {table}"))
+    app.dependency_overrides[get_current_user] = lambda: ADMIN
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
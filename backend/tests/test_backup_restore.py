@@ -0,0 +1,119 @@
+"""
+backup_db.py / restore_db.py 왕복 테스트
+전체 스냅샷 -> 변경 -> 차분 -> 복원 순서로 최신 값이 돌아오는지, 백업이 중간에 실패한 뒤에도
+다음 차분이 바뀐 페이지를 빠뜨리지 않는지 확인합니다.
+"""
+
+import importlib
+import os
+import sqlite3
+
+import pytest
+
+
+@pytest.fixture
+def backup(tmp_path, monkeypatch):
+    """backup_db / restore_db modules configured for a temp database and backup directory"""
+    db_path = tmp_path / "app.db"
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{db_path}")
+    monkeypatch.setenv("BACKUP_DIR", str(tmp_path / "backups"))
+    monkeypatch.setenv("BACKUP_COMPRESSION", "gzip")
+    monkeypatch.setenv("BACKUP_FULL_EVERY", "7")
+
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, v TEXT, payload BLOB)")
+    conn.executemany(
+        "INSERT INTO items (id, v, payload) VALUES (?, ?, ?)",
+        [(i, "old", os.urandom(200)) for i in range(2000)],
+    )
+    conn.commit()
+    conn.close()
+
+    import backup_db
+    import restore_db
+
+    backup_db = importlib.reload(backup_db)
+    restore_db = importlib.reload(restore_db)
+    return backup_db, restore_db, db_path, tmp_path
+
+
+def set_value(db_path, value, item_id=1000):
+    conn = sqlite3.connect(db_path)
+    conn.execute("UPDATE items SET v = ? WHERE id = ?", (value, item_id))
+    conn.commit()
+    conn.close()
+
+
+def restored_value(restore_db, tmp_path, item_id=1000):
+    output = tmp_path / "restored.db"
+    if output.exists():
+        output.unlink()
+    assert restore_db.restore_database(output_path=str(output))
+    conn = sqlite3.connect(output)
+    try:
+        return conn.execute("SELECT v FROM items WHERE id = ?", (item_id,)).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_full_then_delta_round_trip(backup):
+    backup_db, restore_db, db_path, tmp_path = backup
+
+    assert backup_db.backup_database()
+    set_value(db_path, "new")
+    assert backup_db.backup_database()
+
+    snapshots = backup_db.load_manifest()["snapshots"]
+    assert [entry["kind"] for entry in snapshots] == ["full", "delta"]
+    assert 0 < snapshots[1]["pages_written"] < snapshots[1]["page_count"]
+    # 같은 초에 실행해도 파일 이름이 겹치지 않음
+    assert len({entry["file"] for entry in snapshots}) == 2
+    assert restored_value(restore_db, tmp_path) == "new"
+    assert restore_db.verify_all()
+
+
+def test_failed_manifest_write_does_not_drop_pages(backup, monkeypatch):
+    backup_db, restore_db, db_path, tmp_path = backup
+
+    assert backup_db.backup_database()
+    set_value(db_path, "new")
+
+    def fail(manifest):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(backup_db, "save_manifest", fail)
+        assert not backup_db.backup_database()
+
+    # 실패한 실행은 기록되지 않았으므로 다음 차분은 마지막 기록 이후의 변경을 모두 포함해야 함
+    assert backup_db.backup_database()
+    snapshots = backup_db.load_manifest()["snapshots"]
+    assert [entry["kind"] for entry in snapshots] == ["full", "delta"]
+    assert snapshots[-1]["pages_written"] > 0
+    assert restored_value(restore_db, tmp_path) == "new"
+
+
+def test_failed_pagehash_write_forces_full_snapshot(backup, monkeypatch):
+    backup_db, restore_db, db_path, tmp_path = backup
+
+    assert backup_db.backup_database()
+    set_value(db_path, "mid")
+
+    write_atomic = backup_db._write_atomic
+
+    def fail_pagehash(path, data):
+        if path.endswith(backup_db.PAGEHASH_NAME):
+            raise OSError("disk full")
+        write_atomic(path, data)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(backup_db, "_write_atomic", fail_pagehash)
+        assert not backup_db.backup_database()
+
+    # manifest에는 기록됐지만 해시 파일은 이전 것 -> digest 불일치로 전체 스냅샷
+    set_value(db_path, "new")
+    assert backup_db.backup_database()
+    snapshots = backup_db.load_manifest()["snapshots"]
+    assert [entry["kind"] for entry in snapshots] == ["full", "delta", "full"]
+    assert restored_value(restore_db, tmp_path) == "new"
@@ -0,0 +1,30 @@
+"""
+app.bootstrap.ensure_schema 시작 검사 테스트
+스키마가 최신이 아닐 때 AUTO_MIGRATE 여부와 관계없이 서버가 덜 준비된 스키마로 시작하지 않는지 확인합니다.
+"""
+
+import pytest
+
+from app import bootstrap
+
+
+@pytest.fixture
+def outdated(monkeypatch):
+    monkeypatch.setattr(bootstrap, "current_version", lambda: bootstrap.LATEST_VERSION - 1)
+
+
+def test_failed_auto_migration_stops_startup(outdated, monkeypatch):
+    def fail():
+        raise RuntimeError("migration failed")
+
+    monkeypatch.setattr(bootstrap, "AUTO_MIGRATE", True)
+    monkeypatch.setattr(bootstrap, "migrate", fail)
+    with pytest.raises(RuntimeError, match="migration failed"):
+        bootstrap.ensure_schema()
+
+
+def test_outdated_schema_without_auto_migrate_stops_startup(outdated, monkeypatch):
+    monkeypatch.setattr(bootstrap, "AUTO_MIGRATE", False)
+    monkeypatch.setattr(bootstrap, "migrate", lambda: pytest.fail("migrate must not run"))
+    with pytest.raises(RuntimeError):
+        bootstrap.ensure_schema()
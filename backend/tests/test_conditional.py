@@ -0,0 +1,51 @@
+"""
+기록 목록 ETag 테스트
+공수/장비 기록 목록의 ETag가 팀 버전(team_versions)을 따라, 같은 팀의 기록이 바뀔 때만 달라지고
+변경이 없으면 304를 돌려주는지 확인합니다. 전체 팀 목록(관리자)은 어느 팀이 바뀌어도 달라집니다.
+"""
+
+from datetime import date
+
+TEAM_A = "team-a"
+TEAM_B = "team-b"
+DAY = date(2025, 3, 3)
+
+
+def work(worker_id, team_id, work_hours=1.0):
+    return {
+        "worker_id": worker_id, "worker_name": "김철수", "site_name": "동탄 물류센터",
+        "work_date": DAY.isoformat(), "work_hours": work_hours, "team_id": team_id, "created_by": "admin",
+    }
+
+
+def etag(client, params=None):
+    response = client.get("/work-records", params=params)
+    assert response.status_code == 200, response.text
+    return response.headers["ETag"]
+
+
+def test_record_list_etag_follows_team_version(client):
+    client.post("/work-records", json=work("w1", TEAM_A))
+    team_a = etag(client, {"team_id": TEAM_A})
+    everyone = etag(client)
+    assert team_a != everyone
+
+    not_modified = client.get("/work-records", params={"team_id": TEAM_A}, headers={"If-None-Match": team_a})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["ETag"] == team_a
+
+    # 다른 팀의 변경은 팀 A 목록의 ETag를 바꾸지 않고, 전체 목록의 ETag만 바꿈
+    client.post("/work-records", json=work("w2", TEAM_B))
+    assert etag(client, {"team_id": TEAM_A}) == team_a
+    assert etag(client) != everyone
+
+    # 팀 A의 수정/삭제는 팀 A 목록의 ETag를 바꿈
+    record = client.get("/work-records", params={"team_id": TEAM_A}).json()[0]
+    assert client.put(f"/work-records/{record['id']}", json={"work_hours": 0.5}).status_code == 200
+    updated = etag(client, {"team_id": TEAM_A})
+    assert updated != team_a
+    assert client.delete(f"/work-records/{record['id']}").status_code == 200
+    assert etag(client, {"team_id": TEAM_A}) not in (team_a, updated)
+    response = client.get("/work-records", params={"team_id": TEAM_A}, headers={"If-None-Match": updated})
+    assert response.status_code == 200
+    assert response.json() == []
@@ -0,0 +1,108 @@
+"""
+daily_team_summary 롤업 테스트
+공수/장비 기록을 API로 생성/수정/삭제할 때마다 저장된 일별 집계가 원본 기록을 새로 GROUP BY한 결과와
+같은지(기록이 모두 사라진 날짜는 집계 행도 삭제) 확인합니다.
+"""
+
+from datetime import date
+
+from sqlalchemy import text
+
+TEAM_A = "team-a"
+TEAM_B = "team-b"
+DAY1 = date(2025, 3, 3)
+DAY2 = date(2025, 3, 4)
+DAY3 = date(2025, 3, 5)
+
+
+def stored_summaries() -> dict:
+    from app.database import SessionLocal
+    from app.models.daily_team_summary import DailyTeamSummary
+
+    db = SessionLocal()
+    try:
+        return {
+            (row.team_id, row.work_date): (
+                row.worker_count, row.work_record_count, row.total_hours, dict(row.equipment_quantities),
+            )
+            for row in db.query(DailyTeamSummary)
+        }
+    finally:
+        db.close()
+
+
+def fresh_group_by() -> dict:
+    """The rollup recomputed from the raw records with plain GROUP BY queries"""
+    from app.database import engine
+
+    expected = {}
+    with engine.connect() as conn:
+        for team_id, work_date, workers, records, hours in conn.execute(text(
+            "SELECT team_id, work_date, COUNT(DISTINCT worker_id), COUNT(*), SUM(work_hours) "
+            "FROM work_records GROUP BY team_id, work_date"
+        )):
+            expected[(team_id, date.fromisoformat(work_date))] = (workers, records, hours, {})
+        for team_id, work_date, equipment_type, quantity in conn.execute(text(
+            "SELECT team_id, work_date, equipment_type, SUM(quantity) "
+            "FROM equipment_records GROUP BY team_id, work_date, equipment_type"
+        )):
+            key = (team_id, date.fromisoformat(work_date))
+            expected.setdefault(key, (0, 0, 0.0, {}))[3][equipment_type] = quantity
+    return expected
+
+
+def work(worker_id, worker_name, site_name, work_date, work_hours, team_id=TEAM_A):
+    return {
+        "worker_id": worker_id, "worker_name": worker_name, "site_name": site_name,
+        "work_date": work_date.isoformat(), "work_hours": work_hours, "team_id": team_id, "created_by": "admin",
+    }
+
+
+def equipment(work_date, equipment_type, quantity, team_id=TEAM_A):
+    return {
+        "work_date": work_date.isoformat(), "equipment_type": equipment_type, "quantity": quantity,
+        "team_id": team_id, "created_by": "admin",
+    }
+
+
+def post(client, path, payload):
+    response = client.post(path, json=payload)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def assert_rollup_matches():
+    assert stored_summaries() == fresh_group_by()
+
+
+def test_rollup_follows_create_update_delete(client):
+    post(client, "/work-records/bulk", [
+        work("w1", "김철수", "동탄 물류센터", DAY1, 1.0),
+        work("w2", "이영희", "동탄 물류센터", DAY1, 0.5),
+        work("w3", "박민수", "판교 오피스텔", DAY1, 1.5, team_id=TEAM_B),
+    ])
+    day2_record = post(client, "/work-records", work("w1", "김철수", "동탄 물류센터", DAY2, 1.0))
+    dump = post(client, "/equipment-records", equipment(DAY1, "덤프", 2))
+    post(client, "/equipment-records", equipment(DAY1, "6w", 1))
+    truck = post(client, "/equipment-records", equipment(DAY2, "1t", 3, team_id=TEAM_B))
+    assert_rollup_matches()
+    assert stored_summaries()[(TEAM_A, DAY1)] == (2, 2, 1.5, {"6w": 1, "덤프": 2})
+    # 장비 기록만 있는 날짜도 집계 행이 생김
+    assert stored_summaries()[(TEAM_B, DAY2)] == (0, 0, 0.0, {"1t": 3})
+
+    # 수량 누적(bulk UPSERT), 공수 수정, 장비 날짜 이동 (이전 날짜와 새 날짜 모두 갱신)
+    post(client, "/equipment-records/bulk", [equipment(DAY1, "덤프", 3)])
+    records = client.get("/work-records", params={"team_id": TEAM_A}).json()
+    w2 = next(row for row in records if row["worker_id"] == "w2")
+    assert client.put(f"/work-records/{w2['id']}", json={"work_hours": 1.0}).status_code == 200
+    assert client.put(f"/equipment-records/{dump['id']}", json={"work_date": DAY3.isoformat()}).status_code == 200
+    assert_rollup_matches()
+    assert stored_summaries()[(TEAM_A, DAY1)] == (2, 2, 2.0, {"6w": 1})
+    assert stored_summaries()[(TEAM_A, DAY3)] == (0, 0, 0.0, {"덤프": 5})
+
+    # 그날의 마지막 기록을 지우면 집계 행도 삭제
+    assert client.delete(f"/work-records/{day2_record['id']}").status_code == 200
+    assert client.delete(f"/equipment-records/{truck['id']}").status_code == 200
+    assert_rollup_matches()
+    assert (TEAM_A, DAY2) not in stored_summaries()
+    assert (TEAM_B, DAY2) not in stored_summaries()
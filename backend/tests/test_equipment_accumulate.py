@@ -0,0 +1,64 @@
+"""
+장비 수량 누적(UPSERT) 테스트
+같은 (team_id, work_date, equipment_type)으로 누적을 두 번 호출하면 행이 하나만 남고 수량이 합산되는지,
+수정으로 다른 기록과 같은 키가 되면 UNIQUE 인덱스에 걸려 409를 돌려주는지 확인합니다.
+"""
+
+from datetime import date
+
+TEAM = "team-a"
+DAY = date(2025, 3, 3)
+
+
+def equipment_rows():
+    from app.database import SessionLocal
+    from app.models.equipment_record import EquipmentRecord
+
+    db = SessionLocal()
+    try:
+        return [
+            (row.id, row.team_id, row.work_date, row.equipment_type, row.quantity)
+            for row in db.query(EquipmentRecord).order_by(EquipmentRecord.equipment_type)
+        ]
+    finally:
+        db.close()
+
+
+def accumulate(equipment_type, quantity):
+    """One accumulate call in its own session and transaction, like one request"""
+    from app.database import SessionLocal
+    from app.services import EquipmentRecordService
+
+    db = SessionLocal()
+    try:
+        (record,) = EquipmentRecordService.accumulate_quantities(db, [{
+            "work_date": DAY, "equipment_type": equipment_type, "quantity": quantity,
+            "team_id": TEAM, "created_by": "admin",
+        }])
+        db.commit()
+        return record.id
+    finally:
+        db.close()
+
+
+def test_two_accumulate_calls_leave_one_summed_row(client):
+    first_id = accumulate("덤프", 2)
+    second_id = accumulate("덤프", 3)
+    assert first_id == second_id
+    assert equipment_rows() == [(first_id, TEAM, DAY, "덤프", 5)]
+
+    # API 경로(단건/일괄)도 같은 행에 누적
+    payload = {"work_date": DAY.isoformat(), "equipment_type": "덤프", "quantity": 1, "team_id": TEAM, "created_by": "admin"}
+    assert client.post("/equipment-records", json=payload).json()["quantity"] == 6
+    assert client.post("/equipment-records/bulk", json=[payload, payload]).json()[0]["quantity"] == 8
+    assert equipment_rows() == [(first_id, TEAM, DAY, "덤프", 8)]
+
+
+def test_update_onto_existing_key_returns_409(client):
+    dump_id = accumulate("덤프", 2)
+    truck_id = accumulate("6w", 1)
+
+    response = client.put(f"/equipment-records/{truck_id}", json={"equipment_type": "덤프"})
+    assert response.status_code == 409, response.text
+    # 롤백되어 두 기록 모두 그대로 남음
+    assert equipment_rows() == [(truck_id, TEAM, DAY, "6w", 1), (dump_id, TEAM, DAY, "덤프", 2)]
@@ -0,0 +1,70 @@
+"""
+월별 리포트 테스트
+/reports/monthly가 (팀, 작업자, 현장) 단위로 묶이고, 다른 달의 기록과 다른 팀의 기록을 섞지 않는지 확인합니다.
+"""
+
+from datetime import date
+
+TEAM_A = "team-a"
+TEAM_B = "team-b"
+DAY1 = date(2025, 3, 3)
+DAY2 = date(2025, 3, 4)
+DAY3 = date(2025, 3, 5)
+
+
+def work(worker_id, worker_name, site_name, work_date, work_hours, team_id=TEAM_A):
+    return {
+        "worker_id": worker_id, "worker_name": worker_name, "site_name": site_name,
+        "work_date": work_date.isoformat(), "work_hours": work_hours, "team_id": team_id, "created_by": "admin",
+    }
+
+
+def equipment(work_date, equipment_type, quantity, team_id=TEAM_A):
+    return {
+        "work_date": work_date.isoformat(), "equipment_type": equipment_type, "quantity": quantity,
+        "team_id": team_id, "created_by": "admin",
+    }
+
+
+def post(client, path, payload):
+    response = client.post(path, json=payload)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_monthly_report_groups_by_team_worker_and_site(client):
+    post(client, "/work-records/bulk", [
+        work("w1", "김철수", "동탄 물류센터", DAY1, 1.0),
+        work("w1", "김철수", "동탄 물류센터", DAY2, 0.5),
+        work("w1", "김철수", "판교 오피스텔", DAY3, 1.0),
+        # 다른 팀의 동명이인은 따로 집계
+        work("w9", "김철수", "동탄 물류센터", DAY1, 1.5, team_id=TEAM_B),
+        # 다른 달의 기록은 제외
+        work("w1", "김철수", "동탄 물류센터", date(2025, 4, 1), 1.0),
+    ])
+    post(client, "/equipment-records/bulk", [
+        equipment(DAY1, "덤프", 2),
+        equipment(DAY1, "덤프", 1, team_id=TEAM_B),
+        equipment(DAY2, "6w", 4),
+    ])
+
+    response = client.get("/reports/monthly", params={"month": "2025-03"})
+    assert response.status_code == 200, response.text
+    report = response.json()
+    assert report["workers"] == [
+        {"team_id": TEAM_A, "worker_name": "김철수", "sites": [
+            {"site_name": "동탄 물류센터", "work_days": 2, "total_hours": 1.5},
+            {"site_name": "판교 오피스텔", "work_days": 1, "total_hours": 1.0},
+        ]},
+        {"team_id": TEAM_B, "worker_name": "김철수", "sites": [
+            {"site_name": "동탄 물류센터", "work_days": 1, "total_hours": 1.5},
+        ]},
+    ]
+    assert report["equipment"] == [
+        {"equipment_type": "6w", "total_quantity": 4},
+        {"equipment_type": "덤프", "total_quantity": 3},
+    ]
+
+    team_report = client.get("/reports/monthly", params={"month": "2025-03", "team_id": TEAM_B}).json()
+    assert [worker["team_id"] for worker in team_report["workers"]] == [TEAM_B]
+    assert team_report["equipment"] == [{"equipment_type": "덤프", "total_quantity": 1}]
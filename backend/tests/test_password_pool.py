@@ -0,0 +1,47 @@
+"""
+PasswordHashPool 통계 테스트
+해시가 실패하거나 프로세스 풀을 만들지 못해도 대기 수(pending)가 원래대로 돌아오고,
+완료 수/평균 시간에는 성공한 해시만 들어가는지 확인합니다.
+"""
+
+import asyncio
+
+import pytest
+
+from app.security import PasswordHashPool
+
+
+def square(value):
+    return value * value
+
+
+def fail(value):
+    raise ValueError("bad hash input")
+
+
+@pytest.fixture
+def pool():
+    pool = PasswordHashPool(workers=1, max_pending=4)
+    yield pool
+    pool.shutdown()
+
+
+def test_failed_hash_counts_as_failure(pool):
+    assert asyncio.run(pool.run(square, 3)) == 9
+    with pytest.raises(ValueError):
+        asyncio.run(pool.run(fail, 3))
+
+    stats = pool.stats()
+    assert (stats["pending"], stats["completed"], stats["failed"]) == (0, 1, 1)
+
+
+def test_executor_creation_failure_releases_pending(pool, monkeypatch):
+    def broken_executor():
+        raise OSError("cannot start worker process")
+
+    monkeypatch.setattr(pool, "_get_executor", broken_executor)
+    with pytest.raises(OSError):
+        asyncio.run(pool.run(square, 3))
+
+    stats = pool.stats()
+    assert (stats["pending"], stats["completed"], stats["failed"]) == (0, 0, 1)
@@ -0,0 +1,36 @@
+"""
+읽기 캐시 무효화 테스트
+SQLite 버전 저장소를 공유하는 다른 프로세스(워커, python -m app.bootstrap)가 버전을 올리면
+이 프로세스의 캐시 항목도 다시 읽히는지 확인합니다.
+"""
+
+from app import bootstrap, read_cache as read_cache_module
+from app.read_cache import NAMESPACES, ReadCache, SQLiteVersionStore
+
+
+def shared_caches(path):
+    """Two caches over one version file, as in two worker processes"""
+    return ReadCache(SQLiteVersionStore(path), maxsize=16), ReadCache(SQLiteVersionStore(path), maxsize=16)
+
+
+def test_invalidation_in_another_process_reloads(tmp_path):
+    worker, other_worker = shared_caches(str(tmp_path / "versions.db"))
+    assert worker.get_or_load("teams", "*", lambda: ["team-a"]) == ["team-a"]
+    assert worker.get_or_load("teams", "*", lambda: ["stale"]) == ["team-a"]
+
+    other_worker.invalidate("teams")
+    assert worker.get_or_load("teams", "*", lambda: ["team-a", "team-b"]) == ["team-a", "team-b"]
+
+
+def test_migrate_invalidates_cached_lists(tmp_path, monkeypatch):
+    worker, migrate_process = shared_caches(str(tmp_path / "versions.db"))
+    for namespace in NAMESPACES:
+        worker.get_or_load(namespace, "*", lambda: "before")
+
+    monkeypatch.setattr(read_cache_module, "read_cache", migrate_process)
+    monkeypatch.setattr(bootstrap, "current_version", lambda: 0)
+    monkeypatch.setattr(bootstrap, "upgrade", lambda: 1)
+    bootstrap.migrate()
+
+    for namespace in NAMESPACES:
+        assert worker.get_or_load(namespace, "*", lambda: "after") == "after"
@@ -332,6 +332,24 @@ export const addWorkRecord = async (
   return convertWorkRecord(response);
 };
 
+// 하루치 공수 기록을 한 번의 요청으로 저장 (단일 트랜잭션)
+export const addWorkRecords = async (
+  records: Omit<WorkRecord, 'id' | 'createdAt' | 'updatedAt'>[]
+): Promise<WorkRecord[]> => {
+  const requestBody = records.map(record => ({
+    worker_id: record.workerId,
+    worker_name: record.workerName,
+    site_name: record.siteName,
+    work_date: record.workDate,
+    work_hours: record.workHours,
+    notes: record.notes || null,
+    team_id: record.teamId,
+    created_by: record.createdBy
+  }));
+  const response = await apiCall('/work-records/bulk', 'POST', requestBody);
+  return response.map(convertWorkRecord);
+};
+
 export const updateWorkRecord = async (
   id: string,
   updates: Partial<WorkRecord>
@@ -390,22 +408,11 @@ export const getLastWorkRecord = async (teamId: string): Promise<WorkRecord | nu
 
 export const getLastWorkRecords = async (teamId?: string): Promise<WorkRecord[]> => {
   try {
-    const records = await getWorkRecords(teamId);
-    if (records.length === 0) return [];
-    
-    // 날짜별로 정렬하여 최근 날짜 찾기
-    const sorted = records.sort(
-      (a, b) =>
-        new Date(b.workDate).getTime() - new Date(a.workDate).getTime()
-    );
-    
-    if (sorted.length === 0) return [];
-    
-    // 최근 날짜
-    const lastDate = sorted[0].workDate;
-    
-    // 같은 날짜의 모든 레코드 반환
-    return sorted.filter(r => r.workDate === lastDate);
+    // 가장 최근 작업일의 기록만 백엔드에서 조회 (MAX(work_date))
+    const records = teamId
+      ? await apiCall(`/work-records/latest?team_id=${teamId}`)
+      : await apiCall('/work-records/latest');
+    return records.map(convertWorkRecord);
   } catch (error) {
     console.error('Error fetching last work records:', error);
     return [];
@@ -449,6 +456,21 @@ export const addEquipmentRecord = async (
   return convertEquipmentRecord(response);
 };
 
+// 하루치 장비 기록을 한 번의 요청으로 저장 (기존 기록이 있으면 백엔드에서 수량 합산)
+export const addEquipmentRecords = async (
+  records: Omit<EquipmentRecord, 'id' | 'createdAt' | 'updatedAt'>[]
+): Promise<EquipmentRecord[]> => {
+  const requestBody = records.map(record => ({
+    work_date: record.workDate,
+    equipment_type: record.equipmentType,
+    quantity: record.quantity,
+    team_id: record.teamId,
+    created_by: record.createdBy
+  }));
+  const response = await apiCall('/equipment-records/bulk', 'POST', requestBody);
+  return response.map(convertEquipmentRecord);
+};
+
 export const updateEquipmentRecord = async (
   id: string,
   updates: Partial<EquipmentRecord>
@@ -498,16 +520,82 @@ export const getLastEquipmentRecords = async (
   teamId?: string
 ): Promise<EquipmentRecord[]> => {
   try {
-    const records = await getEquipmentRecords(teamId);
-    if (records.length === 0) return [];
-    const sorted = records.sort(
-      (a, b) =>
-        new Date(b.workDate).getTime() - new Date(a.workDate).getTime()
-    );
-    const lastDate = sorted[0].workDate;
-    return sorted.filter(r => r.workDate === lastDate);
+    // 가장 최근 작업일의 기록만 백엔드에서 조회 (MAX(work_date))
+    const records = teamId
+      ? await apiCall(`/equipment-records/latest?team_id=${teamId}`)
+      : await apiCall('/equipment-records/latest');
+    return records.map(convertEquipmentRecord);
   } catch (error) {
     console.error('Error fetching last equipment records:', error);
     return [];
   }
-};
\ No newline at end of file
+};
+
+// Report operations
+export interface MonthlyReportData {
+  month: string;
+  teamId: string | null;
+  workers: {
+    teamId: string;
+    workerName: string;
+    sites: { siteName: string; workDays: number; totalHours: number }[];
+  }[];
+  equipment: { equipmentType: string; totalQuantity: number }[];
+}
+
+// 월별 집계는 백엔드에서 GROUP BY로 계산하여 전달 (전체 기록을 내려받지 않음)
+export const getMonthlyReport = async (
+  month: string,
+  teamId?: string
+): Promise<MonthlyReportData> => {
+  const params = new URLSearchParams({ month });
+  if (teamId) {
+    params.append('team_id', teamId);
+  }
+  const report = await apiCall(`/reports/monthly?${params.toString()}`);
+  return {
+    month: report.month,
+    teamId: report.team_id,
+    workers: report.workers.map((worker: any) => ({
+      teamId: worker.team_id,
+      workerName: worker.worker_name,
+      sites: worker.sites.map((site: any) => ({
+        siteName: site.site_name || '',
+        workDays: site.work_days,
+        totalHours: site.total_hours
+      }))
+    })),
+    equipment: report.equipment.map((equipment: any) => ({
+      equipmentType: equipment.equipment_type,
+      totalQuantity: equipment.total_quantity
+    }))
+  };
+};
+
+// 월별 급여 정산용 엑셀 파일 다운로드 (팀별 시트, 관리자가 팀을 지정하지 않으면 전체 팀)
+export const downloadMonthlyWorkbook = async (month: string, teamId?: string): Promise<void> => {
+  const token = localStorage.getItem(STORAGE_KEYS.ACCESS_TOKEN);
+  if (!token || isTokenExpired(token)) {
+    throw new Error('Token expired. Please login again.');
+  }
+
+  const params = new URLSearchParams({ month });
+  if (teamId) {
+    params.append('team_id', teamId);
+  }
+  const response = await fetch(`${getApiUrlValue()}/reports/monthly/xlsx?${params.toString()}`, {
+    headers: { Authorization: `Bearer ${token}` },
+  });
+  if (!response.ok) {
+    throw new Error(`Failed to download workbook: ${response.status}`);
+  }
+
+  const url = URL.createObjectURL(await response.blob());
+  const link = document.createElement('a');
+  link.href = url;
+  link.download = `monthly-report-${month}.xlsx`;
+  document.body.appendChild(link);
+  link.click();
+  link.remove();
+  URL.revokeObjectURL(url);
+};
@@ -5,9 +5,8 @@ import { Button } from '@/components/ui/button';
 import { Input } from '@/components/ui/input';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@/components/ui/select';
-import { ArrowLeft } from 'lucide-react';
-import { getWorkRecords, getEquipmentRecords, getTeams } from '@/lib/storage';
-import { WorkRecord, EquipmentRecord } from '@/types';
+import { ArrowLeft, Download } from 'lucide-react';
+import { downloadMonthlyWorkbook, getMonthlyReport, getTeams } from '@/lib/storage';
 
 interface WorkerSummary {
   workerName: string;
@@ -33,6 +32,7 @@ export default function MonthlyReport() {
   const [equipmentSummaries, setEquipmentSummaries] = useState<EquipmentSummary[]>([]);
   const [teams, setTeams] = useState<any[]>([]);
   const [isLoading, setIsLoading] = useState(false);
+  const [isDownloading, setIsDownloading] = useState(false);
 
   useEffect(() => {
     if (!user?.teamId && !isAdmin) {
@@ -80,8 +80,8 @@ export default function MonthlyReport() {
         return;
       }
 
-      const allRecords = await getWorkRecords(teamId);
-      const allEquipment = await getEquipmentRecords(teamId);
+      // 월별 집계는 서버에서 계산 (작업자/현장별 공수, 장비 타입별 수량)
+      const report = await getMonthlyReport(selectedMonth, teamId);
       // 팀명 찾기: teams 배열에서 찾거나, user의 teamName 사용
       const actualTeamId = isAdmin ? selectedTeamId : user?.teamId;
       let teamName = teams.find(t => t.id === actualTeamId)?.name || '';
@@ -89,52 +89,12 @@ export default function MonthlyReport() {
         teamName = user.teamName;
       }
 
-      // Filter by selected month - add null check for workDate
-      const monthRecords = allRecords.filter(r => r.workDate && r.workDate.startsWith(selectedMonth));
-      const monthEquipment = allEquipment.filter(r => r.workDate && r.workDate.startsWith(selectedMonth));
-
-      // Group work records by worker and site
-      const workerMap = new Map<string, WorkerSummary>();
-      monthRecords.forEach(record => {
-        if (!workerMap.has(record.workerName)) {
-          workerMap.set(record.workerName, {
-            workerName: record.workerName,
-            teamName,
-            sites: [],
-          });
-        }
-
-        const worker = workerMap.get(record.workerName)!;
-        const existingSite = worker.sites.find(s => s.siteName === record.siteName);
-
-        if (existingSite) {
-          existingSite.workDays += 1;
-          existingSite.totalHours += record.workHours;
-        } else {
-          worker.sites.push({
-            siteName: record.siteName,
-            workDays: 1,
-            totalHours: record.workHours,
-          });
-        }
-      });
-
-      // Group equipment by type (장비 기록에는 현장명이 없으므로 타입별로만 합산)
-      const equipmentMap = new Map<string, EquipmentSummary>();
-      monthEquipment.forEach(record => {
-        if (!equipmentMap.has(record.equipmentType)) {
-          equipmentMap.set(record.equipmentType, {
-            equipmentType: record.equipmentType,
-            totalQuantity: 0,
-          });
-        }
-
-        const equipment = equipmentMap.get(record.equipmentType)!;
-        equipment.totalQuantity += record.quantity;
-      });
-
-      setWorkerSummaries(Array.from(workerMap.values()));
-      setEquipmentSummaries(Array.from(equipmentMap.values()));
+      setWorkerSummaries(report.workers.map(worker => ({
+        workerName: worker.workerName,
+        teamName,
+        sites: worker.sites,
+      })));
+      setEquipmentSummaries(report.equipment);
     } catch (error) {
       console.error('Error loading monthly data:', error);
     } finally {
@@ -142,6 +102,18 @@ export default function MonthlyReport() {
     }
   };
 
+  const handleDownload = async () => {
+    setIsDownloading(true);
+    try {
+      // 관리자가 팀을 선택하지 않으면 전체 팀을 팀별 시트로 다운로드
+      await downloadMonthlyWorkbook(selectedMonth, isAdmin ? selectedTeamId || undefined : user?.teamId);
+    } catch (error) {
+      console.error('Error downloading monthly workbook:', error);
+    } finally {
+      setIsDownloading(false);
+    }
+  };
+
   return (
     <div className="min-h-screen bg-gradient-to-br from-gray-50 to-blue-50 overflow-x-hidden w-full max-w-full">
       <div className="container mx-auto max-w-6xl px-2 sm:px-4 md:px-6 py-3 sm:py-6 w-full">
@@ -176,6 +148,15 @@ export default function MonthlyReport() {
               onChange={(e) => setSelectedMonth(e.target.value)}
               className="w-full sm:w-[180px]"
             />
+            <Button
+              variant="outline"
+              onClick={handleDownload}
+              disabled={isDownloading}
+              className="w-full sm:w-auto"
+            >
+              <Download className="mr-2 h-4 w-4" />
+              {isDownloading ? '다운로드 중...' : '엑셀 다운로드'}
+            </Button>
           </div>
         </div>
 
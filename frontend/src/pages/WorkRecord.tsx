@@ -11,9 +11,10 @@ import {
   deleteWorkRecord,
   deleteEquipmentRecord,
   getTeams,
-  addWorkRecord,
+  addWorkRecords,
   updateWorkRecord,
   addEquipmentRecord,
+  addEquipmentRecords,
   updateEquipmentRecord,
 } from '@/lib/storage';
 import { WorkRecord, EquipmentRecord } from '@/types';
@@ -167,37 +168,16 @@ export default function WorkRecordPage() {
         toast.success('공수 기록이 수정되었습니다');
       } else {
         // 추가 모드: 여러 레코드 추가
-        // 작업자 기록이 있으면 추가
+        // 작업자 기록이 있으면 한 번의 요청으로 추가
         if (records.length > 0) {
-          for (const record of records) {
-            console.log('Adding work record with teamId:', teamId, 'record:', record);
-            await addWorkRecord({ ...record, teamId, createdBy, notes });
-          }
+          console.log('Adding work records with teamId:', teamId, 'count:', records.length);
+          await addWorkRecords(records.map(record => ({ ...record, teamId, createdBy, notes })));
         }
         
-        // 장비 레코드 추가 (기존 기록이 있으면 합산, 없으면 추가)
+        // 장비 레코드 추가 (기존 기록이 있으면 백엔드에서 같은 날짜/장비 타입/팀 기준으로 합산)
         if (equipmentData.length > 0) {
-          for (const equipment of equipmentData) {
-            // 기존 기록이 있는지 확인 (같은 날짜, 같은 장비 타입, 같은 팀)
-            const existingRecord = equipmentRecords.find(
-              r => r.equipmentType === equipment.equipmentType && 
-                   r.workDate === equipment.workDate &&
-                   r.teamId === teamId
-            );
-
-            if (existingRecord && existingRecord.id) {
-              // 기존 기록이 있으면 수량을 합산하여 업데이트
-              const newQuantity = existingRecord.quantity + equipment.quantity;
-              console.log('Updating existing equipment record:', existingRecord.id, 'new quantity:', newQuantity);
-              await updateEquipmentRecord(existingRecord.id, {
-                quantity: newQuantity
-              });
-            } else {
-              // 기존 기록이 없으면 추가 (백엔드에서도 합산 로직이 있지만, 프론트엔드에서도 확인)
-              console.log('Adding equipment record with teamId:', teamId, 'equipment:', equipment);
-              await addEquipmentRecord({ ...equipment, teamId, createdBy });
-            }
-          }
+          console.log('Adding equipment records with teamId:', teamId, 'count:', equipmentData.length);
+          await addEquipmentRecords(equipmentData.map(equipment => ({ ...equipment, teamId, createdBy })));
         }
         
         // 성공 메시지